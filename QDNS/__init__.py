@@ -13,6 +13,9 @@ from QDNS.backend.tools.config import (
     QISKIT_BACKEND,
     STIM_BACKEND,
     SDQS_BACKEND,
+    DENSITY_MATRIX_BACKEND,
+    MPS_BACKEND,
+    HYBRID_BACKEND,
     supported_backends,
     avaible_backends
 )
@@ -31,6 +34,9 @@ from QDNS.backend.tools.noise import (
 )
 
 from QDNS.backend.cirq_backend import change_cirq_simulator
+from QDNS.backend.density_backend import state_fidelity
+from QDNS.backend.mps_backend import change_mps_bond_dimension
+from QDNS.backend.stim_backend import change_stim_circuit_accumulation
 from QDNS.backend.qiskit_backend import change_qiskit_simulator
 
 # FROM Commands
@@ -144,6 +150,14 @@ from QDNS.rtg_apps.routing import (
 from QDNS.simulation.controller import MinerController
 from QDNS.simulation.kernel import Kernel as Simulator
 from QDNS.simulation.miner import Process
+from QDNS.simulation.results import ShotSamples
+from QDNS.simulation.scheduler import (
+    CONTROL_CLASS,
+    ROUTING_CLASS,
+    QUANTUM_CLASS,
+    priority_classes,
+    default_priority_weights
+)
 from QDNS.simulation.tools import (
     core_count,
     thread_count,
@@ -152,6 +166,9 @@ from QDNS.simulation.tools import (
     MinerControllerSettings,
     default_controller_settings,
     change_deafault_miner_controller_settings,
+    KernelSettings,
+    default_kernel_settings,
+    change_default_kernel_settings,
     SimulationResults
 )
 
@@ -195,6 +212,12 @@ from QDNS.tools.module import (
 )
 
 from QDNS.tools.queue_manager import QueueManager
+from QDNS.tools.simulation_clock import (
+    REAL_TIME_MODE,
+    VIRTUAL_TIME_MODE,
+    time_modes,
+    SimulationClock
+)
 from QDNS.tools.state_handler import GENERAL_STATE_FLAGS
 from QDNS.tools.state_handler import StateHandler
 from QDNS.tools.various_tools import (
@@ -1 +1 @@
-__all__ = ["backend_wrapper", "cirq_backend", "qiskit_backend", "sdqs_backend", "stim_backend", "tools"]
+__all__ = ["backend_wrapper", "cirq_backend", "density_backend", "hybrid_backend", "mps_backend", "qiskit_backend", "sdqs_backend", "stim_backend", "tools"]
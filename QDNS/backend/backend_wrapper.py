@@ -28,7 +28,12 @@ import logging
 import time
 from typing import List, Sequence, Tuple, Optional
 
+import numpy as np
+
 from QDNS.backend.cirq_backend import CirqBackend
+from QDNS.backend.density_backend import DensityMatrixBackend
+from QDNS.backend.hybrid_backend import HybridBackend
+from QDNS.backend.mps_backend import MatrixProductStateBackend
 from QDNS.backend.qiskit_backend import QiskitBackend
 from QDNS.backend.sdqs_backend import SdqsBackend
 from QDNS.backend.stim_backend import StimBackend
@@ -36,6 +41,7 @@ from QDNS.backend.tools import config
 from QDNS.backend.tools import noise
 from QDNS.backend.tools.backend import Backend
 from QDNS.simulation.tools import kernel_layer_label
+from QDNS.tools import gates
 from QDNS.tools.layer import ID_SIMULATION
 from QDNS.tools.module import Module
 from QDNS.tools.module import ModuleSettings
@@ -45,6 +51,9 @@ backend_flag_to_object = {
     config.CIRQ_BACKEND: CirqBackend,
     config.STIM_BACKEND: StimBackend,
     config.SDQS_BACKEND: SdqsBackend,
+    config.DENSITY_MATRIX_BACKEND: DensityMatrixBackend,
+    config.MPS_BACKEND: MatrixProductStateBackend,
+    config.HYBRID_BACKEND: HybridBackend,
     config.QISKIT_BACKEND: QiskitBackend
 }
 
@@ -60,6 +69,7 @@ class BackendWrapper(Module):
         """
 
         self._backend_object: Optional[Backend] = None
+        self._entanglement_groups = False
 
         ms = ModuleSettings(
             can_disable=False, can_removalbe=False,
@@ -73,12 +83,22 @@ class BackendWrapper(Module):
             module_settings=ms
         )
 
-    def start_module(self, configuration: config.BackendConfiguration, noise_pattern: noise.NoisePattern):
+    def start_module(self, configuration: config.BackendConfiguration, noise_pattern: noise.NoisePattern, entanglement_groups: bool = False):
         """
         Prepares and starts the backend.
 
+        Args:
+            configuration: Backend configuration.
+            noise_pattern: Noise pattern.
+            entanglement_groups: Allocates qubits as single qubit states, backends merge them on multi qubit gates.
+
+        Notes:
+            Stim and hybrid backends keep all qubits in one tableau, so this option has no effect on them.
+            Other backends allocate 1 qubit chunks.
+
         Raises:
-            AttributeError: When given backend is not found.
+            AttributeError: When given backend is not found, backend can not merge states of qubits or
+                frame configuration has no 1 qubit chunks for entanglement groups.
         """
 
         # Disable some logging for time being.
@@ -93,10 +113,35 @@ class BackendWrapper(Module):
         if configuration.backend not in config.avaible_backends:
             raise AttributeError("Backend {} is not avaible in system.")
 
+        # Qiskit can not apply gates between chunks, so states of single qubits never merge.
+        if entanglement_groups and configuration.backend == config.QISKIT_BACKEND:
+            raise AttributeError("Backend {} can not track entanglement groups.".format(configuration.backend))
+
+        # Cirq slaves cannot apply gates between processes, but single qubits are spread over all of them.
+        if entanglement_groups and configuration.backend == config.CIRQ_BACKEND and configuration.process_count > 1:
+            raise AttributeError("Backend {} can track entanglement groups only with 1 process, not {}.".format(
+                configuration.backend, configuration.process_count)
+            )
+
+        # Chunked backends allocate every qubit of entanglement groups from 1 qubit chunks.
+        if entanglement_groups and configuration.backend not in (config.STIM_BACKEND, config.HYBRID_BACKEND):
+            for dimension, frames in configuration.frame_config.items():
+                try:
+                    single_count = frames[1]
+                except KeyError:
+                    single_count = 0
+
+                if single_count < 1:
+                    raise AttributeError(
+                        "Entanglement groups need 1 qubit chunks but frame configuration of dimension {} has none. "
+                        "Add {{1: count}} to it.".format(dimension)
+                    )
+
         # Prepare backend object.
         self._backend_object = backend_flag_to_object[configuration.backend](
             configuration, noise_pattern
         )
+        self._entanglement_groups = entanglement_groups
 
         # Open logging.
         logging.disable(logging.NOTSET)
@@ -108,8 +153,25 @@ class BackendWrapper(Module):
 
         self._backend_object.terminate_backend()
         self._logger.info("Terminate backend -> {}.".format(self._backend_object.configuration.backend))
+        self._backend_object = None
+        self._entanglement_groups = False
+
+    def reset_backend(self):
+        """ Resets backend for next simulation without restarting it. """
+
+        start_time = time.time()
+        self._backend_object.reset_backend()
+        self._logger.clear_logs()
+        self._logger.info("Reset backend -> {} in ~{} sec.".format(
+            self._backend_object.configuration.backend, round(time.time() - start_time, 4))
+        )
+
+    def is_backend_started(self) -> bool:
+        """ Returns true if a backend is started. """
+
+        return self._backend_object is not None
 
-    def allocate_qubits(self, count: int, *args) -> List[str]:
+    def allocate_qubits(self, count: int, *args) -> np.ndarray:
         """
         Allocates qubit on backend.
 
@@ -118,14 +180,18 @@ class BackendWrapper(Module):
             args: Backend specific arguments.
 
         Return:
-            List[Qubit ID].
+            Array[Qubit ID].
         """
 
-        to_return = self._backend_object.allocate_qubits(count, *args)
+        if self._entanglement_groups:
+            to_return = self.__allocate_single_qubits(count, 1, *args)[0]
+        else:
+            to_return = self._backend_object.allocate_qubits(count, *args)
+        to_return = np.asarray(to_return, dtype=np.int64)
         self._logger.debug("Allocate Qubits ({}) -> [{} ... {}]".format(to_return.__len__(), to_return[0], to_return[-1]))
         return to_return
 
-    def allocate_qframes(self, frame_size: int, frame_count: int, *args) -> List[List[str]]:
+    def allocate_qframes(self, frame_size: int, frame_count: int, *args) -> np.ndarray:
         """
         Allocates qframe on backend.
 
@@ -135,16 +201,20 @@ class BackendWrapper(Module):
             args: Backend specific arguments.
 
         Return:
-            List[List[Qubit ID]].
+            Array[Frame, Qubit ID].
         """
 
-        to_return = self._backend_object.allocate_qframes(frame_size, frame_count, *args)
+        if self._entanglement_groups:
+            to_return = self.__allocate_single_qubits(frame_size, frame_count, *args)
+        else:
+            to_return = self._backend_object.allocate_qframes(frame_size, frame_count, *args)
+        to_return = np.asarray(to_return, dtype=np.int64)
         self._logger.debug("Allocate Frames ({}x{}) -> [{} ... {}]".format(
             to_return.__len__(), to_return[0].__len__(), to_return[0][0], to_return[-1][-1])
         )
         return to_return
 
-    def deallocate_qubits(self, qubits: Sequence[str]) -> bool:
+    def deallocate_qubits(self, qubits: Sequence[int]) -> bool:
         """
         Deallocates qframes from backend.
 
@@ -162,7 +232,7 @@ class BackendWrapper(Module):
         self._logger.debug("Deallocate qubits ({}) -> [{} ... {}]".format(qubits.__len__(), qubits[0], qubits[-1]))
         return True
 
-    def apply_transformation(self, gate_id: int, gate_arguments: Tuple, qubits: Sequence[str], *args):
+    def apply_transformation(self, gate_id: int, gate_arguments: Tuple, qubits: Sequence[int], *args):
         """
         Apply transformation on qubits.
 
@@ -175,7 +245,7 @@ class BackendWrapper(Module):
         self._backend_object.apply_transformation(gate_id, gate_arguments, qubits, *args)
         self._logger.debug("Apply gate of id {} to qubits ({}) -> {} ... {}.".format(gate_id, qubits.__len__(), qubits[0], qubits[-1]))
 
-    def measure_qubits(self, qubits: Sequence[str], *args) -> List[int]:
+    def measure_qubits(self, qubits: Sequence[int], *args) -> List[int]:
         """
         Measures qubit.
 
@@ -195,7 +265,7 @@ class BackendWrapper(Module):
         )
         return results
 
-    def reset_qubits(self, qubits: Sequence[str]):
+    def reset_qubits(self, qubits: Sequence[int]):
         """
         Reset Qubits.
 
@@ -206,7 +276,7 @@ class BackendWrapper(Module):
         self._backend_object.reset_qubits(qubits)
         self._logger.debug("Reset qubits ({}) -> {} ... {}.".format(qubits.__len__(), qubits[0], qubits[-1]))
 
-    def generate_ghz_pair(self, size: int, count: int) -> List[List[str]]:
+    def generate_ghz_pair(self, size: int, count: int) -> np.ndarray:
         """
         Generates ghz pair.
 
@@ -215,16 +285,26 @@ class BackendWrapper(Module):
             count: Count of pairs.
 
         Return:
-            List[List[Qubit ID]].
+            Array[Frame, Qubit ID].
         """
 
-        to_return = self._backend_object.generate_ghz_pair(size, count)
+        if self._entanglement_groups:
+            to_return = self.__allocate_single_qubits(size, count)
+            list_of_gates = list()
+            for pair in to_return:
+                list_of_gates.append([gates.HGate.gate_id, (), (pair[0],)])
+                for j in range(size - 1):
+                    list_of_gates.append([gates.CXGate.gate_id, (), (pair[j], pair[j + 1])])
+            self._backend_object.apply_serial_transformations(list_of_gates)
+        else:
+            to_return = self._backend_object.generate_ghz_pair(size, count)
+        to_return = np.asarray(to_return, dtype=np.int64)
         self._logger.debug("Generate GHZ Pairs ({}x{}) -> [{} ... {}]".format(
             to_return.__len__(), to_return[0].__len__(), to_return[0][0], to_return[-1][-1])
         )
         return to_return
 
-    def process_channel_error(self, qubits: Sequence[str], percent: float):
+    def process_channel_error(self, qubits: Sequence[int], percent: float):
         """
         Process channel errors.
 
@@ -248,7 +328,92 @@ class BackendWrapper(Module):
         self._backend_object.apply_serial_transformations(list_of_gates, *args)
         self._logger.debug("Applied serial {} gates.".format(list_of_gates.__len__()))
 
+    def density_matrix(self, qubits: Sequence[int]):
+        """
+        Density matrix of qubits.
+
+        Args:
+            qubits: Selected qubits.
+
+        Return:
+            Density matrix.
+
+        Raises:
+            AttributeError: If backend does not keep density matrices.
+        """
+
+        if not isinstance(self._backend_object, DensityMatrixBackend):
+            raise AttributeError("Only density matrix backend can give density matrix of qubits.")
+
+        matrix = self._backend_object.density_matrix(qubits)
+        self._logger.debug("Density matrix of qubits ({}) -> {} ... {}.".format(qubits.__len__(), qubits[0], qubits[-1]))
+        return matrix
+
+    def start_recording(self):
+        """
+        Starts to record operations of backend as a circuit.
+
+        Raises:
+            AttributeError: If backend can not record its operations.
+        """
+
+        if not isinstance(self._backend_object, StimBackend):
+            raise AttributeError("Only stim backend can record its operations.")
+
+        self._backend_object.start_recording()
+        self._logger.info("Recording backend operations.")
+
+    def stop_recording(self):
+        """
+        Stops recording of backend operations.
+
+        Returns:
+            Recorded circuit.
+
+        Raises:
+            AttributeError: If backend can not record its operations.
+        """
+
+        if not isinstance(self._backend_object, StimBackend):
+            raise AttributeError("Only stim backend can record its operations.")
+
+        circuit = self._backend_object.stop_recording()
+        self._logger.info("Recorded {} operations with {} measurements.".format(circuit.__len__(), circuit.num_measurements))
+        return circuit
+
+    def __allocate_single_qubits(self, frame_size: int, frame_count: int, *args) -> List[List[int]]:
+        """
+        Allocates qubits as single qubit states and puts them into frames.
+
+        Args:
+            frame_size: Frame size.
+            frame_count: Frame count.
+            args: Backend specific arguments.
+
+        Return:
+            List[List[Qubit ID]].
+        """
+
+        qubits = [frame[0] for frame in self._backend_object.allocate_qframes(1, frame_size * frame_count, *args)]
+        return [qubits[i * frame_size: (i + 1) * frame_size] for i in range(frame_count)]
+
     def get_logs(self) -> str:
         """ Yileds the logs in the logger. """
 
         return self._logger.logs
+
+    @property
+    def entanglement_groups(self) -> bool:
+        return self._entanglement_groups
+
+    @property
+    def configuration(self) -> Optional[config.BackendConfiguration]:
+        if self._backend_object is None:
+            return None
+        return self._backend_object.configuration
+
+    @property
+    def noise_pattern(self) -> Optional[noise.NoisePattern]:
+        if self._backend_object is None:
+            return None
+        return self._backend_object.noise_pattern
@@ -26,8 +26,8 @@
 
 import multiprocessing
 import os
-from copy import deepcopy, copy
-from typing import List, Dict
+from copy import deepcopy
+from typing import List, Dict, Optional
 from typing import Union, Type, Sequence, Tuple
 
 import numpy as np
@@ -35,9 +35,10 @@ import numpy as np
 from QDNS.backend.tools import config
 from QDNS.backend.tools import noise
 from QDNS.backend.tools.backend import Backend
+from QDNS.backend.tools.state_vector import sample_qubits
 from QDNS.backend.tools.virt_qubit import VirtQudit
 from QDNS.tools import gates
-from QDNS.tools.various_tools import tensordot, dev_mode
+from QDNS.tools.various_tools import dev_mode
 
 # Check if cirq avaible.
 try:
@@ -85,6 +86,7 @@ class ProcessMessages:
         RESET_QUBITS = ("reset qubits operation message", False)
         APPLY_SERIAL_GATE = ("apply serial gate operation message", False)
         APPLY_CHANNEL_ERROR = ("apply channel error operation message", False)
+        RESET_BACKEND = ("reset backend operation message", True)
 
     class Respond:
         """
@@ -101,6 +103,7 @@ class ProcessMessages:
         RESET_QUBIT_DONE = "reset qubits operation done"
         APPLY_SERIAL_GATE_DONE = "apply serial gate operation done"
         APPLY_CHANNEL_ERROR_DONE = "apply channel error operation done"
+        RESET_BACKEND_DONE = "reset backend operation done"
 
 
 lock = multiprocessing.Lock()
@@ -122,6 +125,7 @@ class Id(cirq.SingleQubitGate):
     def __init__(self, dimension):
         super(Id, self)
         self.dimension = dimension
+        self._matrix = np.eye(self.dimension, dtype=complex)
 
     def _qid_shape_(self):
         return self.dimension,
@@ -130,10 +134,7 @@ class Id(cirq.SingleQubitGate):
         return 1
 
     def _unitary_(self):
-        zero = np.zeros(shape=(self.dimension, self.dimension), dtype=complex)
-        for i in range(self.dimension):
-            zero[i][i] = complex(1, 0)
-        return zero
+        return self._matrix
 
     def _circuit_diagram_info_(self, args):
         self.args = args
@@ -151,6 +152,11 @@ class PlusOneGate(cirq.SingleQubitGate):
         super(PlusOneGate, self)
         self.dimension = dimension
 
+        if self.dimension == 2:
+            self._matrix = np.array([[0, 1], [1, 0]], dtype=complex)
+        else:
+            self._matrix = np.roll(np.eye(self.dimension, dtype=complex), 1, axis=0)
+
     def _qid_shape_(self):
         return self.dimension,
 
@@ -158,14 +164,7 @@ class PlusOneGate(cirq.SingleQubitGate):
         return 1
 
     def _unitary_(self) -> np.ndarray:
-        if self.dimension == 2:
-            return np.array([[0, 1], [1, 0]], dtype=complex)
-
-        zero = np.zeros(shape=(self.dimension, self.dimension), dtype=complex)
-        zero[0][self.dimension - 1] = 1
-        for i in range(1, self.dimension):
-            zero[i][i - 1] = complex(1, 0)
-        return zero
+        return self._matrix
 
     def _circuit_diagram_info_(self, args) -> str:
         self.args = args
@@ -179,9 +178,18 @@ class PlusOneGate(cirq.SingleQubitGate):
 class PlusXGate(cirq.SingleQubitGate):
     """ Plus X Gate """
 
-    def __init__(self, dimension):
+    def __init__(self, dimension, shift: Optional[int] = None):
+        """
+        Plus X Gate.
+
+        Args:
+            dimension: Qudit dimension.
+            shift: Applies plus one gate shift + 1 times, random for each unitary if None.
+        """
+
         super(PlusXGate, self)
         self.dimension = dimension
+        self.shift = shift
         self._plus = PlusOneGate(self.dimension).unitary
 
     def _qid_shape_(self):
@@ -194,12 +202,10 @@ class PlusXGate(cirq.SingleQubitGate):
         if self.dimension == 2:
             return np.array([[0, 1], [1, 0]], dtype=complex)
 
-        count = np.random.randint(0, self.dimension - 1)
-        bf = self._plus
-        for i in range(count):
-            bf = bf.dot(PlusOneGate(self.dimension).unitary)
-
-        return bf
+        count = self.shift
+        if count is None:
+            count = np.random.randint(0, self.dimension - 1)
+        return np.linalg.matrix_power(self._plus, count + 1)
 
     def _circuit_diagram_info_(self, args) -> str:
         self.args = args
@@ -217,6 +223,11 @@ class PlusZGate(cirq.SingleQubitGate):
         super(PlusZGate, self)
         self.dimension = dimension
 
+        if self.dimension == 2:
+            self._matrix = np.array([[1, 0], [0, -1]], dtype=complex)
+        else:
+            self._matrix = np.diag([complex(1, 0) if i % 2 == 0 else complex(-1, 0) for i in range(self.dimension)])
+
     def _qid_shape_(self):
         return self.dimension,
 
@@ -224,16 +235,7 @@ class PlusZGate(cirq.SingleQubitGate):
         return 1
 
     def _unitary_(self) -> np.ndarray:
-        if self.dimension == 2:
-            return np.array([[1, 0], [0, -1]], dtype=complex)
-
-        zero = np.zeros(shape=(self.dimension, self.dimension), dtype=complex)
-        for i in range(self.dimension):
-            if i % 2 == 0:
-                zero[i][i] = complex(1, 0)
-            else:
-                zero[i][i] = complex(-1, 0)
-        return zero
+        return self._matrix
 
     def _circuit_diagram_info_(self, args) -> str:
         self.args = args
@@ -247,15 +249,14 @@ class PlusZGate(cirq.SingleQubitGate):
 class BitFlipChannel(cirq.SingleQubitGate):
     """ Bit flip channel """
 
-    def __init__(self, p: float, dim: int) -> None:
+    def __init__(self, p: float, dim: int, shift: Optional[int] = None) -> None:
         self._p = p
         self._dim = dim
-        self._plus = PlusXGate(self._dim).unitary
+        self._plus = PlusXGate(self._dim, shift).unitary
+        self._mixture = tuple(zip([1.0 - self._p, self._p], [Id(self._dim).unitary, self._plus]))
 
     def _mixture_(self):
-        ps = [1.0 - self._p, self._p]
-        ops = [Id(self._dim).unitary, self._plus]
-        return tuple(zip(ps, ops))
+        return self._mixture
 
     def _qid_shape_(self):
         return self._dim,
@@ -282,11 +283,10 @@ class PhaseFlipChannel(cirq.SingleQubitGate):
     def __init__(self, p: float, dim: int) -> None:
         self._p = p
         self._dim = dim
+        self._mixture = tuple(zip([1.0 - self._p, self._p], [Id(self._dim).unitary, PlusZGate(self._dim).unitary]))
 
     def _mixture_(self):
-        ps = [1.0 - self._p, self._p]
-        ops = [Id(self._dim).unitary, PlusZGate(self._dim).unitary]
-        return tuple(zip(ps, ops))
+        return self._mixture
 
     def _qid_shape_(self):
         return self._dim,
@@ -310,15 +310,14 @@ class PhaseFlipChannel(cirq.SingleQubitGate):
 class YFlipChannel(cirq.SingleQubitGate):
     """ Y flip channel or Bit and Phase Flip channel """
 
-    def __init__(self, p: float, dim: int) -> None:
+    def __init__(self, p: float, dim: int, shift: Optional[int] = None) -> None:
         self._p = p
         self._dim = dim
-        self._plus = PlusXGate(self._dim).unitary.dot(PlusZGate(self._dim).unitary)
+        self._plus = PlusXGate(self._dim, shift).unitary.dot(PlusZGate(self._dim).unitary)
+        self._mixture = tuple(zip([1.0 - self._p, self._p], [Id(self._dim).unitary, self._plus]))
 
     def _mixture_(self):
-        ps = [1.0 - self._p, self._p]
-        ops = [Id(self._dim).unitary, self._plus]
-        return tuple(zip(ps, ops))
+        return self._mixture
 
     def _qid_shape_(self):
         return self._dim,
@@ -342,17 +341,19 @@ class YFlipChannel(cirq.SingleQubitGate):
 class DepolarizingChannel(cirq.SingleQubitGate):
     """ Depolarizing channel """
 
-    def __init__(self, p: float, dim: int) -> None:
+    def __init__(self, p: float, dim: int, shift: Optional[int] = None) -> None:
         self._p = p
         self._dim = dim
-        self._plus_x = PlusXGate(self._dim).unitary
+        self._plus_x = PlusXGate(self._dim, shift).unitary
         self._plus_z = PlusZGate(self._dim).unitary
         self._plus_y = self._plus_x.dot(self._plus_z)
+        self._mixture = tuple(zip(
+            [1.0 - self._p, self._p / 3, self._p / 3, self._p / 3],
+            [Id(dimension=self._dim).unitary, self._plus_x, self._plus_y, self._plus_z]
+        ))
 
     def _mixture_(self):
-        ps = [1.0 - self._p, self._p / 3, self._p / 3, self._p / 3]
-        ops = [Id(dimension=self._dim).unitary, self._plus_x, self._plus_y, self._plus_z]
-        return tuple(zip(ps, ops))
+        return self._mixture
 
     def _qid_shape_(self):
         return self._dim,
@@ -406,11 +407,10 @@ class NoNoiseChannel(cirq.SingleQubitGate):
         self._p = p
         self._dim = dim
         self._plus = Id(self._dim).unitary
+        self._mixture = tuple(zip([1.0 - self._p, self._p], [Id(self._dim).unitary, self._plus]))
 
     def _mixture_(self):
-        ps = [1.0 - self._p, self._p]
-        ops = [Id(self._dim).unitary, self._plus]
-        return tuple(zip(ps, ops))
+        return self._mixture
 
     def _qid_shape_(self):
         return self._dim,
@@ -462,6 +462,119 @@ def get_channel_gate(flag: str) -> Union[Type[BitFlipChannel], Type[PhaseFlipCha
         raise ValueError("Expected known channel error flag from tools, but {}.".format(flag))
 
 
+# OBJECT CACHES
+
+# Cached gates, channels and qids are shared by circuits of a process, cache stops growing after this size.
+max_cached_objects = 4096
+
+# (Gate ID, gate arguments, dimension, qubit count) to cirq matrix gate.
+gate_cache: Dict[Tuple[int, Tuple, int, int], cirq.Gate] = dict()
+
+# (Channel flag, probability, dimension, shift) to channel gate.
+channel_cache: Dict[Tuple[str, float, int, Optional[int]], cirq.Gate] = dict()
+
+# (Index, dimension) to line qid.
+line_qid_cache: Dict[Tuple[int, int], cirq.LineQid] = dict()
+
+# Channels that shift qudits by a random plus X power, power is choosen when channel is constructed.
+shifting_channels = (noise.bit_flip_channel, noise.bit_and_phase_flip_channel, noise.depolarisation_channel)
+
+
+def get_cirq_gate(gate_id: int, gate_arguments: Sequence, dimension: int, qubit_count: int) -> cirq.Gate:
+    """
+    Gets cirq gate of a gate in tools.gates from cache or builds it.
+
+    Args:
+        gate_id: Gate ID.
+        gate_arguments: Gate constructor args.
+        dimension: Qudit dimension.
+        qubit_count: Qubit count that gate is applied to.
+
+    Returns:
+        Cirq matrix gate.
+
+    Raises:
+        ArithmeticError: If qubit count does not match with gate.
+    """
+
+    try:
+        key = (gate_id, tuple(gate_arguments), dimension, qubit_count)
+        return gate_cache[key]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable gate arguments are not cached.
+        key = None
+
+    gate = gates.gate_id_to_gate[gate_id](*gate_arguments)
+    if gate.qubit_shape != qubit_count:
+        raise ArithmeticError("Qubit count must be match with gate. {} != {}.".format(gate.qubit_shape, qubit_count))
+
+    gate = cirq.MatrixGate(gate.matrix, qid_shape=(dimension,) * qubit_count)
+    if key is not None and gate_cache.__len__() < max_cached_objects:
+        gate_cache[key] = gate
+    return gate
+
+
+def get_channel(flag: str, p: float, dimension: int) -> cirq.Gate:
+    """
+    Gets a channel gate from cache or builds it.
+    Qudit channels with random shifts are cached for each shift and a shift is choosen at each call.
+
+    Args:
+        flag: Channel error flag.
+        p: Probability of channel.
+        dimension: Qudit dimension.
+
+    Returns:
+        Channel gate.
+    """
+
+    shift = None
+    if dimension > 2 and flag in shifting_channels:
+        shift = np.random.randint(0, dimension - 1)
+
+    key = (flag, p, dimension, shift)
+    try:
+        return channel_cache[key]
+    except KeyError:
+        pass
+
+    if shift is None:
+        channel = get_channel_gate(flag)(p, dim=dimension)
+    else:
+        channel = get_channel_gate(flag)(p, dim=dimension, shift=shift)
+
+    if channel_cache.__len__() < max_cached_objects:
+        channel_cache[key] = channel
+    return channel
+
+
+def get_line_qids(indexes: Sequence[int], dimension: int) -> List[cirq.LineQid]:
+    """
+    Gets line qids of indexes from cache or builds them.
+
+    Args:
+        indexes: Qubit indexes in circuit.
+        dimension: Qudit dimension.
+
+    Returns:
+        List[cirq.LineQid].
+    """
+
+    line_qids = list()
+    for index in indexes:
+        key = (int(index), dimension)
+        try:
+            line_qids.append(line_qid_cache[key])
+        except KeyError:
+            line_qid = cirq.LineQid(key[0], dimension=dimension)
+            if line_qid_cache.__len__() < max_cached_objects:
+                line_qid_cache[key] = line_qid
+            line_qids.append(line_qid)
+    return line_qids
+
+
 # QUBIT POINTER
 
 class VirtQudit(VirtQudit):
@@ -469,41 +582,28 @@ class VirtQudit(VirtQudit):
     Virtual qudit template.
 
     #
-    #  [PID]    [CH_IND]      [INDEX]
-    #    |      00   00000      00
-    #    |      /     |         |
-    #    P     DIM   CHUNK      |
-    #    0     00    00000      00
+    #  [PID]   [DIM]   [CHUNK]   [INDEX]
+    #    8       8       24        16     bits
     #
     # Template supports pointing:
-    #   Max 9 Process, 9 dimension, 99999 circuit, 99 qubit in a circuit.
+    #   Max 255 Process, 255 dimension, 2^^24 circuit, 2^^16 qubit in a circuit.
     #
     """
 
-    pid_length = 1
-    dim_length = 2
-    chunk_length = 5
-    qubit_length = 2
+    fields = (("pid", 8), ("dim", 8), ("chunk", 24), ("index", 16))
 
-    @staticmethod
-    def qubit_id_resolver(qubit_id: str):
-        """
-        Qubit ID resolve from string.
-        Returns pid, dim, chunk_id, qubit_id
-        """
+    @classmethod
+    def chunk_key(cls, dim: int, chunk_value: int) -> int:
+        """ Key of chunk in its backend process. """
 
-        return qubit_id[0:1], qubit_id[1:3], qubit_id[3:8], qubit_id[8:10]
+        return cls.generate_pointer(0, dim, chunk_value, 0)
 
-    @staticmethod
-    def generate_pointer(pid: int, dim: int, chunk_value: int, index: int) -> str:
-        """
-        Qubit ID Generator.
-        """
 
-        return "{:01d}{:02d}{:05d}{:02d}".format(pid, dim, chunk_value, index)
+# CIRCUIT CHUNK
 
+# Merged chunks are splitted when their states are products within this tolerance, simulator state is single precision.
+separable_tolerance = 1e-6
 
-# CIRCUIT CHUNK
 
 class Chunk(object):
     def __init__(
@@ -532,11 +632,15 @@ class Chunk(object):
         self._allocated = allocated
         self._extended_count = 0
 
+        # Qubit count of circuit state, chunks that are merged to this chunk are included.
+        self._state_qubit_count = qubit_count
+
         # Construct ID gate.
         if self._dimension == 2:
             self._id_gate = cirq.I
         else:
             self._id_gate = Id(self._dimension)
+        self._identity = Id(self._dimension)
 
         # Iterate circuit for first time and apply state prepare error.
         self._circuit = cirq.Circuit()
@@ -559,10 +663,85 @@ class Chunk(object):
         result = selected_simulator.simulate(self._circuit, initial_state=self._circuit_state)
         self._circuit_state = result.state_vector()
         self._circuit.moments.clear()
-        line_qids = [cirq.LineQid(i, dimension=self._dimension) for i in range(self._qubit_count)]
-        self._circuit.append(Id(self._dimension).on_each(*line_qids))
+        self._circuit.append(self._identity.on_each(*get_line_qids(range(self._state_qubit_count), self._dimension)))
         return result
 
+    def flush_circuit(self):
+        """ Iterates circuit if it has operations after last iteration. """
+
+        # Iterated circuit has only one moment of identities.
+        if self._circuit_state is None or self._circuit.moments.__len__() > 1:
+            self.iterate_circuit()
+
+    def set_state(self, state: Optional[np.ndarray], state_qubit_count: int):
+        """
+        Replaces circuit state, pending operations must be iterated before.
+
+        Args:
+            state: New state vector, None if chunk does not hold a state.
+            state_qubit_count: Qubit count of new state.
+        """
+
+        self._circuit_state = state
+        self._state_qubit_count = state_qubit_count
+        self._circuit.moments.clear()
+        if state is not None:
+            self._circuit.append(self._identity.on_each(*get_line_qids(range(state_qubit_count), self._dimension)))
+
+    def merge_chunk(self, other: "Chunk") -> int:
+        """
+        Merges state of other chunk to back of this chunk. Other chunk does not hold a state afterwards.
+
+        Args:
+            other: Chunk to merge.
+
+        Returns:
+            Index of first qubit of other chunk in this chunk.
+
+        Raises:
+            ValueError: If dimensions of chunks are different.
+        """
+
+        if other.dimension != self._dimension:
+            raise ValueError("Chunks of different dimensions can not be merged. {} != {}.".format(self._dimension, other.dimension))
+
+        self.flush_circuit()
+        other.flush_circuit()
+
+        offset = self._state_qubit_count
+        self.set_state(np.kron(self._circuit_state, other.circuit_state), offset + other.state_qubit_count)
+        other.set_state(None, 0)
+        return offset
+
+    def split_qubits(self, position: int, size: int) -> Optional[np.ndarray]:
+        """
+        Splits qubits from circuit state if they are not entangled with the others.
+
+        Args:
+            position: Index of first qubit.
+            size: Qubit count.
+
+        Returns:
+            State vector of splitted qubits, None if they are entangled with the others.
+        """
+
+        if size >= self._state_qubit_count:
+            return None
+
+        self.flush_circuit()
+        tensor = self._circuit_state.reshape((self._dimension,) * self._state_qubit_count)
+        tensor = np.moveaxis(tensor, list(range(position, position + size)), list(range(size)))
+        matrix = tensor.reshape(self._dimension ** size, -1)
+
+        # State is separable if matrix is rank one, compare it with outer product of its largest element's row and column.
+        row, column = np.unravel_index(np.argmax(np.abs(matrix)), matrix.shape)
+        if not np.allclose(np.outer(matrix[:, column], matrix[row, :]) / matrix[row, column], matrix, rtol=0, atol=separable_tolerance):
+            return None
+
+        part = matrix[:, column] / np.linalg.norm(matrix[:, column])
+        self.set_state(part.conj().dot(matrix), self._state_qubit_count - size)
+        return part
+
     def deallocate_chunk(self) -> None:
         """ Hard reset the circuit. """
 
@@ -570,6 +749,7 @@ class Chunk(object):
         self._circuit_state = None
         self._qubit_count -= self._extended_count
         self._extended_count = 0
+        self._state_qubit_count = self._qubit_count
 
         self.scramble_qubits(
             (), self._noise_pattern.state_prepare_error_channel,
@@ -591,34 +771,53 @@ class Chunk(object):
         if _all:
             qubits = np.arange(self.qubit_count)
 
-        channel = get_channel_gate(method)
-        line_qids = [cirq.LineQid(qubit, dimension=self._dimension) for qubit in qubits]
-        for qid in line_qids:
-            channel_obj = channel(percent, dim=self._dimension)
-            self._circuit.append(channel_obj.on(qid))
+        for qid in get_line_qids(qubits, self._dimension):
+            self._circuit.append(get_channel(method, percent, self._dimension).on(qid))
 
-    def extend_chunk(self, size: int):
+    def extend_chunk(self, size: int, host: Optional["Chunk"] = None, position: Optional[int] = None):
         """
         Extends circuit by size from back.
-        Comsumes time.
 
         Args:
             size: Size of iteration.
+            host: Chunk that holds state of this chunk, this chunk if None.
+            position: Index of first new qubit in state of host, back of this chunk if None.
 
         Returns:
             List[int]
         """
 
-        base = np.zeros(self._dimension, dtype=complex)
-        base[0] = complex(1, 0)
-
-        for i in range(size):
-            self._circuit_state = tensordot(self._circuit_state, base)
+        if host is None:
+            host = self
+        if position is None:
+            position = self._qubit_count
 
+        host.insert_qubits(position, size)
         self._extended_count += size
         self._qubit_count += size
         return np.arange(self._qubit_count - size, self._qubit_count)
 
+    def insert_qubits(self, position: int, size: int):
+        """
+        Inserts qubits in ground state to circuit state.
+
+        Args:
+            position: Index of first new qubit.
+            size: Qubit count.
+        """
+
+        self.flush_circuit()
+        base = np.zeros(self._dimension ** size, dtype=complex)
+        base[0] = complex(1, 0)
+
+        count = self._state_qubit_count
+        state = np.kron(self._circuit_state, base)
+        if position < count:
+            tensor = state.reshape((self._dimension,) * (count + size))
+            tensor = np.moveaxis(tensor, list(range(count, count + size)), list(range(position, position + size)))
+            state = tensor.reshape(-1)
+        self.set_state(state, count + size)
+
     def apply_transformation(self, gate: cirq.Gate, qubits: Sequence[int], iterate=False):
         """
         Applies gate to qubits on chunk.
@@ -632,12 +831,13 @@ class Chunk(object):
         if not self._allocated:
             raise AttributeError("Chunk {} is not allocated.".format(self._index))
 
-        channel = get_channel_gate(self._noise_pattern.gate_error_channel)
-        line_qids = [cirq.LineQid(qubit, dimension=self._dimension) for qubit in qubits]
+        line_qids = get_line_qids(qubits, self._dimension)
 
         for qid in line_qids:
-            channel_onj = channel(self._noise_pattern.gate_error_probability, dim=self._dimension)
-            self._circuit.append(channel_onj.on(qid))
+            channel = get_channel(
+                self._noise_pattern.gate_error_channel, self._noise_pattern.gate_error_probability, self._dimension
+            )
+            self._circuit.append(channel.on(qid))
         self._circuit.append(gate.on(*line_qids))
 
         if iterate:
@@ -659,48 +859,39 @@ class Chunk(object):
         if not self._allocated:
             raise AttributeError("Chunk {} is not allocated.".format(self._index))
 
-        line_qids = [cirq.LineQid(qubit, dimension=self._dimension) for qubit in qubits]
+        # Set measure dimension.
+        if measure_dimension is None:
+            measure_dimension = self._dimension
+        else:
+            if measure_dimension > self._dimension:
+                measure_dimension = self._dimension
 
-        # Hold old state for non-destructive measurements.
-        old_state = None
-        old_circuit = None
+        # Non-destructive measurement samples from marginal probabilities and keeps the state.
         if non_destructive:
-            old_state = copy(self._circuit_state)
-            old_circuit = copy(self._circuit)
+            self.flush_circuit()
+            return np.array(sample_qubits(self._circuit_state, qubits, self._dimension)) % measure_dimension
+
+        line_qids = get_line_qids(qubits, self._dimension)
 
         # Set measure error channel error.
-        if not non_destructive:
-            self.scramble_qubits(
-                qubits, self._noise_pattern.measure_error_channel,
-                self._noise_pattern.measure_error_probability, _all=False
-            )
+        self.scramble_qubits(
+            qubits, self._noise_pattern.measure_error_channel,
+            self._noise_pattern.measure_error_probability, _all=False
+        )
 
         # Add measure OP.
         self._circuit.append(cirq.measure(*line_qids))
 
         # Add scramble after.
-        if not non_destructive:
-            self.scramble_qubits(
-                qubits,
-                self._noise_pattern.scramble_channel,
-                0.75, _all=False
-            )
+        self.scramble_qubits(
+            qubits,
+            self._noise_pattern.scramble_channel,
+            0.75, _all=False
+        )
 
         # Flush circuit.
         results = self.iterate_circuit()
 
-        # Regain old state.
-        if non_destructive:
-            self._circuit_state = old_state
-            self._circuit = old_circuit
-
-        # Set measure dimension.
-        if measure_dimension is None:
-            measure_dimension = self._dimension
-        else:
-            if measure_dimension > self._dimension:
-                measure_dimension = self._dimension
-
         for key in results.measurements.keys():
             return results.measurements[key] % measure_dimension
 
@@ -713,15 +904,15 @@ class Chunk(object):
             no_error: Apply spam error flag.
         """
 
-        line_qids = [cirq.LineQid(qubit, dimension=self._dimension) for qubit in qubits]
+        line_qids = get_line_qids(qubits, self._dimension)
         for qid in line_qids:
             self._circuit.append(cirq.reset(qid))
 
         if not no_error:
-            channel = get_channel_gate(self._noise_pattern.state_prepare_error_channel)
-            self._circuit.append(channel(
+            self._circuit.append(get_channel(
+                self._noise_pattern.state_prepare_error_channel,
                 self._noise_pattern.state_prepare_error_probability,
-                dim=self._dimension
+                self._dimension
             ).on_each(*line_qids))
 
     def set_allocated(self, flag: bool):
@@ -749,6 +940,10 @@ class Chunk(object):
     def qubit_count(self) -> int:
         return self._qubit_count
 
+    @property
+    def state_qubit_count(self) -> int:
+        return self._state_qubit_count
+
     @property
     def index(self) -> int:
         return self._index
@@ -782,6 +977,10 @@ class CirqBackendSlave(object):
         self._int_to_static_chunks: Dict[int, Chunk] = dict()
         self._pid = pid
 
+        # Chunks that are merged by a gate between them. Host chunk holds the state of its segments in order.
+        self._chunk_hosts: Dict[int, int] = dict()
+        self._chunk_segments: Dict[int, List[List[int]]] = dict()
+
     def prepair_slave(self):
         """ Starts preallocate. """
 
@@ -789,12 +988,8 @@ class CirqBackendSlave(object):
             left_side = 0
             for value in self._configuretion.frame_config[dim]:
                 for i in range(self._configuretion.frame_config[dim][value]):
-                    key = int("{:0{}d}{:0{}d}".format(
-                        dim, VirtQudit.dim_length, i + left_side, VirtQudit.chunk_length)
-                    )
-                    self._int_to_static_chunks[key] = Chunk(
-                        int("{:0{}d}".format(i + left_side, VirtQudit.chunk_length)),
-                        value, self.noise_pattern,
+                    self._int_to_static_chunks[VirtQudit.chunk_key(dim, i + left_side)] = Chunk(
+                        i + left_side, value, self.noise_pattern,
                         allocated=False, dimension=dim
                     )
                 left_side += self.configuretion.frame_config[dim][value]
@@ -802,11 +997,22 @@ class CirqBackendSlave(object):
     def terminate_slave(self):
         """ Terminates backend. """
 
+        self._chunk_hosts.clear()
+        self._chunk_segments.clear()
         for chunk_index in self._int_to_static_chunks:
             self._int_to_static_chunks[chunk_index].deallocate_chunk()
         del self._int_to_static_chunks
 
-    def allocate_qframes(self, frame_size: int, frame_count: int, dimension: int) -> List[List[str]]:
+    def reset_slave(self):
+        """ Deallocates all allocated chunks. Chunks are kept for next simulation. """
+
+        self._chunk_hosts.clear()
+        self._chunk_segments.clear()
+        for chunk_index in self._int_to_static_chunks:
+            if self._int_to_static_chunks[chunk_index].allocated:
+                self._int_to_static_chunks[chunk_index].deallocate_chunk()
+
+    def allocate_qframes(self, frame_size: int, frame_count: int, dimension: int) -> List[List[int]]:
         """
         Allocates a qframe.
 
@@ -820,14 +1026,10 @@ class CirqBackendSlave(object):
         """
 
         to_return = list()
-        low = int("{:0{}d}{:0{}d}".format(dimension, VirtQudit.dim_length, 0, VirtQudit.chunk_length))
-        high = int("{:0{}d}{:0{}d}".format(
-            dimension, VirtQudit.dim_length,
-            int("9" * VirtQudit.chunk_length), VirtQudit.chunk_length)
-        )
+        for current in self._int_to_static_chunks.values():
+            if current.dimension != dimension:
+                continue
 
-        for i in range(low, high):
-            current = self._int_to_static_chunks[i]
             if not current.allocated and current.qubit_count == frame_size:
                 to_return.append([
                     VirtQudit.generate_pointer(
@@ -845,7 +1047,7 @@ class CirqBackendSlave(object):
 
         return to_return
 
-    def deallocate_chunks(self, qubits: Sequence[str]):
+    def deallocate_chunks(self, qubits: Sequence[int]):
         """
         Deallocates the qubits.
 
@@ -855,11 +1057,21 @@ class CirqBackendSlave(object):
 
         for qubit in qubits:
             _, dim, chunk_val, _ = VirtQudit.qubit_id_resolver(qubit)
-            chunk_index = int(dim + chunk_val)
-            if self._int_to_static_chunks[chunk_index].allocated:
-                self._int_to_static_chunks[chunk_index].deallocate_chunk()
+            chunk_index = VirtQudit.chunk_key(dim, chunk_val)
+            if not self._int_to_static_chunks[chunk_index].allocated:
+                continue
+
+            # Reset qubits of a merged chunk in its host, they are splitted as they are not entangled anymore.
+            host_index = self.__host_of(chunk_index)
+            if host_index in self._chunk_segments:
+                offset = self.__offset_in_host(host_index, chunk_index)
+                host = self._int_to_static_chunks[host_index]
+                host.reset_qubits(range(offset, offset + self._int_to_static_chunks[chunk_index].qubit_count), no_error=True)
+                self.__split_chunks(host_index)
+
+            self._int_to_static_chunks[chunk_index].deallocate_chunk()
 
-    def extend_chunk(self, qubit: str, size: int):
+    def extend_chunk(self, qubit: int, size: int):
         """
         Extends a circut by size from back.
 
@@ -872,17 +1084,29 @@ class CirqBackendSlave(object):
         """
 
         _, dim, chunk_val, _ = VirtQudit.qubit_id_resolver(qubit)
-        chunk = self._int_to_static_chunks[int(dim + chunk_val)]
+        chunk_index = VirtQudit.chunk_key(dim, chunk_val)
+        chunk = self._int_to_static_chunks[chunk_index]
 
         if not chunk.allocated:
             raise AttributeError("Chunk {} is not allocated. Extend chunk is failed.".format(chunk.index))
 
+        # Merged chunk is extended at the back of its segment in host.
+        host_index = self.__host_of(chunk_index)
+        if host_index in self._chunk_segments:
+            position = self.__offset_in_host(host_index, chunk_index) + chunk.qubit_count
+            indexes = chunk.extend_chunk(size, self._int_to_static_chunks[host_index], position)
+            for segment in self._chunk_segments[host_index]:
+                if segment[0] == chunk_index:
+                    segment[1] = chunk.qubit_count
+        else:
+            indexes = chunk.extend_chunk(size)
+
         return_list = list()
-        for index in chunk.extend_chunk(size):
+        for index in indexes:
             return_list.append(VirtQudit.generate_pointer(self.pid, chunk.dimension, chunk.index, index))
         return return_list
 
-    def apply_transformation(self, gate_id: int, gate_arguments: Sequence, qubits: List[str]):
+    def apply_transformation(self, gate_id: int, gate_arguments: Sequence, qubits: List[int]):
         """
         Applies transformation on qubits.
 
@@ -892,28 +1116,31 @@ class CirqBackendSlave(object):
             qubits: Qubits.
         """
 
-        indexes = np.zeros(qubits.__len__())
-        _, dim, chunk_index, qubit_index = VirtQudit.qubit_id_resolver(qubits[0])
-        chunk = self._int_to_static_chunks[int(dim + chunk_index)]
-        indexes[0] = int(qubit_index)
-
-        if not chunk.allocated:
-            raise AttributeError("Chunk {} is not allocated. Apply transformation is failed.".format(chunk.index))
-
-        for i in range(1, qubits.__len__()):
-            _, dim, chunk_index, qubit_index = VirtQudit.qubit_id_resolver(qubits[i])
-            if self._int_to_static_chunks[int(dim + chunk_index)] != chunk:
-                raise OverflowError("Qubits must be in same circuit for transformation.")
-            indexes[i] = int(qubit_index)
-
-        gate = gates.gate_id_to_gate[gate_id](*gate_arguments)
-        if gate.qubit_shape != qubits.__len__():
-            raise ArithmeticError("Qubit count must be match with gate. {} != {}.".format(gate.qubit_shape, qubits.__len__()))
-
-        gate = cirq.MatrixGate(gate.matrix, qid_shape=(chunk.dimension,) * qubits.__len__())
+        host_indexes = list()
+        for qubit in qubits:
+            pid, dim, chunk_value, _ = VirtQudit.qubit_id_resolver(qubit)
+            if pid != self._pid:
+                raise OverflowError("Qubits must be in same backend process for transformation.")
+
+            chunk_index = VirtQudit.chunk_key(dim, chunk_value)
+            chunk = self._int_to_static_chunks[chunk_index]
+            if not chunk.allocated:
+                raise AttributeError("Chunk {} is not allocated. Apply transformation is failed.".format(chunk.index))
+
+            host_index = self.__host_of(chunk_index)
+            if host_index not in host_indexes:
+                host_indexes.append(host_index)
+
+        # Gate between chunks merges their states.
+        for host_index in host_indexes[1:]:
+            self.__merge_chunks(host_indexes[0], host_index)
+
+        chunk = self._int_to_static_chunks[host_indexes[0]]
+        indexes = [self.__locate(qubit)[1] for qubit in qubits]
+        gate = get_cirq_gate(gate_id, gate_arguments, chunk.dimension, qubits.__len__())
         chunk.apply_transformation(gate, indexes, iterate=False)
 
-    def measure_qubits(self, qubits: Sequence[str], non_destructive=False, measure_dimension=None):
+    def measure_qubits(self, qubits: Sequence[int], non_destructive=False, measure_dimension=None):
         """
         Measure Qubits.
 
@@ -926,24 +1153,32 @@ class CirqBackendSlave(object):
              List[int]
         """
 
-        results = list()
+        results = np.zeros(qubits.__len__(), dtype=int)
         chunks: Dict[int, List[int]] = dict()
+        placement: Dict[int, List[int]] = dict()
 
-        for qubit in qubits:
-            _, dim, chunk_val, index = VirtQudit.qubit_id_resolver(qubit)
-            key = int(dim + chunk_val)
+        for i, qubit in enumerate(qubits):
+            key, index = self.__locate(qubit)
 
             try:
-                chunks[key].append(int(index))
+                chunks[key].append(index)
+                placement[key].append(i)
             except KeyError:
                 chunks[key] = list()
-                chunks[key].append(int(index))
+                chunks[key].append(index)
+                placement[key] = list()
+                placement[key].append(i)
 
+        # Results are scattered back to the order of given qubits.
         for chunk in chunks:
             result = self._int_to_static_chunks[chunk].measure_qubits(
                 chunks[chunk], non_destructive=non_destructive, measure_dimension=measure_dimension
             )
-            results.extend(result)
+            results[placement[chunk]] = result
+
+            # Measured qubits may not be entangled with other segments anymore.
+            if not non_destructive and chunk in self._chunk_segments:
+                self.__split_chunks(chunk)
         return results
 
     def reset_qubits(self, qubits):
@@ -957,9 +1192,7 @@ class CirqBackendSlave(object):
         chunks = dict()
 
         for qubit in qubits:
-            pid, dim, chunk_val, index = VirtQudit.qubit_id_resolver(qubit)
-            qid = int(index)
-            key = int(dim + chunk_val)
+            key, qid = self.__locate(qubit)
 
             try:
                 chunks[key].append(qid)
@@ -989,9 +1222,7 @@ class CirqBackendSlave(object):
         chunks = dict()
 
         for qubit in qubits:
-            pid, dim, chunk_index, qubit_index = VirtQudit.qubit_id_resolver(qubit)
-            qid = int(qubit_index)
-            key = int(dim + chunk_index)
+            key, qid = self.__locate(qubit)
 
             try:
                 chunks[key].append(qid)
@@ -1015,6 +1246,111 @@ class CirqBackendSlave(object):
         for gate_instructor in list_of_gates:
             self.apply_transformation(gate_instructor[0], gate_instructor[1], gate_instructor[2])
 
+    def __host_of(self, chunk_index: int) -> int:
+        """ Returns index of chunk that holds state of given chunk. """
+
+        try:
+            return self._chunk_hosts[chunk_index]
+        except KeyError:
+            return chunk_index
+
+    def __offset_in_host(self, host_index: int, chunk_index: int) -> int:
+        """ Returns index of first qubit of chunk in its host. """
+
+        offset = 0
+        for segment_index, size in self._chunk_segments[host_index]:
+            if segment_index == chunk_index:
+                return offset
+            offset += size
+        raise KeyError("Chunk {} is not merged to chunk {}.".format(chunk_index, host_index))
+
+    def __locate(self, qubit: int) -> Tuple[int, int]:
+        """
+        Locates qubit in chunk that holds its state.
+
+        Args:
+            qubit: Qubit ID.
+
+        Returns:
+            Index of chunk and index of qubit in that chunk.
+        """
+
+        _, dim, chunk_val, index = VirtQudit.qubit_id_resolver(qubit)
+        chunk_index = VirtQudit.chunk_key(dim, chunk_val)
+        host_index = self.__host_of(chunk_index)
+        if host_index not in self._chunk_segments:
+            return chunk_index, index
+        return host_index, self.__offset_in_host(host_index, chunk_index) + index
+
+    def __merge_chunks(self, host_index: int, other_index: int):
+        """
+        Merges state of other host chunk and its segments to back of host chunk.
+
+        Args:
+            host_index: Index of host chunk.
+            other_index: Index of other host chunk.
+        """
+
+        host = self._int_to_static_chunks[host_index]
+        other = self._int_to_static_chunks[other_index]
+        host.merge_chunk(other)
+
+        try:
+            segments = self._chunk_segments[host_index]
+        except KeyError:
+            segments = [[host_index, host.qubit_count]]
+            self._chunk_segments[host_index] = segments
+
+        try:
+            other_segments = self._chunk_segments.pop(other_index)
+        except KeyError:
+            other_segments = [[other_index, other.qubit_count]]
+
+        for segment in other_segments:
+            self._chunk_hosts[segment[0]] = host_index
+        segments.extend(other_segments)
+        log("Process-{}: Chunk {} is merged to chunk {} with {} qubits.".format(
+            self._pid, other_index, host_index, host.state_qubit_count)
+        )
+
+    def __split_chunks(self, host_index: int):
+        """
+        Splits segments of host chunk which are not entangled with the others back to their chunks.
+
+        Args:
+            host_index: Index of host chunk.
+        """
+
+        host = self._int_to_static_chunks[host_index]
+        segments = self._chunk_segments[host_index]
+
+        # Split merged segments from back, positions of segments in front do not change.
+        for i in range(segments.__len__() - 1, 0, -1):
+            chunk_index, size = segments[i]
+            part = host.split_qubits(sum([segment[1] for segment in segments[:i]]), size)
+            if part is not None:
+                self._int_to_static_chunks[chunk_index].set_state(part, size)
+                del self._chunk_hosts[chunk_index]
+                del segments[i]
+
+        # Host may be splitted from its segments, first segment becomes new host.
+        if segments.__len__() > 1:
+            part = host.split_qubits(0, segments[0][1])
+            if part is not None:
+                new_host_index = segments[1][0]
+                self._int_to_static_chunks[new_host_index].set_state(host.circuit_state, host.state_qubit_count)
+                host.set_state(part, segments[0][1])
+
+                del self._chunk_hosts[new_host_index]
+                for segment in segments[2:]:
+                    self._chunk_hosts[segment[0]] = new_host_index
+                if segments.__len__() > 2:
+                    self._chunk_segments[new_host_index] = segments[1:]
+                del segments[1:]
+
+        if segments.__len__() <= 1:
+            del self._chunk_segments[host_index]
+
     @property
     def configuretion(self) -> config.BackendConfiguration:
         return self._configuretion
@@ -1155,6 +1491,13 @@ class CirqBackendSlave(object):
                     put_message(ProcessMessages.Respond.APPLY_CHANNEL_ERROR_DONE, 0)
                 log("Process-{}: Processes channel error to count of ({})".format(pid_index, qubits.__len__()))
 
+            elif command == ProcessMessages.Request.RESET_BACKEND[0]:
+                cb.reset_slave()
+
+                if report:
+                    put_message(ProcessMessages.Respond.RESET_BACKEND_DONE, 0)
+                log("Process-{}: Reset all chunks".format(pid_index))
+
             elif command == ProcessMessages.Request.APPLY_SERIAL_GATE[0]:
                 gate_list = message[0]
                 count = 0
@@ -1206,7 +1549,7 @@ class CirqBackend(Backend):
             self.process_to_queue[p] = q
             self.queue_to_process[q] = p
 
-        self._allocate_memory: Dict[int, List[str]] = dict()
+        self._allocate_memory: Dict[int, List[int]] = dict()
         self.start_backend()
 
     def put_message(self, process: multiprocessing.Process, command: Tuple[str, bool], *message):
@@ -1265,6 +1608,23 @@ class CirqBackend(Backend):
         self.income_queue = None
         log("Cirq backend master terminated.")
 
+    def reset_backend(self):
+        """ Deallocates all chunks on slaves. Slave processes keep running. """
+
+        for process in self.processes:
+            self.put_message(process, ProcessMessages.Request.RESET_BACKEND)
+
+        if ProcessMessages.Request.RESET_BACKEND[1]:
+            for _ in self.processes:
+                pid, command, message = self.income_queue.get()
+                if command != ProcessMessages.Respond.RESET_BACKEND_DONE:
+                    raise ValueError("Cirq master backend expected reset done message but got {}.".format(command))
+
+        for process in self.processes:
+            self.process_to_frame[process] = deepcopy(self.configuration.frame_config)
+        self._allocate_memory.clear()
+        log("Cirq backend master is reset.")
+
     def figure_allocation(self, frame_size: int, frame_count: int, dimension: int) -> Dict[multiprocessing.Process, int]:
         """
         Figures allocation places.
@@ -1310,7 +1670,7 @@ class CirqBackend(Backend):
         log("Cirq master calculates {}x{} qframes allocation.".format(org_frame_count, frame_size))
         return process_to_size
 
-    def figure_deallocation(self, qubits: Sequence[str]):
+    def figure_deallocation(self, qubits: Sequence[int]):
         """
         Figures the deallocation.
 
@@ -1325,13 +1685,13 @@ class CirqBackend(Backend):
         deleted_chunks = list()
         for qubit in qubits:
             pid, dim, chunk_val, index = VirtQudit.qubit_id_resolver(qubit)
-            chunk_pointer = pid + dim + chunk_val
+            chunk_pointer = (pid, dim, chunk_val)
 
             qubit_found = False
             for frame_size in self._allocate_memory:
                 if qubit in self._allocate_memory[frame_size]:
                     if chunk_pointer not in deleted_chunks:
-                        self.process_to_frame[self.processes[int(pid) - 1]][int(dim)][frame_size] += 1
+                        self.process_to_frame[self.processes[pid - 1]][dim][frame_size] += 1
                         deleted_chunks.append(chunk_pointer)
                     self._allocate_memory[frame_size].remove(qubit)
                     qubit_found = True
@@ -1347,7 +1707,7 @@ class CirqBackend(Backend):
 
         return self.allocate_qframes(count, 1, *args)[0]
 
-    def allocate_qframes(self, frame_size: int, frame_count: int, *args) -> List[List[str]]:
+    def allocate_qframes(self, frame_size: int, frame_count: int, *args) -> List[List[int]]:
         """
         Allocates a qframe.
 
@@ -1399,7 +1759,7 @@ class CirqBackend(Backend):
                 .format(qubits.__len__(), qubits[0].__len__(), process_to_frame.__len__()))
         return qubits
 
-    def deallocate_qubits(self, qubits: Sequence[str]):
+    def deallocate_qubits(self, qubits: Sequence[int]):
         """
         Deallocates qubits.
 
@@ -1407,16 +1767,16 @@ class CirqBackend(Backend):
             qubits: List[Qubit ID]
         """
 
-        process_to_qubits: Dict[multiprocessing.Process, List[str]] = dict()
+        process_to_qubits: Dict[multiprocessing.Process, List[int]] = dict()
         for qubit in qubits:
             pid, _, _, _ = VirtQudit.qubit_id_resolver(qubit)
 
             try:
-                _ = process_to_qubits[self.processes[int(pid) - 1]]
+                _ = process_to_qubits[self.processes[pid - 1]]
             except KeyError:
-                process_to_qubits[self.processes[int(pid) - 1]] = list()
+                process_to_qubits[self.processes[pid - 1]] = list()
 
-            process_to_qubits[self.processes[int(pid) - 1]].append(qubit)
+            process_to_qubits[self.processes[pid - 1]].append(qubit)
 
         for process in process_to_qubits:
             self.put_message(
@@ -1434,7 +1794,7 @@ class CirqBackend(Backend):
 
         return self.figure_deallocation(qubits)
 
-    def extend_circuit(self, qubit: str, size: int):
+    def extend_circuit(self, qubit: int, size: int):
         """
         Extend circuit by size from back.
 
@@ -1447,7 +1807,7 @@ class CirqBackend(Backend):
         """
 
         pid, dim, chunk_value, index = VirtQudit.qubit_id_resolver(qubit)
-        process = self.processes[int(pid) - 1]
+        process = self.processes[pid - 1]
         self.put_message(
             process,
             ProcessMessages.Request.EXTEND_CIRCUIT,
@@ -1462,7 +1822,7 @@ class CirqBackend(Backend):
             results.extend(message)
         return results
 
-    def apply_transformation(self, gate_id, gate_arguments, qubits: Sequence[str], *args):
+    def apply_transformation(self, gate_id, gate_arguments, qubits: Sequence[int], *args):
         """
         Applies transformation on qubits.
 
@@ -1472,19 +1832,19 @@ class CirqBackend(Backend):
             qubits: Qubits.
         """
 
-        process_to_chunks: Dict[multiprocessing.Process, List[str]] = dict()
+        process_to_chunks: Dict[multiprocessing.Process, List[int]] = dict()
         for qubit in qubits:
             pid, dim, chunk_value, index = VirtQudit.qubit_id_resolver(qubit)
 
             try:
-                _ = process_to_chunks[self.processes[int(pid) - 1]]
+                _ = process_to_chunks[self.processes[pid - 1]]
             except KeyError:
-                process_to_chunks[self.processes[int(pid) - 1]] = list()
+                process_to_chunks[self.processes[pid - 1]] = list()
 
-            process_to_chunks[self.processes[int(pid) - 1]].append(qubit)
+            process_to_chunks[self.processes[pid - 1]].append(qubit)
 
         if process_to_chunks.keys().__len__() != 1:
-            raise OverflowError("Cannot apply gate_id: {}! Qubits are in different chunks.".format(gate_id))
+            raise OverflowError("Cannot apply gate_id: {}! Qubits are in different backend processes.".format(gate_id))
 
         process = None
         for p in process_to_chunks:
@@ -1504,7 +1864,7 @@ class CirqBackend(Backend):
                 if command != ProcessMessages.Respond.APPLY_GATE_DONE:
                     raise ValueError("Cirq master backend expected apply gate done message but got {}.".format(command))
 
-    def measure_qubits(self, qubits: Sequence[str], *args):
+    def measure_qubits(self, qubits: Sequence[int], *args):
         """
         Measures qubits.
 
@@ -1520,22 +1880,22 @@ class CirqBackend(Backend):
         """
 
         placement: Dict[int, List[int]] = dict()
-        process_to_chunks: Dict[multiprocessing.Process, List[str]] = dict()
+        process_to_chunks: Dict[multiprocessing.Process, List[int]] = dict()
         for i, qubit in enumerate(qubits):
             pid, dim, chunk_value, index = VirtQudit.qubit_id_resolver(qubit)
 
             try:
-                _ = process_to_chunks[self.processes[int(pid) - 1]]
+                _ = process_to_chunks[self.processes[pid - 1]]
             except KeyError:
-                process_to_chunks[self.processes[int(pid) - 1]] = list()
+                process_to_chunks[self.processes[pid - 1]] = list()
 
-            process_to_chunks[self.processes[int(pid) - 1]].append(qubit)
+            process_to_chunks[self.processes[pid - 1]].append(qubit)
 
             try:
-                _ = placement[int(pid) - 1]
+                _ = placement[pid - 1]
             except KeyError:
-                placement[int(pid) - 1] = list()
-            placement[int(pid) - 1].append(i)
+                placement[pid - 1] = list()
+            placement[pid - 1].append(i)
 
         for process in process_to_chunks:
             self.put_message(
@@ -1555,7 +1915,7 @@ class CirqBackend(Backend):
                     results[placement[pid - 1][i]] = result
         return results
 
-    def reset_qubits(self, qubits: Sequence[str]):
+    def reset_qubits(self, qubits: Sequence[int]):
         """
         Reset Qubits.
 
@@ -1563,16 +1923,16 @@ class CirqBackend(Backend):
             qubits: List[Qubit ID]
         """
 
-        process_to_chunks: Dict[multiprocessing.Process, List[str]] = dict()
+        process_to_chunks: Dict[multiprocessing.Process, List[int]] = dict()
         for qubit in qubits:
             pid, dim, chunk_value, index = VirtQudit.qubit_id_resolver(qubit)
 
             try:
-                _ = process_to_chunks[self.processes[int(pid) - 1]]
+                _ = process_to_chunks[self.processes[pid - 1]]
             except KeyError:
-                process_to_chunks[self.processes[int(pid) - 1]] = list()
+                process_to_chunks[self.processes[pid - 1]] = list()
 
-            process_to_chunks[self.processes[int(pid) - 1]].append(qubit)
+            process_to_chunks[self.processes[pid - 1]].append(qubit)
 
         for process in process_to_chunks:
             self.put_message(
@@ -1619,16 +1979,16 @@ class CirqBackend(Backend):
             percent: Error percent.
         """
 
-        process_to_chunks: Dict[multiprocessing.Process, List[str]] = dict()
+        process_to_chunks: Dict[multiprocessing.Process, List[int]] = dict()
         for qubit in qubits:
             pid, dim, chunk_value, index = VirtQudit.qubit_id_resolver(qubit)
 
             try:
-                _ = process_to_chunks[self.processes[int(pid) - 1]]
+                _ = process_to_chunks[self.processes[pid - 1]]
             except KeyError:
-                process_to_chunks[self.processes[int(pid) - 1]] = list()
+                process_to_chunks[self.processes[pid - 1]] = list()
 
-            process_to_chunks[self.processes[int(pid) - 1]].append(qubit)
+            process_to_chunks[self.processes[pid - 1]].append(qubit)
 
         for process in process_to_chunks:
             self.put_message(
@@ -1657,12 +2017,17 @@ class CirqBackend(Backend):
             gate_id, gate_args, qubits = gate_instructor[0], gate_instructor[1], gate_instructor[2]
             pid, dim, chunk_val, index = VirtQudit.qubit_id_resolver(qubits[0])
 
+            # Slave cannot apply a gate between processes, check before any gate is sent.
+            for qubit in qubits[1:]:
+                if VirtQudit.qubit_id_resolver(qubit)[0] != pid:
+                    raise OverflowError("Cannot apply gate_id: {}! Qubits are in different backend processes.".format(gate_id))
+
             try:
-                _ = process_to_chunks[self.processes[int(pid) - 1]]
+                _ = process_to_chunks[self.processes[pid - 1]]
             except KeyError:
-                process_to_chunks[self.processes[int(pid) - 1]] = list()
+                process_to_chunks[self.processes[pid - 1]] = list()
 
-            process_to_chunks[self.processes[int(pid) - 1]].append([gate_id, gate_args, qubits])
+            process_to_chunks[self.processes[pid - 1]].append([gate_id, gate_args, qubits])
 
         for process in process_to_chunks:
             self.put_message(
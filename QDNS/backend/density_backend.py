@@ -0,0 +1,389 @@
+# Copyright (c) 2021, COMU Team, Osman Ceylan and etc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 3. Neither the name of the COMU Team organization nor the
+#    names of its contributors may be used to endorse or promote products
+#    derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDER ''AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+from typing import List, Dict, Optional, Tuple, Sequence
+
+import numpy as np
+
+from QDNS.backend.sdqs_backend import Register, SdqsBackend, SHIFT_X, SHIFT_Y, SHIFT_Z
+from QDNS.backend.tools import config
+from QDNS.backend.tools import noise
+from QDNS.backend.tools.state_vector import apply_operator
+
+# Maximum object count of kraus cache.
+max_cached_objects = 4096
+
+# (Channel flag, Probability, Dimension) -> Kraus operators.
+kraus_cache: Dict[Tuple[str, float, int], List[np.ndarray]] = dict()
+
+
+def shift_matrix(dimension: int, power: int) -> np.ndarray:
+    """ Generalized pauli X to the power, |k> -> |k + power>. """
+
+    return np.roll(np.eye(dimension, dtype=complex), power, axis=0)
+
+
+def clock_matrix(dimension: int, power: int) -> np.ndarray:
+    """ Generalized pauli Z to the power, |k> -> w^(k * power) |k>. """
+
+    return np.diag(np.exp(2j * np.pi * power * np.arange(dimension) / dimension))
+
+
+def get_kraus_operators(flag: str, p: float, dimension: int) -> List[np.ndarray]:
+    """
+    Gets kraus operators of a channel from cache or builds them.
+    Qudit shifts are averaged over all powers, sdqs and cirq backends pick one of them at random.
+
+    Args:
+        flag: Channel error flag.
+        p: Probability of channel.
+        dimension: Qudit dimension.
+
+    Returns:
+        List of kraus operators.
+
+    Raises:
+        ValueError: If channel flag is unknown.
+    """
+
+    key = (flag, p, dimension)
+    try:
+        return kraus_cache[key]
+    except KeyError:
+        pass
+
+    if flag not in noise.channels:
+        raise ValueError("Expected channel error flag from tools, but {}.".format(flag))
+
+    powers = range(1, dimension)
+    if flag == noise.bit_flip_channel:
+        mixture = [(p / powers.__len__(), shift_matrix(dimension, s)) for s in powers]
+
+    elif flag == noise.phase_flip_channel:
+        mixture = [(p / powers.__len__(), clock_matrix(dimension, s)) for s in powers]
+
+    elif flag == noise.bit_and_phase_flip_channel:
+        mixture = [(p / powers.__len__(), shift_matrix(dimension, s).dot(clock_matrix(dimension, s))) for s in powers]
+
+    elif flag == noise.depolarisation_channel:
+        mixture = list()
+        for s in powers:
+            probability = p / 3 / powers.__len__()
+            mixture.append((probability, shift_matrix(dimension, s)))
+            mixture.append((probability, shift_matrix(dimension, s).dot(clock_matrix(dimension, s))))
+            mixture.append((probability, clock_matrix(dimension, s)))
+
+    elif flag == noise.reset_channel:
+        mixture = list()
+        for k in range(dimension):
+            # |0><k|
+            operator = np.zeros((dimension, dimension), dtype=complex)
+            operator[0, k] = complex(1, 0)
+            mixture.append((p, operator))
+
+    else:
+        mixture = list()
+        p = 0.0
+
+    operators = [np.sqrt(1.0 - p) * np.eye(dimension, dtype=complex)]
+    operators.extend([np.sqrt(probability) * operator for probability, operator in mixture])
+
+    if kraus_cache.__len__() < max_cached_objects:
+        kraus_cache[key] = operators
+    return operators
+
+
+def state_fidelity(density_matrix: np.ndarray, state: np.ndarray) -> float:
+    """
+    Fidelity of a density matrix to a pure state, <state| density_matrix |state>.
+
+    Args:
+        density_matrix: Density matrix.
+        state: State vector.
+
+    Returns:
+        Fidelity.
+    """
+
+    state = np.asarray(state, dtype=complex).reshape(-1)
+    return float(np.real(state.conj().dot(density_matrix).dot(state)))
+
+
+# DENSITY REGISTER
+
+class DensityRegister(Register):
+    def __init__(self, dimension: int, qubits: List[int], state: Optional[np.ndarray] = None):
+        """
+        Register holds density tensor of qudits, ket axes are followed by bra axes.
+
+        Args:
+            dimension: Qudit dimension.
+            qubits: Qubit IDs in order of ket axes.
+            state: Density tensor, qudits are in ground state if None.
+        """
+
+        if state is None:
+            state = np.zeros((dimension,) * (2 * qubits.__len__()), dtype=complex)
+            state[(0,) * (2 * qubits.__len__())] = complex(1, 0)
+        super(DensityRegister, self).__init__(dimension, qubits, state)
+
+    @classmethod
+    def basis_register(cls, dimension: int, qubit: int, outcome: int) -> "DensityRegister":
+        """
+        Register of a single qudit in a basis state.
+
+        Args:
+            dimension: Qudit dimension.
+            qubit: Qubit ID.
+            outcome: Basis state of qudit.
+
+        Returns:
+            DensityRegister.
+        """
+
+        state = np.zeros((dimension, dimension), dtype=complex)
+        state[outcome, outcome] = complex(1, 0)
+        return cls(dimension, [qubit], state)
+
+    def merge_register(self, other: "DensityRegister"):
+        """
+        Merges state of other register to back of this register.
+
+        Args:
+            other: Register to merge.
+
+        Raises:
+            ValueError: If dimensions of registers are different.
+        """
+
+        if other.dimension != self._dimension:
+            raise ValueError("Registers of different dimensions can not be merged. {} != {}.".format(self._dimension, other.dimension))
+
+        count, other_count = self.qubit_count, other.qubit_count
+        state = np.multiply.outer(self._state, other.state)
+
+        # Axes are [ket, bra, other ket, other bra], bring other ket before bra.
+        order = list(range(count)) + list(range(2 * count, 2 * count + other_count))
+        order += list(range(count, 2 * count)) + list(range(2 * count + other_count, 2 * (count + other_count)))
+        self._state = np.transpose(state, order)
+        self._qubits.extend(other.qubits)
+
+    def apply_matrix(self, matrix: np.ndarray, qubits: Sequence[int]):
+        """
+        Applies matrix to qubits of register, U rho U^dagger.
+
+        Args:
+            matrix: Operator matrix.
+            qubits: List[Qubit ID].
+        """
+
+        axes = [self._qubits.index(qubit) for qubit in qubits]
+        self._state = apply_operator(self._state, matrix, axes, self._dimension)
+        self._state = apply_operator(self._state, np.conj(matrix), [axis + self.qubit_count for axis in axes], self._dimension)
+
+    def apply_kraus(self, operators: Sequence[np.ndarray], qubit: int):
+        """
+        Applies a channel to qubit, sum of K rho K^dagger.
+
+        Args:
+            operators: Kraus operators.
+            qubit: Qubit ID.
+        """
+
+        ket = self._qubits.index(qubit)
+        bra = ket + self.qubit_count
+
+        state = np.zeros_like(self._state)
+        for operator in operators:
+            state += apply_operator(
+                apply_operator(self._state, operator, [ket], self._dimension),
+                np.conj(operator), [bra], self._dimension
+            )
+        self._state = state
+
+    def shift_qubit(self, qubit: int, operation: str):
+        """
+        Applies a generalized pauli shift to qubit. Qudits are shifted by a random power.
+
+        Args:
+            qubit: Qubit ID.
+            operation: One of SHIFT_X, SHIFT_Y and SHIFT_Z.
+        """
+
+        power = 1
+        if self._dimension > 2:
+            power = np.random.randint(1, self._dimension)
+
+        matrix = np.eye(self._dimension, dtype=complex)
+        if operation == SHIFT_X or operation == SHIFT_Y:
+            matrix = shift_matrix(self._dimension, power)
+        if operation == SHIFT_Z or operation == SHIFT_Y:
+            matrix = matrix.dot(clock_matrix(self._dimension, power))
+        self.apply_matrix(matrix, [qubit])
+
+    def measure_qubit(self, qubit: int) -> int:
+        """
+        Measures qubit and removes it from register.
+
+        Args:
+            qubit: Qubit ID.
+
+        Returns:
+            Outcome.
+        """
+
+        count = self.qubit_count
+        axis = self._qubits.index(qubit)
+        tensor = np.moveaxis(self._state, [axis, axis + count], [0, 1])
+
+        # Diagonal blocks <k| rho |k> of qubit, their traces are outcome probabilities.
+        blocks = tensor[np.arange(self._dimension), np.arange(self._dimension)]
+        rest = self._dimension ** (count - 1)
+        probabilities = np.real(np.trace(blocks.reshape(self._dimension, rest, rest), axis1=1, axis2=2))
+        probabilities = np.clip(probabilities, 0, None)
+
+        outcome = int(np.random.choice(self._dimension, p=probabilities / probabilities.sum()))
+        self._state = blocks[outcome] / probabilities[outcome]
+        self._qubits.pop(axis)
+        return outcome
+
+    def remove_qubit(self, qubit: int):
+        """
+        Removes qubit from register by tracing it out.
+
+        Args:
+            qubit: Qubit ID.
+        """
+
+        axis = self._qubits.index(qubit)
+        self._state = np.trace(self._state, axis1=axis, axis2=axis + self.qubit_count)
+        self._qubits.pop(axis)
+
+    def reduced_density_matrix(self, qubits: Sequence[int]) -> np.ndarray:
+        """
+        Density matrix of qubits, other qubits of register are traced out.
+
+        Args:
+            qubits: List[Qubit ID].
+
+        Returns:
+            Density matrix in shape of (dimension ** qubit count, dimension ** qubit count).
+        """
+
+        count = self.qubit_count
+        axes = [self._qubits.index(qubit) for qubit in qubits]
+
+        # Traced out qubits share ket and bra labels.
+        labels = list(range(count)) + [count + i if i in axes else i for i in range(count)]
+        output = axes + [count + axis for axis in axes]
+
+        size = self._dimension ** axes.__len__()
+        return np.einsum(self._state, labels, output).reshape(size, size)
+
+    def sample_qubits(self, qubits: Sequence[int]) -> List[int]:
+        """
+        Samples outcome of qubits without changing the state.
+
+        Args:
+            qubits: List[Qubit ID].
+
+        Returns:
+            List[int].
+        """
+
+        probabilities = np.clip(np.real(np.diag(self.reduced_density_matrix(qubits))), 0, None)
+        outcome = np.random.choice(probabilities.size, p=probabilities / probabilities.sum())
+        return [int(i) for i in np.unravel_index(outcome, (self._dimension,) * qubits.__len__())]
+
+
+# DENSITY MATRIX BACKEND
+
+class DensityMatrixBackend(SdqsBackend):
+    # Register type that holds states of qudits.
+    register_type = DensityRegister
+
+    def __init__(
+            self, configuration: config.BackendConfiguration,
+            noise_pattern: noise.NoisePattern) -> None:
+        """
+        Density Matrix Backend. Channels of noise pattern are applied as exact kraus maps instead of sampled errors.
+
+        Args:
+            configuration: Density matrix backend configuration.
+            noise_pattern: Noise pattern for simulation.
+        """
+
+        super().__init__(configuration, noise_pattern)
+
+    def scramble_qubits(self, channel: str, qubits: Sequence[int], percent: float):
+        """
+        Process any channel with any percents.
+
+        Args:
+            channel: Channel method.
+            qubits: Qubits to scramble.
+            percent: Percent of channel.
+        """
+
+        if percent <= 0 or channel == noise.no_noise_channel:
+            return
+
+        for qubit in qubits:
+            register = self._qubit_to_register[qubit]
+            register.apply_kraus(get_kraus_operators(channel, percent, register.dimension), qubit)
+
+    def density_matrix(self, qubits: Sequence[int]) -> np.ndarray:
+        """
+        Density matrix of qubits.
+
+        Args:
+            qubits: List[Qubit ID].
+
+        Returns:
+            Density matrix, first qubit is the most significant digit.
+        """
+
+        dimension = self._qubit_to_register[qubits[0]].dimension
+        matrix = np.ones((1, 1), dtype=complex)
+        order = list()
+
+        # Registers are independent of each other, density matrix is their tensor product.
+        done = list()
+        for qubit in qubits:
+            register = self._qubit_to_register[qubit]
+            if register in done:
+                continue
+            done.append(register)
+
+            register_qubits = [q for q in qubits if self._qubit_to_register[q] is register]
+            matrix = np.kron(matrix, register.reduced_density_matrix(register_qubits))
+            order.extend(register_qubits)
+
+        # Put qubits in given order.
+        count = qubits.__len__()
+        tensor = matrix.reshape((dimension,) * (2 * count))
+        axes = [order.index(qubit) for qubit in qubits]
+        tensor = np.transpose(tensor, axes + [count + axis for axis in axes])
+        return tensor.reshape(dimension ** count, dimension ** count)
@@ -0,0 +1,284 @@
+# Copyright (c) 2021, COMU Team, Osman Ceylan and etc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 3. Neither the name of the COMU Team organization nor the
+#    names of its contributors may be used to endorse or promote products
+#    derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDER ''AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+from typing import List, Dict, Sequence, Tuple
+
+import numpy as np
+
+from QDNS.backend.sdqs_backend import SdqsBackend, VirtQudit
+from QDNS.backend.stim_backend import StimBackend, supported_operations
+from QDNS.backend.tools import config
+from QDNS.backend.tools import noise
+from QDNS.backend.tools.backend import Backend
+from QDNS.backend.tools.groups import EntanglementGroups
+from QDNS.tools.various_tools import dev_mode
+
+
+def log(message: str):
+    if dev_mode:
+        print(message)
+
+
+class HybridBackend(Backend):
+    def __init__(
+            self, configuration: config.BackendConfiguration,
+            noise_pattern: noise.NoisePattern) -> None:
+        """
+        Hybrid Backend. Qubits stay in a stim tableau while they only see clifford operations.
+        When a non clifford gate arrives, entanglement group of its qubits is moved to sdqs state vector backend.
+
+        Args:
+            configuration: Hybrid backend configuration, key 2 of frame configuration is the qubit capacity.
+            noise_pattern: Noise pattern for simulation.
+
+        Notes:
+            Qubit IDs are stim qubit IDs. Moved qubits keep their stim slots until they are reset or deallocated.
+        """
+
+        super().__init__(configuration, noise_pattern)
+
+        self._stim_backend = None
+        self._sdqs_backend = None
+
+        # Groups of qubits in stim tableau.
+        self._groups = EntanglementGroups()
+
+        # Qubit ID -> sdqs qubit ID of moved qubits.
+        self._moved_qubits: Dict[int, int] = dict()
+        self._moved_count = 0
+
+        self.start_backend()
+
+    def start_backend(self) -> bool:
+        """ Starts stim and sdqs backends. """
+
+        try:
+            capacity = self.configuration.frame_config[2]
+        except KeyError:
+            raise ValueError("Hybrid backend expected key 2 from chunk configuration.")
+
+        self._stim_backend = StimBackend(
+            config.BackendConfiguration(config.STIM_BACKEND, 1, {2: capacity}), self.noise_pattern
+        )
+
+        # Moved qubits are picked from single qubit chunks.
+        self._sdqs_backend = SdqsBackend(
+            config.BackendConfiguration(
+                config.SDQS_BACKEND, 1, {2: {1: min(capacity, VirtQudit.field_limit("chunk"))}}
+            ), self.noise_pattern
+        )
+        return True
+
+    def terminate_backend(self):
+        """ Terminates the backend. """
+
+        self._stim_backend.terminate_backend()
+        self._sdqs_backend.terminate_backend()
+        self._groups.clear()
+        self._moved_qubits.clear()
+        log("Hybrid backend terminated, {} qubits are moved to state vector.".format(self._moved_count))
+
+    def reset_backend(self):
+        """ Frees all qubits and resets their states. """
+
+        self._stim_backend.reset_backend()
+        self._sdqs_backend.reset_backend()
+        self._groups.clear()
+        self._moved_qubits.clear()
+        self._moved_count = 0
+
+    def allocate_qubits(self, count: int, *args) -> np.ndarray:
+        """
+        Allocates qubits.
+
+        Args:
+            count: Count of qubits.
+            args: Backend specific arguments.
+
+        Raises:
+            ValueError: If dimension of qudits is not 2.
+
+        :arg[0] = dimension
+        """
+
+        if args.__len__() > 0 and args[0] != 2:
+            raise ValueError("Hybrid backend can only allocate qubits of dimension 2.")
+
+        qubits = self._stim_backend.allocate_qubits(count)
+        self._groups.add_qubits(qubits)
+        return qubits
+
+    def allocate_qframes(self, frame_size: int, frame_count: int, *args) -> np.ndarray:
+        """ Allocates qframes on backend. """
+
+        return self.allocate_qubits(frame_size * frame_count, *args).reshape(frame_count, frame_size)
+
+    def deallocate_qubits(self, qubits: Sequence[int]) -> bool:
+        """ Deallocates qubits from both backends. """
+
+        moved = [self._moved_qubits.pop(qubit) for qubit in qubits if qubit in self._moved_qubits]
+        report = True
+        if moved.__len__() > 0:
+            report = self._sdqs_backend.deallocate_qubits(moved)
+
+        self._groups.remove_qubits(qubits)
+        return self._stim_backend.deallocate_qubits(qubits) and report
+
+    def extend_circuit(self, qubit: int, size: int) -> np.ndarray:
+        """ Extend qframe from back, just returns with more allocation. """
+
+        _ = qubit
+        return self.allocate_qubits(size)
+
+    def apply_transformation(self, gate_id: int, gate_arguments: Tuple, qubits: Sequence[int], *args):
+        """
+        Apply transformation on qubits.
+
+        Args:
+            gate_id: Gate ID.
+            gate_arguments: Gate constructor arguments.
+            qubits: Qubits
+
+        :arg[0] Apply gate noise flag for stim backend.
+        """
+
+        if gate_id in supported_operations and not any(qubit in self._moved_qubits for qubit in qubits):
+            self._stim_backend.apply_transformation(gate_id, gate_arguments, qubits, *args)
+            if qubits.__len__() > 1:
+                self._groups.merge_groups(qubits)
+            return
+
+        self.__move_qubits(qubits)
+        self._sdqs_backend.apply_transformation(
+            gate_id, gate_arguments, [self._moved_qubits[qubit] for qubit in qubits], *args
+        )
+
+    def measure_qubits(self, qubits: Sequence[int], *args) -> np.ndarray:
+        """
+        Measures qubits on the backend that holds them.
+
+        :arg[0] => Non-destructive.
+        """
+
+        stim_places = list()
+        sdqs_places = list()
+        for i, qubit in enumerate(qubits):
+            if qubit in self._moved_qubits:
+                sdqs_places.append(i)
+            else:
+                stim_places.append(i)
+
+        results = np.zeros(qubits.__len__(), dtype=int)
+        if stim_places.__len__() > 0:
+            stim_qubits = [qubits[i] for i in stim_places]
+            results[stim_places] = self._stim_backend.measure_qubits(stim_qubits, *args)
+
+            if not (args.__len__() > 0 and args[0]):
+                self._groups.split_qubits(stim_qubits)
+
+        if sdqs_places.__len__() > 0:
+            results[sdqs_places] = self._sdqs_backend.measure_qubits(
+                [self._moved_qubits[qubits[i]] for i in sdqs_places], *args
+            )
+        return results
+
+    def reset_qubits(self, qubits: Sequence[int], *args):
+        """ Reset qubits. Moved qubits are returned to stim tableau. """
+
+        moved = [qubit for qubit in qubits if qubit in self._moved_qubits]
+        if moved.__len__() > 0:
+            self._sdqs_backend.deallocate_qubits([self._moved_qubits.pop(qubit) for qubit in moved])
+            self._groups.add_qubits(moved)
+
+        self._stim_backend.reset_qubits(qubits)
+        self._groups.split_qubits(qubits)
+
+    def generate_ghz_pair(self, size: int, count: int, *args) -> np.ndarray:
+        """ Generates ghz pairs in stim tableau. """
+
+        qubits_frame = self._stim_backend.generate_ghz_pair(size, count)
+        for qubits in qubits_frame:
+            self._groups.add_qubits(qubits)
+            self._groups.merge_groups(qubits)
+        return qubits_frame
+
+    def process_channel_error(self, qubits: Sequence[int], percent: float, *args):
+        """
+        Process channel errors on the backend that holds qubits.
+
+        Args:
+            qubits: Qubits in channel.
+            percent: Percent of channel.
+            args: Backend specific arguments.
+        """
+
+        stim_qubits = [qubit for qubit in qubits if qubit not in self._moved_qubits]
+        sdqs_qubits = [self._moved_qubits[qubit] for qubit in qubits if qubit in self._moved_qubits]
+
+        if stim_qubits.__len__() > 0:
+            self._stim_backend.process_channel_error(stim_qubits, percent)
+        if sdqs_qubits.__len__() > 0:
+            self._sdqs_backend.process_channel_error(sdqs_qubits, percent)
+
+    def apply_serial_transformations(self, list_of_gates: Sequence[List], *args):
+        """
+        Applies list of transformations.
+
+        Args:
+            list_of_gates: List[GateID, GateArgs, List[Qubit]].
+        """
+
+        for gate_instructor in list_of_gates:
+            self.apply_transformation(gate_instructor[0], gate_instructor[1], gate_instructor[2], *args)
+
+    def __move_qubits(self, qubits: Sequence[int]):
+        """
+        Moves entanglement groups of qubits from stim tableau to sdqs backend.
+        Stim slots of moved qubits are reset.
+
+        Args:
+            qubits: List[Qubit ID].
+        """
+
+        for qubit in qubits:
+            if qubit in self._moved_qubits:
+                continue
+
+            group = sorted(self._groups.group_of(qubit))
+            state = self._stim_backend.state_vector(group).astype(complex)
+            state /= np.linalg.norm(state)
+            for stim_qubit, sdqs_qubit in zip(group, self._sdqs_backend.prepare_qubits(state)):
+                self._moved_qubits[stim_qubit] = sdqs_qubit
+
+            self._groups.remove_qubits(group)
+            self._stim_backend.reset_qubits(group)
+            self._moved_count += group.__len__()
+            log("Hybrid backend moves {} qubits to state vector.".format(group.__len__()))
+
+    @property
+    def moved_count(self) -> int:
+        """ Count of qubits that are moved to state vector since start. """
+
+        return self._moved_count
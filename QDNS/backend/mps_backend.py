@@ -0,0 +1,326 @@
+# Copyright (c) 2021, COMU Team, Osman Ceylan and etc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 3. Neither the name of the COMU Team organization nor the
+#    names of its contributors may be used to endorse or promote products
+#    derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDER ''AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from QDNS.backend.sdqs_backend import Register, SdqsBackend, SHIFT_X, SHIFT_Y, SHIFT_Z
+from QDNS.backend.tools import config
+from QDNS.backend.tools import noise
+
+# Maximum bond dimension between two sites, larger bonds are truncated.
+max_bond_dimension = 64
+
+# Singular values below this value are truncated.
+truncation_threshold = 1e-10
+
+
+def change_mps_bond_dimension(new_dimension: int, new_threshold: Optional[float] = None):
+    """
+    Changes maximum bond dimension and truncation threshold of mps backend.
+
+    Args:
+        new_dimension: Maximum bond dimension.
+        new_threshold: Singular values below threshold are truncated, unchanged if None.
+
+    Raises:
+        ValueError: If bond dimension is below 1.
+    """
+
+    if new_dimension < 1:
+        raise ValueError("Bond dimension cannot below 1.")
+
+    global max_bond_dimension, truncation_threshold
+    max_bond_dimension = new_dimension
+    if new_threshold is not None:
+        truncation_threshold = new_threshold
+
+
+# MATRIX PRODUCT REGISTER
+
+class MatrixProductRegister(Register):
+    def __init__(self, dimension: int, qubits: List[int], state: Optional[List[np.ndarray]] = None):
+        """
+        Register holds state of qudits as a matrix product state.
+        Sites are (left bond, dimension, right bond) tensors in order of qubits.
+        Register is kept in mixed canonical form around its center site.
+
+        Args:
+            dimension: Qudit dimension.
+            qubits: Qubit IDs in order of sites.
+            state: Site tensors, qudits are in ground state if None.
+        """
+
+        if state is None:
+            state = list()
+            for _ in qubits:
+                site = np.zeros((1, dimension, 1), dtype=complex)
+                site[0, 0, 0] = complex(1, 0)
+                state.append(site)
+        super(MatrixProductRegister, self).__init__(dimension, qubits, state)
+        self._center = 0
+
+    @classmethod
+    def basis_register(cls, dimension: int, qubit: int, outcome: int) -> "MatrixProductRegister":
+        """
+        Register of a single qudit in a basis state.
+
+        Args:
+            dimension: Qudit dimension.
+            qubit: Qubit ID.
+            outcome: Basis state of qudit.
+
+        Returns:
+            MatrixProductRegister.
+        """
+
+        site = np.zeros((1, dimension, 1), dtype=complex)
+        site[0, outcome, 0] = complex(1, 0)
+        return cls(dimension, [qubit], [site])
+
+    def move_center(self, position: int):
+        """
+        Moves canonical center to position with QR decompositions.
+
+        Args:
+            position: Site index.
+        """
+
+        while self._center < position:
+            site = self._state[self._center]
+            left, dimension, right = site.shape
+            q, r = np.linalg.qr(site.reshape(left * dimension, right))
+            self._state[self._center] = q.reshape(left, dimension, -1)
+            self._state[self._center + 1] = np.tensordot(r, self._state[self._center + 1], axes=(1, 0))
+            self._center += 1
+
+        while self._center > position:
+            site = self._state[self._center]
+            left, dimension, right = site.shape
+            q, r = np.linalg.qr(site.reshape(left, dimension * right).T)
+            self._state[self._center] = q.T.reshape(-1, dimension, right)
+            self._state[self._center - 1] = np.tensordot(self._state[self._center - 1], r.T, axes=(2, 0))
+            self._center -= 1
+
+    def __split_sites(self, position: int, tensor: np.ndarray, count: int):
+        """
+        Splits a tensor of adjacent sites back to sites with truncated SVDs. Center is left at last site.
+
+        Args:
+            position: Index of first site.
+            tensor: Tensor in shape of (left bond, dimension, ..., dimension, right bond).
+            count: Site count in tensor.
+        """
+
+        for i in range(count - 1):
+            left = tensor.shape[0]
+            rest = tensor.shape[2:]
+            u, s, vh = np.linalg.svd(tensor.reshape(left * self._dimension, -1), full_matrices=False)
+
+            keep = max(1, min(max_bond_dimension, int(np.sum(s > truncation_threshold))))
+            u, s, vh = u[:, :keep], s[:keep] / np.linalg.norm(s[:keep]), vh[:keep]
+
+            self._state[position + i] = u.reshape(left, self._dimension, keep)
+            tensor = (s[:, None] * vh).reshape((keep,) + rest)
+
+        self._state[position + count - 1] = tensor
+        self._center = position + count - 1
+
+    def __swap_sites(self, position: int):
+        """
+        Swaps sites at position and position + 1.
+
+        Args:
+            position: Index of left site.
+        """
+
+        self.move_center(position)
+        tensor = np.tensordot(self._state[position], self._state[position + 1], axes=(2, 0))
+        self.__split_sites(position, np.transpose(tensor, (0, 2, 1, 3)), 2)
+        self._qubits[position], self._qubits[position + 1] = self._qubits[position + 1], self._qubits[position]
+
+    def __gather_qubits(self, qubits: Sequence[int]) -> int:
+        """
+        Moves qubits next to each other in given order with swaps.
+
+        Args:
+            qubits: List[Qubit ID].
+
+        Returns:
+            Index of first site.
+        """
+
+        for i in range(1, qubits.__len__()):
+            while self._qubits.index(qubits[i]) != self._qubits.index(qubits[i - 1]) + 1:
+                position = self._qubits.index(qubits[i])
+                if position > self._qubits.index(qubits[i - 1]):
+                    self.__swap_sites(position - 1)
+                else:
+                    self.__swap_sites(position)
+
+        return self._qubits.index(qubits[0])
+
+    def merge_register(self, other: "MatrixProductRegister"):
+        """
+        Merges state of other register to back of this register.
+
+        Args:
+            other: Register to merge.
+
+        Raises:
+            ValueError: If dimensions of registers are different.
+        """
+
+        if other.dimension != self._dimension:
+            raise ValueError("Registers of different dimensions can not be merged. {} != {}.".format(self._dimension, other.dimension))
+
+        # Normalized last site on a bond of one is left canonical, center moves to first site of other.
+        self.move_center(self.qubit_count - 1)
+        other.move_center(0)
+
+        self._center = self.qubit_count
+        self._state.extend(other.state)
+        self._qubits.extend(other.qubits)
+
+    def apply_matrix(self, matrix: np.ndarray, qubits: Sequence[int]):
+        """
+        Applies matrix to qubits of register. Qubits are moved next to each other for multi qubit gates.
+
+        Args:
+            matrix: Operator matrix.
+            qubits: List[Qubit ID].
+        """
+
+        count = qubits.__len__()
+        if count == 1:
+            position = self._qubits.index(qubits[0])
+            self._state[position] = np.einsum("ij,ajb->aib", matrix, self._state[position])
+            return
+
+        position = self.__gather_qubits(qubits)
+        self.move_center(position)
+
+        tensor = self._state[position]
+        for i in range(1, count):
+            tensor = np.tensordot(tensor, self._state[position + i], axes=(tensor.ndim - 1, 0))
+
+        operator = np.asarray(matrix).reshape((self._dimension,) * (2 * count))
+        tensor = np.tensordot(operator, tensor, axes=(list(range(count, 2 * count)), list(range(1, count + 1))))
+        tensor = np.moveaxis(tensor, [count, count + 1], [0, count + 1])
+        self.__split_sites(position, tensor, count)
+
+    def shift_qubit(self, qubit: int, operation: str):
+        """
+        Applies a generalized pauli shift to qubit. Qudits are shifted by a random power.
+
+        Args:
+            qubit: Qubit ID.
+            operation: One of SHIFT_X, SHIFT_Y and SHIFT_Z.
+        """
+
+        position = self._qubits.index(qubit)
+        power = 1
+        if self._dimension > 2:
+            power = np.random.randint(1, self._dimension)
+
+        if operation == SHIFT_X or operation == SHIFT_Y:
+            self._state[position] = np.roll(self._state[position], power, axis=1)
+
+        if operation == SHIFT_Z or operation == SHIFT_Y:
+            phases = np.exp(2j * np.pi * power * np.arange(self._dimension) / self._dimension)
+            self._state[position] = self._state[position] * phases.reshape(1, self._dimension, 1)
+
+    def measure_qubit(self, qubit: int) -> int:
+        """
+        Measures qubit and removes its site from register.
+
+        Args:
+            qubit: Qubit ID.
+
+        Returns:
+            Outcome.
+        """
+
+        position = self._qubits.index(qubit)
+        self.move_center(position)
+
+        site = self._state[position]
+        probabilities = np.sum(np.abs(site) ** 2, axis=(0, 2))
+        outcome = int(np.random.choice(self._dimension, p=probabilities / probabilities.sum()))
+        matrix = site[:, outcome, :] / np.sqrt(probabilities[outcome])
+
+        # Projected site is absorbed to a neighbour, which becomes the center.
+        if self.qubit_count > 1:
+            if position > 0:
+                self._state[position - 1] = np.tensordot(self._state[position - 1], matrix, axes=(2, 0))
+                self._center = position - 1
+            else:
+                self._state[position + 1] = np.tensordot(matrix, self._state[position + 1], axes=(1, 0))
+                self._center = 0
+
+        self._state.pop(position)
+        self._qubits.pop(position)
+        return outcome
+
+    def sample_qubits(self, qubits: Sequence[int]) -> List[int]:
+        """
+        Samples outcome of qubits without changing the state, qubits are measured one by one on a copy of register.
+
+        Args:
+            qubits: List[Qubit ID].
+
+        Returns:
+            List[int].
+        """
+
+        copy = MatrixProductRegister(self._dimension, list(self._qubits), list(self._state))
+        copy._center = self._center
+        return [copy.measure_qubit(qubit) for qubit in qubits]
+
+    @property
+    def bond_dimensions(self) -> List[int]:
+        return [site.shape[2] for site in self._state[:-1]]
+
+
+# MATRIX PRODUCT STATE BACKEND
+
+class MatrixProductStateBackend(SdqsBackend):
+    # Register type that holds states of qudits.
+    register_type = MatrixProductRegister
+
+    def __init__(
+            self, configuration: config.BackendConfiguration,
+            noise_pattern: noise.NoisePattern) -> None:
+        """
+        Matrix Product State Backend. Memory of entangled qubits grows linearly with their count for bounded bonds.
+        Bonds are truncated by max_bond_dimension and truncation_threshold.
+
+        Args:
+            configuration: Mps backend configuration.
+            noise_pattern: Noise pattern for simulation.
+        """
+
+        super().__init__(configuration, noise_pattern)
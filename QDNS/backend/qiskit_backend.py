@@ -33,6 +33,7 @@ import numpy as np
 from QDNS.backend.tools import config
 from QDNS.backend.tools import noise
 from QDNS.backend.tools.backend import Backend
+from QDNS.backend.tools.state_vector import sample_qubits
 from QDNS.backend.tools.virt_qubit import VirtQudit
 from QDNS.tools import gates
 from QDNS.tools.various_tools import dev_mode
@@ -51,13 +52,19 @@ def log(message: str):
 # Check if avaible
 try:
     import qiskit
-    from qiskit.circuit import library
+    from qiskit.circuit import library, Qubit
     from qiskit import QuantumCircuit
+    from qiskit.exceptions import QiskitError
+    from qiskit.quantum_info import Operator, Statevector
 except ImportError:
     qiskit = None
     selected_simulator = None
     library = None
     QuantumCircuit = object
+    QiskitError = Exception
+    Operator = None
+    Statevector = None
+    Qubit = None
 else:
     simulator_string = "aer_simulator_statevector"
     aer_vector_simulator = qiskit.Aer.get_backend(simulator_string)
@@ -98,6 +105,7 @@ class ProcessMessages:
         RESET_QUBITS = ("reset qubits operation message", False)
         APPLY_SERIAL_GATE = ("apply serial gate operation message", False)
         APPLY_CHANNEL_ERROR = ("apply channel error operation message", False)
+        RESET_BACKEND = ("reset backend operation message", True)
 
     class Respond:
         """
@@ -114,6 +122,7 @@ class ProcessMessages:
         RESET_QUBIT_DONE = "reset qubits operation done"
         APPLY_SERIAL_GATE_DONE = "apply serial gate operation done"
         APPLY_CHANNEL_ERROR_DONE = "apply channel error operation done"
+        RESET_BACKEND_DONE = "reset backend operation done"
 
 
 # NOISE CHANNELS
@@ -252,6 +261,79 @@ def get_channel_gate(flag: str) -> Union[Type[BitFlipChannel], Type[PhaseFlipCha
         raise ValueError("Expected known channel error flag from tools, but {}.".format(flag))
 
 
+# OPERATOR CACHES
+
+# Maximum object count of each cache.
+max_cached_objects = 4096
+
+# (Gate ID, Gate Args, Qubit Count) -> Operator or transpiled circuit.
+operation_cache: Dict[Tuple[int, Tuple, int], Union["Operator", "QuantumCircuit"]] = dict()
+
+# Channel gate class -> Operator.
+channel_operator_cache: Dict[type, "Operator"] = dict()
+
+
+def get_qiskit_operation(gate_id: int, gate_arguments: Sequence, qubit_count: int) -> Union["Operator", "QuantumCircuit"]:
+    """
+    Gets operator of a gate in tools.gates from cache or builds it.
+    Gates that can not be converted to an operator are transpiled once for selected simulator.
+
+    Args:
+        gate_id: Gate ID.
+        gate_arguments: Gate constructor args.
+        qubit_count: Qubit count that gate is applied to.
+
+    Returns:
+        Qiskit operator or transpiled circuit of gate.
+
+    Raises:
+        ArithmeticError: If qubit count does not match with gate.
+    """
+
+    try:
+        key = (gate_id, tuple(gate_arguments), qubit_count)
+        return operation_cache[key]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable gate arguments are not cached.
+        key = None
+
+    gate = gates.gate_id_to_gate[gate_id](*gate_arguments)
+    if gate.qubit_shape != qubit_count:
+        raise ArithmeticError("Qubit count must be match with gate. {} != {}.".format(gate.qubit_shape, qubit_count))
+
+    gate = gate.get_qiskit_gate()
+    try:
+        operation = Operator(gate)
+    except QiskitError:
+        circuit = QuantumCircuit(qubit_count)
+        circuit.append(gate, list(range(qubit_count)), [])
+        operation = qiskit.transpile(circuit, selected_simulator)
+
+    if key is not None and operation_cache.__len__() < max_cached_objects:
+        operation_cache[key] = operation
+    return operation
+
+
+def get_channel_operator(gate_class: type) -> "Operator":
+    """
+    Gets operator of a channel gate class from cache or builds it.
+
+    Args:
+        gate_class: Qiskit gate class from channel.
+
+    Returns:
+        Qiskit operator.
+    """
+
+    try:
+        return channel_operator_cache[gate_class]
+    except KeyError:
+        channel_operator_cache[gate_class] = Operator(gate_class())
+        return channel_operator_cache[gate_class]
+
+
 # QUBIT POINTER
 
 
@@ -260,37 +342,15 @@ class VirtQudit(VirtQudit):
     Virtual qudit template.
 
     #
-    #  [PID]    [CH_IND]      [INDEX]
-    #    |       00000          00
-    #    |         |             |
-    #    P       CHUNK           |
-    #    0       00000          00
+    #  [PID]   [CHUNK]   [INDEX]
+    #    8       24        16     bits
     #
     # Template supports pointing:
-    #   Max 9 Process, 99999 circuit, 99 qubit in a circuit.
+    #   Max 255 Process, 2^^24 circuit, 2^^16 qubit in a circuit.
     #
     """
 
-    pid_length = 1
-    chunk_length = 5
-    qubit_length = 2
-
-    @staticmethod
-    def qubit_id_resolver(qubit_id: str):
-        """
-        Qubit ID resolve from string.
-        Returns pid, chunk_id, qubit_id
-        """
-
-        return qubit_id[0:1], qubit_id[1:6], qubit_id[6:8]
-
-    @staticmethod
-    def generate_pointer(pid: int, chunk_value: int, index: int) -> str:
-        """
-        Qubit ID Generator.
-        """
-
-        return "{:01d}{:05d}{:02d}".format(pid, chunk_value, index)
+    fields = (("pid", 8), ("chunk", 24), ("index", 16))
 
 
 # CIRCUIT CHUNK
@@ -319,32 +379,55 @@ class Chunk(QuantumCircuit):
 
         super().__init__(qubit_count, qubit_count)
 
+        self._circuit_state = Statevector.from_int(0, 2 ** self.num_qubits)
         self.scramble_qubits(
             (), self._noise_pattern.state_prepare_error_channel,
             self._noise_pattern.state_prepare_error_probability, _all=True
         )
-        self.iterate_circuit()
 
     def iterate_circuit(self):
-        """ Iterates / Flush circuit of chunk. """
+        """
+        Iterates / Flush circuit of chunk.
+        Circuit only keeps operations that can not be applied on state directly and they are already transpiled.
+        """
+
+        circ = QuantumCircuit(self.num_qubits, self.num_clbits)
+        circ.set_statevector(self._circuit_state)
+        circ.compose(self, inplace=True)
+        circ.save_statevector()
 
-        self.save_statevector()
-        circ = qiskit.transpile(self, aer_vector_simulator)
-        res = simulator.run(circ, shots=1, memory=True).result()
-        self._circuit_state = res.get_statevector(self)
+        res = selected_simulator.run(circ, shots=1).result()
+        self._circuit_state = Statevector(res.get_statevector(circ))
 
         self.data.clear()
-        self.set_statevector(self._circuit_state)
         return res
 
+    def flush_circuit(self):
+        """ Iterates circuit if it has operations that are not applied to state. """
+
+        if self.data.__len__() > 0:
+            self.iterate_circuit()
+
+    def evolve_state(self, operator, qubits: Sequence[int]):
+        """
+        Applies operator to live state of chunk.
+
+        Args:
+            operator: Qiskit Operator.
+            qubits: List[int].
+        """
+
+        self.flush_circuit()
+        self._circuit_state = self._circuit_state.evolve(operator, qargs=list(qubits))
+
     def deallocate_chunk(self):
         """ Hard reset the circuit. """
 
         self.data.clear()
-        self._circuit_state = None
         for _ in range(self._extended_count):
-            self.qubits.pop()
+            del self._qubit_indices[self.qubits.pop()]
         self._extended_count = 0
+        self._circuit_state = Statevector.from_int(0, 2 ** self.num_qubits)
 
         self.scramble_qubits(
             (), self._noise_pattern.state_prepare_error_channel,
@@ -369,7 +452,13 @@ class Chunk(QuantumCircuit):
         channel = get_channel_gate(method)(percent)
         for qubit in qubits:
             for ch in channel.get_gates():
-                self.append(ch(), [qubit], [])
+                if ch is library.IGate:
+                    continue
+                elif ch is library.Reset:
+                    self.flush_circuit()
+                    self._circuit_state = self._circuit_state.reset([int(qubit)])
+                else:
+                    self.evolve_state(get_channel_operator(ch), [int(qubit)])
 
     def extend_chunk(self, size: int):
         """
@@ -381,21 +470,41 @@ class Chunk(QuantumCircuit):
 
         Returns:
             List[int]
+
+        Raises:
+            AttributeError: If chunk is not allocated.
         """
 
-        pass
+        if not self._allocated:
+            raise AttributeError("Chunk {} is not allocated.".format(self._index))
+
+        # New qubits are in ground state and take highest indexes of state.
+        self.flush_circuit()
+        position = self.num_qubits
+        self.add_bits([Qubit() for _ in range(size)])
+        self._circuit_state = self._circuit_state.expand(Statevector.from_int(0, 2 ** size))
+        self._extended_count += size
+
+        self.scramble_qubits(
+            np.arange(position, position + size), self._noise_pattern.state_prepare_error_channel,
+            self._noise_pattern.state_prepare_error_probability, _all=False
+        )
+        return np.arange(position, position + size)
 
     def apply_transformation(self, gate, qubits: Sequence[int], iterate=False):
         """
         Applies gate to qubits on chunk.
 
         Args:
-            gate: Qiskit Gate or operator or circuit.
+            gate: Qiskit Operator or transpiled circuit.
             qubits: List[int].
             iterate: Iterate circuit.
         """
 
-        self.append(gate, qubits, [])
+        if isinstance(gate, Operator):
+            self.evolve_state(gate, qubits)
+        else:
+            self.compose(gate, qubits=list(qubits), inplace=True)
 
         self.scramble_qubits(
             qubits, self._noise_pattern.gate_error_channel,
@@ -403,7 +512,7 @@ class Chunk(QuantumCircuit):
         )
 
         if iterate:
-            self.iterate_circuit()
+            self.flush_circuit()
 
     def measure_qubits(self, qubits: Sequence[int], non_destructive=False):
         """
@@ -417,25 +526,24 @@ class Chunk(QuantumCircuit):
              List[int]
         """
 
-        old_state = deepcopy(self._circuit_state)
-        if not non_destructive:
-            self.scramble_qubits(
-                qubits, self._noise_pattern.measure_error_channel,
-                self._noise_pattern.measure_error_probability, _all=False
-            )
-        self.measure(qubits, qubits)
-        if not non_destructive:
-            self.scramble_qubits(qubits, self._noise_pattern.scramble_channel, 0.75, _all=False)
-
+        # Non-destructive measurement samples from marginal probabilities and keeps the state.
         if non_destructive:
-            self._circuit_state = old_state
+            self.flush_circuit()
+            return sample_qubits(self._circuit_state.data, qubits, little_endian=True)
 
-        to_return = list()
-        results = [int(i) for i in self.iterate_circuit().get_memory()[0]][::-1]
+        self.scramble_qubits(
+            qubits, self._noise_pattern.measure_error_channel,
+            self._noise_pattern.measure_error_probability, _all=False
+        )
+        self.flush_circuit()
+
+        # Each qubit is measured once, outcomes are returned in order of given qubits.
+        qargs = sorted(set(int(qubit) for qubit in qubits))
+        outcome, self._circuit_state = self._circuit_state.measure(qargs)
+        outcomes = dict(zip(qargs, [int(i) for i in outcome][::-1]))
+        to_return = [outcomes[int(qubit)] for qubit in qubits]
 
-        for i, res in enumerate(results):
-            if i in qubits:
-                to_return.append(res)
+        self.scramble_qubits(qubits, self._noise_pattern.scramble_channel, 0.75, _all=False)
         return to_return
 
     def reset_qubits(self, qubits: Sequence[int], no_error=False):
@@ -447,8 +555,8 @@ class Chunk(QuantumCircuit):
             no_error: Apply spam error flag.
         """
 
-        for qubit in qubits:
-            self.append(library.Reset(), [qubit], [])
+        self.flush_circuit()
+        self._circuit_state = self._circuit_state.reset([int(qubit) for qubit in qubits])
 
         if not no_error:
             self.scramble_qubits(
@@ -463,7 +571,7 @@ class Chunk(QuantumCircuit):
 
     @property
     def circuit_state(self) -> np.ndarray:
-        return self._circuit_state
+        return self._circuit_state.data
 
     @property
     def allocated(self) -> bool:
@@ -503,12 +611,8 @@ class QiskitBackendSlave(object):
                 left_side = 0
                 for value in self._configuretion.frame_config[dim]:
                     for i in range(self._configuretion.frame_config[dim][value]):
-                        key = int("{:0{}d}".format(
-                            i + left_side, VirtQudit.chunk_length)
-                        )
-                        self._int_to_static_chunks[key] = Chunk(
-                            int("{:0{}d}".format(i + left_side, VirtQudit.chunk_length)),
-                            value, self._noise_pattern, allocated=False
+                        self._int_to_static_chunks[i + left_side] = Chunk(
+                            i + left_side, value, self._noise_pattern, allocated=False
                         )
                     left_side += self._configuretion.frame_config[dim][value]
             else:
@@ -521,7 +625,14 @@ class QiskitBackendSlave(object):
             self._int_to_static_chunks[chunk_index].deallocate_chunk()
         del self._int_to_static_chunks
 
-    def allocate_qframes(self, frame_size: int, frame_count: int) -> List[List[str]]:
+    def reset_slave(self):
+        """ Deallocates all allocated chunks. Chunks are kept for next simulation. """
+
+        for chunk_index in self._int_to_static_chunks:
+            if self._int_to_static_chunks[chunk_index].allocated:
+                self._int_to_static_chunks[chunk_index].deallocate_chunk()
+
+    def allocate_qframes(self, frame_size: int, frame_count: int) -> List[List[int]]:
         """
         Allocates a qframe.
 
@@ -534,14 +645,7 @@ class QiskitBackendSlave(object):
         """
 
         to_return = list()
-        low = int("{:0{}d}".format(0, VirtQudit.chunk_length))
-        high = int("{:0{}d}".format(
-            int("9" * VirtQudit.chunk_length),
-            VirtQudit.chunk_length
-        ))
-
-        for i in range(low, high):
-            current = self._int_to_static_chunks[i]
+        for current in self._int_to_static_chunks.values():
             if not current.allocated and current.num_qubits == frame_size:
                 to_return.append([
                     VirtQudit.generate_pointer(
@@ -559,7 +663,7 @@ class QiskitBackendSlave(object):
 
         return to_return
 
-    def deallocate_chunks(self, qubits: Sequence[str]):
+    def deallocate_chunks(self, qubits: Sequence[int]):
         """
         Deallocates the qubits.
 
@@ -569,11 +673,11 @@ class QiskitBackendSlave(object):
 
         for qubit in qubits:
             _, chunk_val, _ = VirtQudit.qubit_id_resolver(qubit)
-            chunk_index = int(chunk_val)
+            chunk_index = chunk_val
             if self._int_to_static_chunks[chunk_index].allocated:
                 self._int_to_static_chunks[chunk_index].deallocate_chunk()
 
-    def extend_chunk(self, qubit: str, size: int):
+    def extend_chunk(self, qubit: int, size: int):
         """
         Extends a circut by size from back.
 
@@ -585,9 +689,18 @@ class QiskitBackendSlave(object):
             List[QubitID].
         """
 
-        pass
+        _, chunk_index, _ = VirtQudit.qubit_id_resolver(qubit)
+        chunk = self._int_to_static_chunks[chunk_index]
+
+        if not chunk.allocated:
+            raise AttributeError("Chunk {} is not allocated. Extend chunk is failed.".format(chunk.index))
+
+        return_list = list()
+        for index in chunk.extend_chunk(size):
+            return_list.append(VirtQudit.generate_pointer(self.pid, chunk.index, index))
+        return return_list
 
-    def apply_transformation(self, gate_id: int, gate_arguments: Sequence, qubits: Sequence[str]):
+    def apply_transformation(self, gate_id: int, gate_arguments: Sequence, qubits: Sequence[int]):
         """
         Applies transformation on qubits.
 
@@ -599,25 +712,22 @@ class QiskitBackendSlave(object):
 
         indexes = list()
         _, chunk_index, qubit_index = VirtQudit.qubit_id_resolver(qubits[0])
-        chunk = self._int_to_static_chunks[int(chunk_index)]
-        indexes.append(int(qubit_index))
+        chunk = self._int_to_static_chunks[chunk_index]
+        indexes.append(qubit_index)
 
         if not chunk.allocated:
             raise AttributeError("Chunk {} is not allocated. Apply transformation is failed.".format(chunk.index))
 
         for i in range(1, qubits.__len__()):
             _, chunk_index, qubit_index = VirtQudit.qubit_id_resolver(qubits[i])
-            if self._int_to_static_chunks[int(chunk_index)] != chunk:
+            if self._int_to_static_chunks[chunk_index] != chunk:
                 raise OverflowError("Qubits must be in same circuit for transformation.")
-            indexes.append(int(qubit_index))
+            indexes.append(qubit_index)
 
-        gate = gates.gate_id_to_gate[gate_id](*gate_arguments)
-        if gate.qubit_shape != qubits.__len__():
-            raise ArithmeticError("Qubit count must be match with gate. {} != {}.".format(gate.qubit_shape, qubits.__len__()))
+        gate = get_qiskit_operation(gate_id, gate_arguments, qubits.__len__())
+        chunk.apply_transformation(gate, indexes, iterate=False)
 
-        chunk.apply_transformation(gate.get_qiskit_gate(), indexes, iterate=False)
-
-    def measure_qubits(self, qubits: Sequence[str], non_destructive=False):
+    def measure_qubits(self, qubits: Sequence[int], non_destructive=False):
         """
         Measure Qubits.
 
@@ -629,24 +739,29 @@ class QiskitBackendSlave(object):
              List[int]
         """
 
-        results = list()
+        results = np.zeros(qubits.__len__(), dtype=int)
         chunks: Dict[int, List[int]] = dict()
+        placement: Dict[int, List[int]] = dict()
 
-        for qubit in qubits:
+        for i, qubit in enumerate(qubits):
             _, chunk_val, index = VirtQudit.qubit_id_resolver(qubit)
-            key = int(chunk_val)
+            key = chunk_val
 
             try:
-                chunks[key].append(int(index))
+                chunks[key].append(index)
+                placement[key].append(i)
             except KeyError:
                 chunks[key] = list()
-                chunks[key].append(int(index))
+                chunks[key].append(index)
+                placement[key] = list()
+                placement[key].append(i)
 
+        # Results are scattered back to the order of given qubits.
         for chunk in chunks:
             result = self._int_to_static_chunks[chunk].measure_qubits(
                 chunks[chunk], non_destructive=non_destructive
             )
-            results.extend(result)
+            results[placement[chunk]] = result
         return results
 
     def reset_qubits(self, qubits):
@@ -661,8 +776,8 @@ class QiskitBackendSlave(object):
 
         for qubit in qubits:
             pid, chunk_val, index = VirtQudit.qubit_id_resolver(qubit)
-            qid = int(index)
-            key = int(chunk_val)
+            qid = index
+            key = chunk_val
 
             try:
                 chunks[key].append(qid)
@@ -693,8 +808,8 @@ class QiskitBackendSlave(object):
 
         for qubit in qubits:
             pid, chunk_index, qubit_index = VirtQudit.qubit_id_resolver(qubit)
-            qid = int(qubit_index)
-            key = int(chunk_index)
+            qid = qubit_index
+            key = chunk_index
 
             try:
                 chunks[key].append(qid)
@@ -808,8 +923,13 @@ class QiskitBackendSlave(object):
                 log("Process-{}: Deallocate Frame ({}) -> {} ... {}".format(pid_index, qubits.__len__(), qubits[0], qubits[-1]))
 
             elif command == ProcessMessages.Request.EXTEND_CIRCUIT[0]:
+                qubit = message[0]
+                size = message[1]
+                qubits = cb.extend_chunk(qubit, size)
+
                 if report:
-                    put_message(ProcessMessages.Respond.EXTEND_CIRCUIT_DONE, [0])
+                    put_message(ProcessMessages.Respond.EXTEND_CIRCUIT_DONE, qubits)
+                log("Process-{}: Extend circuit ({}) -> {} ... {}".format(pid_index, qubits.__len__(), qubits[0], qubits[-1]))
 
             elif command == ProcessMessages.Request.APPLY_GATE[0]:
                 gate_id = message[0]
@@ -850,6 +970,13 @@ class QiskitBackendSlave(object):
                     put_message(ProcessMessages.Respond.APPLY_CHANNEL_ERROR_DONE, 0)
                 log("Process-{}: Processes channel error to count of ({})".format(pid_index, qubits.__len__()))
 
+            elif command == ProcessMessages.Request.RESET_BACKEND[0]:
+                cb.reset_slave()
+
+                if report:
+                    put_message(ProcessMessages.Respond.RESET_BACKEND_DONE, 0)
+                log("Process-{}: Reset all chunks".format(pid_index))
+
             elif command == ProcessMessages.Request.APPLY_SERIAL_GATE[0]:
                 gate_list = message[0]
                 count = 0
@@ -900,7 +1027,7 @@ class QiskitBackend(Backend):
             self.process_to_queue[p] = q
             self.queue_to_process[q] = p
 
-        self._allocate_memory: Dict[int, List[str]] = dict()
+        self._allocate_memory: Dict[int, List[int]] = dict()
         self.start_backend()
 
     def put_message(self, process: multiprocessing.Process, command: Tuple[str, bool], *message):
@@ -959,6 +1086,23 @@ class QiskitBackend(Backend):
         self.income_queue = None
         log("Qiskit backend master terminated.")
 
+    def reset_backend(self):
+        """ Deallocates all chunks on slaves. Slave processes keep running. """
+
+        for process in self.processes:
+            self.put_message(process, ProcessMessages.Request.RESET_BACKEND)
+
+        if ProcessMessages.Request.RESET_BACKEND[1]:
+            for _ in self.processes:
+                pid, command, message = self.income_queue.get()
+                if command != ProcessMessages.Respond.RESET_BACKEND_DONE:
+                    raise ValueError("Qiskit master backend expected reset done message but got {}.".format(command))
+
+        for process in self.processes:
+            self.process_to_frame[process] = deepcopy(self.configuration.frame_config)
+        self._allocate_memory.clear()
+        log("Qiskit backend master is reset.")
+
     def figure_allocation(self, frame_size: int, frame_count: int, dimension=2) -> Dict[multiprocessing.Process, int]:
         """
         Figures allocation places.
@@ -1004,7 +1148,7 @@ class QiskitBackend(Backend):
         log("Qiskit master calculates {}x{} qframes allocation.".format(org_frame_count, frame_size))
         return process_to_size
 
-    def figure_deallocation(self, qubits: Sequence[str]):
+    def figure_deallocation(self, qubits: Sequence[int]):
         """
         Figures the deallocation.
 
@@ -1019,13 +1163,13 @@ class QiskitBackend(Backend):
         deleted_chunks = list()
         for qubit in qubits:
             pid, chunk_val, index = VirtQudit.qubit_id_resolver(qubit)
-            chunk_pointer = pid + chunk_val
+            chunk_pointer = (pid, chunk_val)
 
             qubit_found = False
             for frame_size in self._allocate_memory:
                 if qubit in self._allocate_memory[frame_size]:
                     if chunk_pointer not in deleted_chunks:
-                        self.process_to_frame[self.processes[int(pid) - 1]][2][frame_size] += 1
+                        self.process_to_frame[self.processes[pid - 1]][2][frame_size] += 1
                         deleted_chunks.append(chunk_pointer)
                     self._allocate_memory[frame_size].remove(qubit)
                     qubit_found = True
@@ -1041,7 +1185,7 @@ class QiskitBackend(Backend):
 
         return self.allocate_qframes(count, 1, *args)[0]
 
-    def allocate_qframes(self, frame_size: int, frame_count: int, *args) -> List[List[str]]:
+    def allocate_qframes(self, frame_size: int, frame_count: int, *args) -> List[List[int]]:
         """
         Allocates a qframe.
 
@@ -1086,7 +1230,7 @@ class QiskitBackend(Backend):
                 .format(qubits.__len__(), qubits[0].__len__(), process_to_frame.__len__()))
         return qubits
 
-    def deallocate_qubits(self, qubits: Sequence[str]):
+    def deallocate_qubits(self, qubits: Sequence[int]):
         """
         Deallocates qubits.
 
@@ -1094,16 +1238,16 @@ class QiskitBackend(Backend):
             qubits: List[Qubit ID]
         """
 
-        process_to_qubits: Dict[multiprocessing.Process, List[str]] = dict()
+        process_to_qubits: Dict[multiprocessing.Process, List[int]] = dict()
         for qubit in qubits:
             pid, _, _ = VirtQudit.qubit_id_resolver(qubit)
 
             try:
-                _ = process_to_qubits[self.processes[int(pid) - 1]]
+                _ = process_to_qubits[self.processes[pid - 1]]
             except KeyError:
-                process_to_qubits[self.processes[int(pid) - 1]] = list()
+                process_to_qubits[self.processes[pid - 1]] = list()
 
-            process_to_qubits[self.processes[int(pid) - 1]].append(qubit)
+            process_to_qubits[self.processes[pid - 1]].append(qubit)
 
         for process in process_to_qubits:
             self.put_message(
@@ -1121,7 +1265,7 @@ class QiskitBackend(Backend):
 
         return self.figure_deallocation(qubits)
 
-    def extend_circuit(self, qubit: str, size: int):
+    def extend_circuit(self, qubit: int, size: int):
         """
         Extend circuit by size from back.
 
@@ -1134,7 +1278,7 @@ class QiskitBackend(Backend):
         """
 
         pid, chunk_value, index = VirtQudit.qubit_id_resolver(qubit)
-        process = self.processes[int(pid) - 1]
+        process = self.processes[pid - 1]
         self.put_message(
             process,
             ProcessMessages.Request.EXTEND_CIRCUIT,
@@ -1149,7 +1293,7 @@ class QiskitBackend(Backend):
             results.extend(message)
         return results
 
-    def apply_transformation(self, gate_id, gate_arguments, qubits: Sequence[str], *args):
+    def apply_transformation(self, gate_id, gate_arguments, qubits: Sequence[int], *args):
         """
         Applies transformation on qubits.
 
@@ -1159,16 +1303,16 @@ class QiskitBackend(Backend):
             qubits: Qubits.
         """
 
-        process_to_chunks: Dict[multiprocessing.Process, List[str]] = dict()
+        process_to_chunks: Dict[multiprocessing.Process, List[int]] = dict()
         for qubit in qubits:
             pid, chunk_value, index = VirtQudit.qubit_id_resolver(qubit)
 
             try:
-                _ = process_to_chunks[self.processes[int(pid) - 1]]
+                _ = process_to_chunks[self.processes[pid - 1]]
             except KeyError:
-                process_to_chunks[self.processes[int(pid) - 1]] = list()
+                process_to_chunks[self.processes[pid - 1]] = list()
 
-            process_to_chunks[self.processes[int(pid) - 1]].append(qubit)
+            process_to_chunks[self.processes[pid - 1]].append(qubit)
 
         if process_to_chunks.keys().__len__() != 1:
             raise OverflowError("Cannot apply gate_id: {}! Qubits are in different chunks.".format(gate_id))
@@ -1191,7 +1335,7 @@ class QiskitBackend(Backend):
                 if command != ProcessMessages.Respond.APPLY_GATE_DONE:
                     raise ValueError("Qiskit master backend expected apply gate done message but got {}.".format(command))
 
-    def measure_qubits(self, qubits: Sequence[str], *args):
+    def measure_qubits(self, qubits: Sequence[int], *args):
         """
         Measures qubits.
 
@@ -1206,22 +1350,22 @@ class QiskitBackend(Backend):
         """
 
         placement: Dict[int, List[int]] = dict()
-        process_to_chunks: Dict[multiprocessing.Process, List[str]] = dict()
+        process_to_chunks: Dict[multiprocessing.Process, List[int]] = dict()
         for i, qubit in enumerate(qubits):
             pid, chunk_value, index = VirtQudit.qubit_id_resolver(qubit)
 
             try:
-                _ = process_to_chunks[self.processes[int(pid) - 1]]
+                _ = process_to_chunks[self.processes[pid - 1]]
             except KeyError:
-                process_to_chunks[self.processes[int(pid) - 1]] = list()
+                process_to_chunks[self.processes[pid - 1]] = list()
 
-            process_to_chunks[self.processes[int(pid) - 1]].append(qubit)
+            process_to_chunks[self.processes[pid - 1]].append(qubit)
 
             try:
-                _ = placement[int(pid) - 1]
+                _ = placement[pid - 1]
             except KeyError:
-                placement[int(pid) - 1] = list()
-            placement[int(pid) - 1].append(i)
+                placement[pid - 1] = list()
+            placement[pid - 1].append(i)
 
         for process in process_to_chunks:
             self.put_message(
@@ -1241,7 +1385,7 @@ class QiskitBackend(Backend):
                     results[placement[pid - 1][i]] = result
         return results
 
-    def reset_qubits(self, qubits: Sequence[str]):
+    def reset_qubits(self, qubits: Sequence[int]):
         """
         Reset Qubits.
 
@@ -1249,16 +1393,16 @@ class QiskitBackend(Backend):
             qubits: List[Qubit ID]
         """
 
-        process_to_chunks: Dict[multiprocessing.Process, List[str]] = dict()
+        process_to_chunks: Dict[multiprocessing.Process, List[int]] = dict()
         for qubit in qubits:
             pid, chunk_value, index = VirtQudit.qubit_id_resolver(qubit)
 
             try:
-                _ = process_to_chunks[self.processes[int(pid) - 1]]
+                _ = process_to_chunks[self.processes[pid - 1]]
             except KeyError:
-                process_to_chunks[self.processes[int(pid) - 1]] = list()
+                process_to_chunks[self.processes[pid - 1]] = list()
 
-            process_to_chunks[self.processes[int(pid) - 1]].append(qubit)
+            process_to_chunks[self.processes[pid - 1]].append(qubit)
 
         for process in process_to_chunks:
             self.put_message(
@@ -1305,16 +1449,16 @@ class QiskitBackend(Backend):
             percent: Error percent.
         """
 
-        process_to_chunks: Dict[multiprocessing.Process, List[str]] = dict()
+        process_to_chunks: Dict[multiprocessing.Process, List[int]] = dict()
         for qubit in qubits:
             pid, chunk_value, index = VirtQudit.qubit_id_resolver(qubit)
 
             try:
-                _ = process_to_chunks[self.processes[int(pid) - 1]]
+                _ = process_to_chunks[self.processes[pid - 1]]
             except KeyError:
-                process_to_chunks[self.processes[int(pid) - 1]] = list()
+                process_to_chunks[self.processes[pid - 1]] = list()
 
-            process_to_chunks[self.processes[int(pid) - 1]].append(qubit)
+            process_to_chunks[self.processes[pid - 1]].append(qubit)
 
         for process in process_to_chunks:
             self.put_message(
@@ -1343,12 +1487,17 @@ class QiskitBackend(Backend):
             gate_id, gate_args, qubits = gate_instructor[0], gate_instructor[1], gate_instructor[2]
             pid, chunk_val, index = VirtQudit.qubit_id_resolver(qubits[0])
 
+            # Slave cannot apply a gate between processes, check before any gate is sent.
+            for qubit in qubits[1:]:
+                if VirtQudit.qubit_id_resolver(qubit)[0] != pid:
+                    raise OverflowError("Cannot apply gate_id: {}! Qubits are in different backend processes.".format(gate_id))
+
             try:
-                _ = process_to_chunks[self.processes[int(pid) - 1]]
+                _ = process_to_chunks[self.processes[pid - 1]]
             except KeyError:
-                process_to_chunks[self.processes[int(pid) - 1]] = list()
+                process_to_chunks[self.processes[pid - 1]] = list()
 
-            process_to_chunks[self.processes[int(pid) - 1]].append([gate_id, gate_args, qubits])
+            process_to_chunks[self.processes[pid - 1]].append([gate_id, gate_args, qubits])
 
         for process in process_to_chunks:
             self.put_message(
@@ -23,8 +23,825 @@
 # ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+from typing import List, Dict, Optional, Tuple, Sequence, Union, Type
 
+import numpy as np
 
-# Removed temporary.
-class SdqsBackend:
-    pass
+from QDNS.backend.tools import config
+from QDNS.backend.tools import noise
+from QDNS.backend.tools.backend import Backend
+from QDNS.backend.tools.state_vector import apply_operator, sample_qubits
+from QDNS.backend.tools.virt_qubit import VirtQudit
+from QDNS.tools import gates
+from QDNS.tools.various_tools import dev_mode
+
+
+def log(message: str):
+    if dev_mode:
+        print(message)
+
+
+# GATE CACHE
+
+# Maximum object count of gate cache.
+max_cached_objects = 4096
+
+# (Gate ID, Gate Args, Dimension, Qubit Count) -> Gate matrix.
+gate_cache: Dict[Tuple[int, Tuple, int, int], np.ndarray] = dict()
+
+
+def get_gate_matrix(gate_id: int, gate_arguments: Sequence, dimension: int, qubit_count: int) -> np.ndarray:
+    """
+    Gets matrix of a gate in tools.gates from cache or builds it.
+
+    Args:
+        gate_id: Gate ID.
+        gate_arguments: Gate constructor args.
+        dimension: Qudit dimension.
+        qubit_count: Qubit count that gate is applied to.
+
+    Returns:
+        Gate matrix.
+
+    Raises:
+        ArithmeticError: If qubit count does not match with gate.
+        ValueError: If gate matrix does not match with dimension.
+    """
+
+    try:
+        key = (gate_id, tuple(gate_arguments), dimension, qubit_count)
+        return gate_cache[key]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable gate arguments are not cached.
+        key = None
+
+    gate = gates.gate_id_to_gate[gate_id](*gate_arguments)
+    if gate.qubit_shape != qubit_count:
+        raise ArithmeticError("Qubit count must be match with gate. {} != {}.".format(gate.qubit_shape, qubit_count))
+
+    matrix = np.asarray(gate.matrix, dtype=complex)
+    if matrix.shape != (dimension ** qubit_count, dimension ** qubit_count):
+        raise ValueError("Gate {} is not defined for qudits of dimension {}.".format(gate.gate_name, dimension))
+
+    if key is not None and gate_cache.__len__() < max_cached_objects:
+        gate_cache[key] = matrix
+    return matrix
+
+
+# QUBIT POINTER
+
+class VirtQudit(VirtQudit):
+    """
+    Virtual qudit template.
+
+    #
+    #  [DIM]   [CHUNK]   [INDEX]
+    #    8       24        16     bits
+    #
+    # Template supports pointing:
+    #   Max 255 dimension, 2^^24 circuit, 2^^16 qubit in a circuit.
+    #
+    """
+
+    fields = (("dim", 8), ("chunk", 24), ("index", 16))
+
+    @classmethod
+    def chunk_key(cls, dim: int, chunk_value: int) -> int:
+        """ Key of chunk. """
+
+        return cls.generate_pointer(dim, chunk_value, 0)
+
+
+# NOISE CHANNELS
+
+# Operations of channels on a single qudit.
+IDENTITY = "I"
+SHIFT_X = "X"
+SHIFT_Y = "Y"
+SHIFT_Z = "Z"
+RESET = "R"
+
+
+class BitFlipChannel(object):
+    """ Bit flip channel """
+
+    def __init__(self, p: float) -> None:
+        self._p = p
+
+    def get_operations(self) -> Tuple[str, ...]:
+        if np.random.uniform() < self._p:
+            return SHIFT_X,
+        return ()
+
+
+class PhaseFlipChannel(object):
+    """ Phase flip channel """
+
+    def __init__(self, p: float) -> None:
+        self._p = p
+
+    def get_operations(self) -> Tuple[str, ...]:
+        if np.random.uniform() < self._p:
+            return SHIFT_Z,
+        return ()
+
+
+class YFlipChannel(object):
+    """ Y flip channel or Bit and Phase Flip channel """
+
+    def __init__(self, p: float) -> None:
+        self._p = p
+
+    def get_operations(self) -> Tuple[str, ...]:
+        if np.random.uniform() < self._p:
+            return SHIFT_Y,
+        return ()
+
+
+class DepolarizingChannel(object):
+    """ Depolarizing channel """
+
+    def __init__(self, p: float) -> None:
+        self._p = p
+
+    def get_operations(self) -> Tuple[str, ...]:
+        if np.random.uniform() < self._p:
+            return (SHIFT_X, SHIFT_Y, SHIFT_Z)[np.random.randint(0, 3)],
+        return ()
+
+
+class ResetChannel(object):
+    """ Reset channel """
+
+    def __init__(self, p: float) -> None:
+        self._p = p
+
+    def get_operations(self) -> Tuple[str, ...]:
+        if np.random.uniform() < self._p:
+            return RESET,
+        return ()
+
+
+class NoNoiseChannel(object):
+    """ No noise channel """
+
+    def __init__(self, p: float) -> None:
+        self._p = p
+
+    @staticmethod
+    def get_operations() -> Tuple[str, ...]:
+        return ()
+
+
+def get_channel_gate(flag: str) -> Union[Type[BitFlipChannel], Type[PhaseFlipChannel],
+                                         Type[YFlipChannel], Type[DepolarizingChannel],
+                                         Type[ResetChannel], Type[NoNoiseChannel]]:
+    """ Gets the channel object from string in simulation_tools.channels. """
+
+    if flag not in noise.channels:
+        raise ValueError("Expected channel error flag from tools, but {}.".format(flag))
+
+    if flag == noise.bit_flip_channel:
+        return BitFlipChannel
+
+    elif flag == noise.phase_flip_channel:
+        return PhaseFlipChannel
+
+    elif flag == noise.bit_and_phase_flip_channel:
+        return YFlipChannel
+
+    elif flag == noise.depolarisation_channel:
+        return DepolarizingChannel
+
+    elif flag == noise.reset_channel:
+        return ResetChannel
+
+    elif flag == noise.no_noise_channel:
+        return NoNoiseChannel
+
+    else:
+        raise ValueError("Expected known channel error flag from tools, but {}.".format(flag))
+
+
+# QUDIT REGISTER
+
+class Register(object):
+    def __init__(self, dimension: int, qubits: List[int], state: Optional[np.ndarray] = None):
+        """
+        Register holds state tensor of qudits that may be entangled with each other.
+
+        Args:
+            dimension: Qudit dimension.
+            qubits: Qubit IDs in order of state tensor axes.
+            state: State tensor, qudits are in ground state if None.
+        """
+
+        if dimension <= 1:
+            raise ValueError("Qudit dimension cannot below 2.")
+
+        self._dimension = dimension
+        self._qubits = qubits
+
+        if state is None:
+            state = np.zeros((dimension,) * qubits.__len__(), dtype=complex)
+            state[(0,) * qubits.__len__()] = complex(1, 0)
+        self._state = state
+
+    @classmethod
+    def basis_register(cls, dimension: int, qubit: int, outcome: int) -> "Register":
+        """
+        Register of a single qudit in a basis state.
+
+        Args:
+            dimension: Qudit dimension.
+            qubit: Qubit ID.
+            outcome: Basis state of qudit.
+
+        Returns:
+            Register.
+        """
+
+        state = np.zeros(dimension, dtype=complex)
+        state[outcome] = complex(1, 0)
+        return cls(dimension, [qubit], state)
+
+    def merge_register(self, other: "Register"):
+        """
+        Merges state of other register to back of this register.
+
+        Args:
+            other: Register to merge.
+
+        Raises:
+            ValueError: If dimensions of registers are different.
+        """
+
+        if other.dimension != self._dimension:
+            raise ValueError("Registers of different dimensions can not be merged. {} != {}.".format(self._dimension, other.dimension))
+
+        self._state = np.multiply.outer(self._state, other.state)
+        self._qubits.extend(other.qubits)
+
+    def apply_matrix(self, matrix: np.ndarray, qubits: Sequence[int]):
+        """
+        Applies matrix to qubits of register.
+
+        Args:
+            matrix: Operator matrix.
+            qubits: List[Qubit ID].
+        """
+
+        axes = [self._qubits.index(qubit) for qubit in qubits]
+        self._state = apply_operator(self._state, matrix, axes, self._dimension)
+
+    def shift_qubit(self, qubit: int, operation: str):
+        """
+        Applies a generalized pauli shift to qubit. Qudits are shifted by a random power.
+
+        Args:
+            qubit: Qubit ID.
+            operation: One of SHIFT_X, SHIFT_Y and SHIFT_Z.
+        """
+
+        axis = self._qubits.index(qubit)
+        power = 1
+        if self._dimension > 2:
+            power = np.random.randint(1, self._dimension)
+
+        if operation == SHIFT_X or operation == SHIFT_Y:
+            self._state = np.roll(self._state, power, axis=axis)
+
+        if operation == SHIFT_Z or operation == SHIFT_Y:
+            shape = [1] * self._state.ndim
+            shape[axis] = self._dimension
+            phases = np.exp(2j * np.pi * power * np.arange(self._dimension) / self._dimension)
+            self._state = self._state * phases.reshape(shape)
+
+    def measure_qubit(self, qubit: int) -> int:
+        """
+        Measures qubit and removes it from register.
+
+        Args:
+            qubit: Qubit ID.
+
+        Returns:
+            Outcome.
+        """
+
+        axis = self._qubits.index(qubit)
+        tensor = np.moveaxis(self._state, axis, 0)
+        probabilities = np.sum(np.abs(tensor.reshape(self._dimension, -1)) ** 2, axis=1)
+
+        outcome = int(np.random.choice(self._dimension, p=probabilities / probabilities.sum()))
+        self._state = tensor[outcome] / np.sqrt(probabilities[outcome])
+        self._qubits.pop(axis)
+        return outcome
+
+    def remove_qubit(self, qubit: int):
+        """
+        Removes qubit from register. State vector can not trace out a qubit, so it is measured out.
+
+        Args:
+            qubit: Qubit ID.
+        """
+
+        self.measure_qubit(qubit)
+
+    def sample_qubits(self, qubits: Sequence[int]) -> List[int]:
+        """
+        Samples outcome of qubits without changing the state.
+
+        Args:
+            qubits: List[Qubit ID].
+
+        Returns:
+            List[int].
+        """
+
+        axes = [self._qubits.index(qubit) for qubit in qubits]
+        return sample_qubits(self._state, axes, self._dimension)
+
+    @property
+    def state(self) -> np.ndarray:
+        return self._state
+
+    @property
+    def qubits(self) -> List[int]:
+        return self._qubits
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    @property
+    def qubit_count(self) -> int:
+        return self._qubits.__len__()
+
+    def __str__(self) -> str:
+        text = str()
+        text += "Dim: {}, Qubits: {}".format(self._dimension, self._qubits.__len__())
+        return text
+
+
+# SDQS BACKEND
+
+class SdqsBackend(Backend):
+    # Register type that holds states of qudits.
+    register_type = Register
+
+    def __init__(
+            self, configuration: config.BackendConfiguration,
+            noise_pattern: noise.NoisePattern) -> None:
+        """
+        Sdqs Backend. A state vector backend that only depends on numpy and runs in the kernel process.
+
+        Args:
+            configuration: Sdqs backend configuration.
+            noise_pattern: Noise pattern for simulation.
+        """
+
+        super().__init__(configuration, noise_pattern)
+
+        # Chunk key -> frame size of chunk.
+        self._chunk_sizes: Dict[int, int] = dict()
+
+        # Dimension -> frame size -> free chunk values.
+        self._free_chunks: Dict[int, Dict[int, List[int]]] = dict()
+
+        # Chunk key -> allocated qubits of chunk.
+        self._chunk_qubits: Dict[int, List[int]] = dict()
+
+        # Qubit ID -> register that holds its state.
+        self._qubit_to_register: Dict[int, Register] = dict()
+
+        self.start_backend()
+
+    def start_backend(self) -> bool:
+        """ Prepares chunks of frame configuration. """
+
+        self._chunk_sizes.clear()
+        self._free_chunks.clear()
+        self._chunk_qubits.clear()
+        self._qubit_to_register.clear()
+
+        for dim in self.configuration.frame_config:
+            if dim <= 1:
+                raise ValueError("Qudit dimension cannot below 2.")
+
+            left_side = 0
+            self._free_chunks[dim] = dict()
+            for value in self.configuration.frame_config[dim]:
+                self._free_chunks[dim][value] = list()
+                for i in range(self.configuration.frame_config[dim][value]):
+                    self._chunk_sizes[VirtQudit.chunk_key(dim, i + left_side)] = value
+                    self._free_chunks[dim][value].append(i + left_side)
+
+                # Chunks are picked from the end of list, pick small values first.
+                self._free_chunks[dim][value].reverse()
+                left_side += self.configuration.frame_config[dim][value]
+
+        log("Sdqs backend initialized with {} chunks.".format(self._chunk_sizes.__len__()))
+        return True
+
+    def terminate_backend(self):
+        """ Terminates the backend. """
+
+        self._chunk_sizes.clear()
+        self._free_chunks.clear()
+        self._chunk_qubits.clear()
+        self._qubit_to_register.clear()
+        log("Sdqs backend terminated.")
+
+    def reset_backend(self):
+        """ Frees all qubits and resets their states. """
+
+        self.start_backend()
+        log("Sdqs backend is reset.")
+
+    def figure_allocation(self, frame_size: int, frame_count: int, dimension: int) -> List[int]:
+        """
+        Figures allocation places.
+
+        Args:
+            frame_size: Frame size.
+            frame_count: Frame count.
+            dimension:  Dimension.
+
+        Returns:
+            List of chunk values, empty if there is not enough free chunks.
+        """
+
+        try:
+            free_chunks = self._free_chunks[dimension][frame_size]
+        except KeyError:
+            return []
+
+        if free_chunks.__len__() < frame_count:
+            log("Sdqs backend cannot allocate {}x{} qframes!".format(frame_count, frame_size))
+            return []
+
+        return [free_chunks.pop() for _ in range(frame_count)]
+
+    def figure_deallocation(self, qubits: Sequence[int]) -> bool:
+        """
+        Figures the deallocation. Chunks are freed when all of their qubits are deallocated.
+
+        Args
+            qubits: List[Qubit ID].
+
+        Return:
+            Boolean.
+        """
+
+        report = True
+        for qubit in qubits:
+            dim, chunk_val, _ = VirtQudit.qubit_id_resolver(qubit)
+            key = VirtQudit.chunk_key(dim, chunk_val)
+
+            try:
+                self._chunk_qubits[key].remove(qubit)
+            except (KeyError, ValueError):
+                log("Qubit {} is not found in allocated qubit memory.".format(qubit))
+                report = False
+                continue
+
+            if self._chunk_qubits[key].__len__() <= 0:
+                del self._chunk_qubits[key]
+                self._free_chunks[dim][self._chunk_sizes[key]].append(chunk_val)
+
+        return report
+
+    def allocate_qubits(self, count: int, *args) -> List[int]:
+        """ Allocates qubits. Picks countx1 chunk. """
+
+        return self.allocate_qframes(count, 1, *args)[0]
+
+    def allocate_qframes(self, frame_size: int, frame_count: int, *args) -> List[List[int]]:
+        """
+        Allocates a qframe.
+
+        Args:
+            frame_size: Frame Size.
+            frame_count: Frame Count.
+            args: Backend specific arguments.
+
+        Returns:
+             List[List[Qubit ID]]
+
+        :arg[0] = dimension
+        """
+
+        dimension = 2
+        if args.__len__() > 0:
+            dimension = args[0]
+
+        chunk_values = self.figure_allocation(frame_size, frame_count, dimension)
+        if chunk_values.__len__() <= 0:
+            raise OverflowError("Sdqs backend cannot allocate more qubits.")
+
+        to_return = list()
+        for chunk_value in chunk_values:
+            qubits = [VirtQudit.generate_pointer(dimension, chunk_value, i) for i in range(frame_size)]
+            register = self.register_type(dimension, list(qubits))
+            for qubit in qubits:
+                self._qubit_to_register[qubit] = register
+
+            self._chunk_qubits[VirtQudit.chunk_key(dimension, chunk_value)] = list(qubits)
+
+            self.scramble_qubits(
+                self.noise_pattern.state_prepare_error_channel, qubits,
+                self.noise_pattern.state_prepare_error_probability
+            )
+            to_return.append(qubits)
+
+        log("Sdqs backend allocates ({}x{}) qubit(s).".format(frame_count, frame_size))
+        return to_return
+
+    def prepare_qubits(self, state: np.ndarray, dimension: int = 2) -> List[int]:
+        """
+        Allocates qubits in one register that holds given state vector, state prepare error is not applied.
+        Each qubit is picked from a single qubit chunk.
+
+        Args:
+            state: State vector of qubits, first qubit is the most significant.
+            dimension: Qudit dimension.
+
+        Returns:
+            List[Qubit ID].
+
+        Raises:
+            OverflowError: If there is not enough single qubit chunks.
+        """
+
+        qubit_count = int(np.around(np.log(state.size) / np.log(dimension)))
+        chunk_values = self.figure_allocation(1, qubit_count, dimension)
+        if chunk_values.__len__() <= 0:
+            raise OverflowError("Sdqs backend cannot allocate more qubits.")
+
+        qubits = [VirtQudit.generate_pointer(dimension, chunk_value, 0) for chunk_value in chunk_values]
+        register = self.register_type(dimension, list(qubits), state.reshape((dimension,) * qubit_count))
+        for qubit, chunk_value in zip(qubits, chunk_values):
+            self._qubit_to_register[qubit] = register
+            self._chunk_qubits[VirtQudit.chunk_key(dimension, chunk_value)] = [qubit]
+
+        return qubits
+
+    def deallocate_qubits(self, qubits: Sequence[int]) -> bool:
+        """
+        Deallocates qubits. Qubits are measured out of their registers.
+
+        Args:
+            qubits: List[Qubit ID]
+        """
+
+        for qubit in qubits:
+            try:
+                register = self._qubit_to_register.pop(qubit)
+            except KeyError:
+                continue
+
+            if register.qubit_count > 1:
+                register.remove_qubit(qubit)
+
+        return self.figure_deallocation(qubits)
+
+    def extend_circuit(self, qubit: int, size: int) -> List[int]:
+        """
+        Extends chunk of qubit by size from back.
+
+        Args:
+            qubit: Qubit of chunk.
+            size: Size of extension.
+
+        Returns:
+            List[Qubit ID].
+
+        Raises:
+            OverflowError: If chunk can not point more qubits.
+        """
+
+        dim, chunk_val, _ = VirtQudit.qubit_id_resolver(qubit)
+        key = VirtQudit.chunk_key(dim, chunk_val)
+
+        # Indexes of deallocated qubits are not reused, continue from the largest one.
+        start = int(VirtQudit.resolve_qubits(self._chunk_qubits[key], "index").max()) + 1
+        if start + size > VirtQudit.field_limit("index"):
+            raise OverflowError("Sdqs backend cannot extend chunk {} more than {} qubits.".format(key, VirtQudit.field_limit("index")))
+
+        qubits = [VirtQudit.generate_pointer(dim, chunk_val, i) for i in range(start, start + size)]
+        for new_qubit in qubits:
+            self._qubit_to_register[new_qubit] = self.register_type(dim, [new_qubit])
+        self._chunk_qubits[key].extend(qubits)
+
+        self.scramble_qubits(
+            self.noise_pattern.state_prepare_error_channel, qubits,
+            self.noise_pattern.state_prepare_error_probability
+        )
+        return qubits
+
+    def __merged_register(self, qubits: Sequence[int]) -> Register:
+        """
+        Merges registers of qubits into one register.
+
+        Args:
+            qubits: List[Qubit ID].
+
+        Returns:
+            Register that holds all qubits.
+        """
+
+        register = self._qubit_to_register[qubits[0]]
+        for qubit in qubits[1:]:
+            other = self._qubit_to_register[qubit]
+            if other is register:
+                continue
+
+            register.merge_register(other)
+            for merged_qubit in other.qubits:
+                self._qubit_to_register[merged_qubit] = register
+        return register
+
+    def __collapse_qubit(self, qubit: int) -> int:
+        """
+        Measures qubit and moves it to its own register in measured state.
+
+        Args:
+            qubit: Qubit ID.
+
+        Returns:
+            Outcome.
+        """
+
+        register = self._qubit_to_register[qubit]
+        outcome = register.measure_qubit(qubit)
+        self._qubit_to_register[qubit] = self.register_type.basis_register(register.dimension, qubit, outcome)
+        return outcome
+
+    def apply_transformation(self, gate_id: int, gate_arguments: Tuple, qubits: Sequence[int], *args):
+        """
+        Applies transformation on qubits.
+
+        Args:
+            gate_id: Gate Id.
+            gate_arguments: Gate constructor args.
+            qubits: Qubits.
+        """
+
+        register = self.__merged_register(qubits)
+        matrix = get_gate_matrix(gate_id, gate_arguments, register.dimension, qubits.__len__())
+
+        self.scramble_qubits(
+            self.noise_pattern.gate_error_channel, qubits,
+            self.noise_pattern.gate_error_probability
+        )
+        register.apply_matrix(matrix, qubits)
+
+    def measure_qubits(self, qubits: Sequence[int], *args) -> np.ndarray:
+        """
+        Measures qubits.
+
+        Args:
+            qubits: List[Qubit ID].
+            args: Backend specific arguments.
+
+        Returns:
+            List[int]
+
+        :arg[0]: Non-destructive
+        :arg[1]: Measure dimension.
+        """
+
+        non_destructive = False
+        if args.__len__() > 0:
+            non_destructive = args[0]
+
+        measure_dimension = None
+        if args.__len__() > 1:
+            measure_dimension = args[1]
+
+        results = np.zeros(qubits.__len__(), dtype=int)
+
+        # Non-destructive measurement samples from marginal probabilities of each register.
+        if non_destructive:
+            register_to_places: Dict[Register, List[int]] = dict()
+            for i, qubit in enumerate(qubits):
+                try:
+                    register_to_places[self._qubit_to_register[qubit]].append(i)
+                except KeyError:
+                    register_to_places[self._qubit_to_register[qubit]] = list()
+                    register_to_places[self._qubit_to_register[qubit]].append(i)
+
+            for register in register_to_places:
+                places = register_to_places[register]
+                outcome = register.sample_qubits([qubits[i] for i in places])
+                for i, result in enumerate(outcome):
+                    results[places[i]] = result
+
+        else:
+            self.scramble_qubits(
+                self.noise_pattern.measure_error_channel, qubits,
+                self.noise_pattern.measure_error_probability
+            )
+
+            for i, qubit in enumerate(qubits):
+                results[i] = self.__collapse_qubit(qubit)
+
+            self.scramble_qubits(self.noise_pattern.scramble_channel, qubits, 0.75)
+
+        if measure_dimension is not None:
+            results = results % measure_dimension
+        return results
+
+    def reset_qubits(self, qubits: Sequence[int], no_error=False):
+        """
+        Reset Qubits.
+
+        Args:
+            qubits: List[Qubit ID]
+            no_error: Apply spam error flag.
+        """
+
+        for qubit in qubits:
+            register = self._qubit_to_register[qubit]
+            if register.qubit_count > 1:
+                register.remove_qubit(qubit)
+            self._qubit_to_register[qubit] = self.register_type(register.dimension, [qubit])
+
+        if not no_error:
+            self.scramble_qubits(
+                self.noise_pattern.state_prepare_error_channel, qubits,
+                self.noise_pattern.state_prepare_error_probability
+            )
+
+    def generate_ghz_pair(self, size: int, count: int) -> List[List[int]]:
+        """
+        Generates ghz pairs.
+
+        Args:
+            size: Size of qubits.
+            count: Count of qubits.
+
+        Return:
+            List[List[QubitID]].
+        """
+
+        transformations = list()
+        qubits = self.allocate_qframes(size, count, 2)
+        for i in range(qubits.__len__()):
+            transformations.append([gates.HGate.gate_id, (), (qubits[i][0],)])
+            for j in range(size - 1):
+                transformations.append([gates.CXGate.gate_id, (), (qubits[i][j], qubits[i][j + 1])])
+
+        self.apply_serial_transformations(transformations)
+        return qubits
+
+    def scramble_qubits(self, channel: str, qubits: Sequence[int], percent: float):
+        """
+        Process any channel with any percents.
+
+        Args:
+            channel: Channel method.
+            qubits: Qubits to scramble.
+            percent: Percent of channel.
+        """
+
+        if percent <= 0 or channel == noise.no_noise_channel:
+            return
+
+        channel_object = get_channel_gate(channel)(percent)
+        for qubit in qubits:
+            for operation in channel_object.get_operations():
+                if operation == RESET:
+                    self.reset_qubits([qubit], no_error=True)
+                else:
+                    self._qubit_to_register[qubit].shift_qubit(qubit, operation)
+
+    def process_channel_error(self, qubits: Sequence[int], percent: float):
+        """
+        Process channel error.
+
+        Args:
+            qubits: Qubits in channel.
+            percent: Error percent.
+
+        Raises:
+            ValueError: Percent range error.
+        """
+
+        if percent < 0.001 or percent > 1.0:
+            raise ValueError("Percent must be in range of 0 and 1.")
+
+        self.scramble_qubits(self.noise_pattern.scramble_channel, qubits, percent)
+
+    def apply_serial_transformations(self, list_of_gates: Sequence[List], *args):
+        """
+        Applies list of transformations.
+
+        Args:
+            list_of_gates: List[[GateID, GateArgs, List[Qubit]]].
+        """
+
+        for gate_instructor in list_of_gates:
+            self.apply_transformation(gate_instructor[0], gate_instructor[1], gate_instructor[2])
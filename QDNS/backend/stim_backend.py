@@ -24,20 +24,24 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from typing import Union, Type, List, Sequence, Tuple
+from typing import Union, List, Sequence, Tuple, Optional
 
 import numpy as np
 
 from QDNS.backend.tools import config
 from QDNS.backend.tools import noise
+from QDNS.backend.tools.allocator import QubitAllocator
 from QDNS.backend.tools.backend import Backend
 from QDNS.backend.tools.virt_qubit import VirtQudit
 from QDNS.tools import gates
 
 try:
-    from stim import TableauSimulator
+    from stim import TableauSimulator, Circuit, PauliString, Tableau
 except ImportError:
     TableauSimulator = None
+    Circuit = None
+    PauliString = None
+    Tableau = None
 
 # SUPPORTED GATES
 
@@ -54,174 +58,161 @@ supported_operations[gates.CXGate.gate_id] = gates.CXGate
 supported_operations[gates.CYGate.gate_id] = gates.CYGate
 supported_operations[gates.CZGate.gate_id] = gates.CZGate
 
-
-# QUBIT POINTER
-
-class VirtQubit(VirtQudit):
+# Stim instruction names of supported operations, identity is skipped.
+stim_instructions = dict()
+stim_instructions[gates.PauliX.gate_id] = "X"
+stim_instructions[gates.PauliY.gate_id] = "Y"
+stim_instructions[gates.PauliZ.gate_id] = "Z"
+stim_instructions[gates.HGate.gate_id] = "H"
+stim_instructions[gates.SGate.gate_id] = "S"
+stim_instructions[gates.SWAPGate.gate_id] = "SWAP"
+stim_instructions[gates.ISWAPGate.gate_id] = "ISWAP"
+stim_instructions[gates.CXGate.gate_id] = "CX"
+stim_instructions[gates.CYGate.gate_id] = "CY"
+stim_instructions[gates.CZGate.gate_id] = "CZ"
+
+# Simulator methods of stim instructions, used when circuit is not accumulated.
+simulator_methods = {
+    "X": "x", "Y": "y", "Z": "z", "H": "h", "S": "s",
+    "SWAP": "swap", "ISWAP": "iswap", "CX": "cnot", "CY": "cy", "CZ": "cz", "R": "reset",
+    "X_ERROR": "x_error", "Y_ERROR": "y_error", "Z_ERROR": "z_error", "DEPOLARIZE1": "depolarize1"
+}
+
+# Circuit accumulation; gates, noise and resets are buffered and run in one call when a result is needed.
+circuit_accumulation = True
+
+# Buffered circuit is flushed when it has this many instructions.
+max_buffered_instructions = 1 << 14
+
+
+def change_stim_circuit_accumulation(enabled: bool):
     """
-    Virtual qudit template.
+    Enables or disables circuit accumulation of stim backend.
+    Must call before simulation.
+
+    Args:
+        enabled: Accumulation flag.
     """
 
-    #       [QUBIT]
-    #          |
-    #          |
-    #        000000
-    #
-    # Template supports pointing:
-    #   Max 1 Process, 1 dimension, 999999 qubit.
-    #
+    global circuit_accumulation
+    circuit_accumulation = enabled
 
-    qubit_length = 7
 
-    @staticmethod
-    def qubit_id_resolver(qubit_id: str):
-        """
-        Qubit ID resolve from string.
-        Returns index
-        """
+def circuit_line(instruction: str, indexes: Sequence[int], arguments: Sequence[float] = ()) -> str:
+    """
+    Formats a stim instruction as a line of circuit text.
 
-        return int(qubit_id)
+    Args:
+        instruction: Stim instruction name.
+        indexes: Target qubit indexes.
+        arguments: Instruction arguments.
 
-    @staticmethod
-    def generate_pointer(index) -> str:
-        """
-        Qubit ID Generator.
-        """
+    Returns:
+        Circuit text line.
+    """
 
-        return "{:07d}".format(index)
+    if arguments.__len__() > 0:
+        instruction = "{}({})".format(instruction, ",".join([repr(float(i)) for i in arguments]))
+    return "{} {}".format(instruction, " ".join([str(i) for i in indexes]))
 
 
-# NOISE CHANNELS
+def sample_circuit(circuit: Circuit, shots: int, seed: Optional[int] = None) -> np.ndarray:
+    """
+    Samples measurements of a circuit for many shots at once with a compiled stim sampler.
 
-class BitFlipChannel(object):
-    """ Bit flip channel """
+    Args:
+        circuit: Stim circuit, a recorded run of stim backend.
+        shots: Shot count.
+        seed: Sampler seed, random if None.
 
-    def __init__(self, p: float) -> None:
-        self._p = p
-        self.compose_props = [1.0 - p, p]
-        self.compose_channel = [gates.IDGate, gates.PauliX]
+    Returns:
+        Measurement results in shape of (shots, measurement count) as uint8.
 
-    def get_gates(self):
-        random_ = np.random.uniform()
-        if random_ <= self._p:
-            return self.compose_channel[1],
-        else:
-            return self.compose_channel[0],
+    Raises:
+        ValueError: If shot count is not positive.
+    """
 
+    if shots < 1:
+        raise ValueError("Shot count must be positive but {}.".format(shots))
 
-class PhaseFlipChannel(object):
-    """ Phase flip channel """
+    return circuit.compile_sampler(seed=seed).sample(shots).view(np.uint8)
 
-    def __init__(self, p: float) -> None:
-        self._p = p
-        self.compose_props = [1.0 - p, p]
-        self.compose_channel = [gates.IDGate, gates.PauliZ]
 
-    def get_gates(self):
-        random_ = np.random.uniform()
-        if random_ <= self._p:
-            return self.compose_channel[1],
-        else:
-            return self.compose_channel[0],
+# QUBIT POINTER
 
+class VirtQubit(VirtQudit):
+    """
+    Virtual qudit template.
+    """
 
-class YFlipChannel(object):
-    """ Y flip channel or Bit and Phase Flip channel """
+    #       [QUBIT]
+    #         32      bits
+    #
+    # Template supports pointing:
+    #   Max 1 Process, 1 dimension, 2^^32 qubit.
+    #
 
-    def __init__(self, p: float) -> None:
-        self._p = p
-        self.compose_props = [1.0 - p, p]
-        self.compose_channel = [gates.IDGate, [gates.PauliX, gates.PauliZ]]
+    fields = (("index", 32),)
 
-    def get_gates(self):
-        random_ = np.random.uniform()
-        if random_ <= self._p:
-            return self.compose_channel[1]
-        else:
-            return self.compose_channel[0],
-
-
-class DepolarizingChannel(object):
-    """ Depolarizing channel """
-
-    def __init__(self, p: float) -> None:
-        self._p = p
-        self.compose_props = [1.0 - self._p, self._p / 3, self._p / 3, self._p / 3]
-        self.compose_channel = [gates.IDGate, gates.PauliX, gates.PauliY, gates.PauliZ]
-
-    def get_gates(self):
-        random_ = np.random.uniform()
-        if random_ <= self._p:
-            final_gates = list()
-            random_ = np.random.uniform()
-            if random_ <= self._p:
-                final_gates.append(self.compose_channel[1])
-            random_ = np.random.uniform()
-            if random_ <= self._p:
-                final_gates.append(self.compose_channel[2])
-            random_ = np.random.uniform()
-            if random_ <= self._p:
-                final_gates.append(self.compose_channel[3])
-            if final_gates.__len__() <= 0:
-                final_gates.append(self.compose_channel[np.random.randint(1, 4)])
-            return final_gates
-        else:
-            return self.compose_channel[0],
+    @staticmethod
+    def qubit_id_resolver(qubit_id: int) -> int:
+        """
+        Qubit ID resolver.
+        Returns index, qubit handle is the tableau index itself.
+        """
 
+        return int(qubit_id)
 
-class ResetChannel(object):
-    """ Reset channel """
+    @staticmethod
+    def resolve_indexes(qubits: Sequence[int]) -> List[int]:
+        """
+        Resolves tableau indexes of qubits at once.
 
-    def __init__(self, p: float) -> None:
-        self._p = p
-        self.compose_props = [1.0 - p, p]
-        self.compose_channel = [gates.IDGate, "R"]
+        Args:
+            qubits: List[Qubit ID].
 
-    def get_gates(self):
-        random_ = np.random.uniform()
-        if random_ <= self._p:
-            return self.compose_channel[1],
-        else:
-            return self.compose_channel[0],
+        Returns:
+            List of indexes.
+        """
 
+        return np.asarray(qubits, dtype=np.int64).tolist()
 
-class NoNoiseChannel(object):
-    """ No noise channel """
 
-    def __init__(self, p: float) -> None:
-        self._p = p
-        self.compose_props = [1.0 - p, p]
-        self.compose_channel = [gates.IDGate, gates.IDGate]
+# NOISE CHANNELS
 
-    def get_gates(self):
-        return self.compose_channel[0],
+def get_native_channel(flag: str, p: float) -> Union[Tuple[str, List[float]], None]:
+    """
+    Gets the stim noise instruction of channel flag.
 
+    Args:
+        flag: Channel flag in simulation_tools.channels.
+        p: Probability of channel.
 
-def get_channel_gate(flag: str) -> Union[Type[BitFlipChannel], Type[PhaseFlipChannel],
-                                         Type[YFlipChannel], Type[DepolarizingChannel],
-                                         Type[ResetChannel], Type[NoNoiseChannel]]:
-    """ Gets the gate object from string in simulation_tools.channels. """
+    Returns:
+        Stim instruction name and arguments, None for reset and no noise channels.
+    """
 
     if flag not in noise.channels:
         raise ValueError("Expected channel error flag from tools, but {}.".format(flag))
 
     if flag == noise.bit_flip_channel:
-        return BitFlipChannel
+        return "X_ERROR", [p]
 
     elif flag == noise.phase_flip_channel:
-        return PhaseFlipChannel
+        return "Z_ERROR", [p]
 
     elif flag == noise.bit_and_phase_flip_channel:
-        return YFlipChannel
+        # X and Z together is Y up to global phase.
+        return "Y_ERROR", [p]
 
     elif flag == noise.depolarisation_channel:
-        return DepolarizingChannel
-
-    elif flag == noise.reset_channel:
-        return ResetChannel
+        # Depolarisation channel fires with p, then picks each Pauli with p, or a random one if none is picked.
+        # Product of picked Paulis is X, Y or Z with same chance each.
+        pauli_p = p * (p * (1.0 - p) + np.power(1.0 - p, 3) / 3)
+        return "DEPOLARIZE1", [3 * pauli_p]
 
-    elif flag == noise.no_noise_channel:
-        return NoNoiseChannel
+    elif flag == noise.reset_channel or flag == noise.no_noise_channel:
+        return None
 
     else:
         raise ValueError("Expected known channel error flag from tools, but {}.".format(flag))
@@ -229,6 +220,9 @@ def get_channel_gate(flag: str) -> Union[Type[BitFlipChannel], Type[PhaseFlipCha
 
 # STIM BACKEND
 
+# Simulator keeps all measurement results, it is rebuilt after this many measurements.
+measurement_record_limit = 1 << 20
+
 
 class StimBackend(Backend):
     def __init__(
@@ -247,72 +241,150 @@ class StimBackend(Backend):
 
         self.tableau_simulator = TableauSimulator()
 
-        self._qubit_memory_index: List[int] = list()
-        self._qubit_memory_allocation: List[int] = list()
+        self._qubit_allocator: Optional[QubitAllocator] = None
+        self._measurement_count = 0
+        self._accumulate = circuit_accumulation
+        self._circuit_buffer: List[str] = list()
+        self._recorded_circuit: Optional[List[str]] = None
         self.start_backend()
 
     def start_backend(self):
-        """ Inıtializes the backend. """
+        """
+        Inıtializes the backend.
+        Key 2 of frame configuration is the initial qubit capacity, capacity grows on demand.
+        """
 
         try:
             _ = self.configuration.frame_config[2]
         except KeyError:
             raise ValueError("Stim backend expected key 2 from chunk configuration.")
         else:
-            if self.configuration.frame_config[2] >= np.power(10, VirtQubit.qubit_length):
-                raise OverflowError("Stim is limited to allocate 10^^{} qubits.".format(VirtQubit.qubit_length))
-            self._qubit_memory_index = np.arange(self.configuration.frame_config[2])
-            self._qubit_memory_allocation = np.zeros(self.configuration.frame_config[2])
+            if self.configuration.frame_config[2] >= VirtQubit.field_limit("index"):
+                raise OverflowError("Stim is limited to allocate {} qubits.".format(VirtQubit.field_limit("index")))
+            self._qubit_allocator = QubitAllocator(
+                self.configuration.frame_config[2], VirtQubit.field_limit("index") - 1
+            )
 
     def terminate_backend(self):
         """ Terminates the backend. """
 
-        del self._qubit_memory_index
-        del self._qubit_memory_allocation
+        del self._qubit_allocator
+        del self._circuit_buffer
         del self.tableau_simulator
 
-    def allocate_qubits(self, count: int, *args) -> np.ndarray:
+    def reset_backend(self):
+        """ Frees all qubits and resets their states. """
+
+        self.tableau_simulator = TableauSimulator()
+        self._measurement_count = 0
+        self._circuit_buffer.clear()
+        self._recorded_circuit = None
+        self.start_backend()
+
+    def __do(self, instruction: str, indexes: Sequence[int], arguments: Sequence[float] = ()):
         """
-        Allocates qubits.
+        Runs a stim instruction or buffers it in accumulation mode.
 
         Args:
-            count: Count of qubits.
+            instruction: Stim instruction name.
+            indexes: Target qubit indexes.
+            arguments: Instruction arguments.
+        """
+
+        if self._recorded_circuit is not None:
+            self._recorded_circuit.append(circuit_line(instruction, indexes, arguments))
+
+        if self._accumulate:
+            # Buffered as circuit text, stim parses it much faster than appending instructions one by one.
+            self._circuit_buffer.append(circuit_line(instruction, indexes, arguments))
+            if self._circuit_buffer.__len__() >= max_buffered_instructions:
+                self.flush_circuit()
+
+        elif arguments.__len__() > 0:
+            getattr(self.tableau_simulator, simulator_methods[instruction])(*indexes, p=arguments[0])
+
+        else:
+            getattr(self.tableau_simulator, simulator_methods[instruction])(*indexes)
+
+    def flush_circuit(self):
+        """ Runs buffered circuit on simulator. Must call before simulator state is read. """
+
+        if self._circuit_buffer.__len__() == 0:
+            return
+
+        self.tableau_simulator.do_circuit(Circuit("\n".join(self._circuit_buffer)))
+        self._circuit_buffer.clear()
+
+    def start_recording(self):
+        """
+        Starts to record operations on backend as a stim circuit, including noise channels and measurements.
+        Recorded circuit can be sampled for many shots with sample_circuit.
         """
 
-        t = count
-        indexes = list()
+        self._recorded_circuit = list()
 
-        for i, allocation in enumerate(self._qubit_memory_allocation):
-            if allocation == 0:
-                self._qubit_memory_allocation[i] = 1
-                indexes.append(VirtQubit.generate_pointer(i))
-                t -= 1
+    def stop_recording(self) -> Circuit:
+        """
+        Stops recording.
+
+        Returns:
+            Recorded circuit.
+
+        Raises:
+            ValueError: If recording is not started.
+
+        Notes:
+            Classical decisions of the recorded run, like gates choosen by measurement results, are fixed in circuit.
+            Reset channel noise is recorded as resets of qubits that are choosen in recorded run.
+        """
+
+        if self._recorded_circuit is None:
+            raise ValueError("Stim backend is not recording.")
+
+        circuit = Circuit("\n".join(self._recorded_circuit))
+        self._recorded_circuit = None
+        return circuit
 
-            if t <= 0:
-                break
+    def is_recording(self) -> bool:
+        """ Returns true if backend records its operations. """
 
-        if indexes.__len__() < count:
-            raise OverflowError("There is no space to allocate more qubits.")
+        return self._recorded_circuit is not None
 
-        self.scramble_qubits(self.noise_pattern.state_prepare_error_channel, indexes,
+    def allocate_qubits(self, count: int, *args) -> np.ndarray:
+        """
+        Allocates qubits.
+
+        Args:
+            count: Count of qubits.
+        """
+
+        qubits = np.array(self._qubit_allocator.allocate(count), dtype=np.int64)
+
+        self.scramble_qubits(self.noise_pattern.state_prepare_error_channel, qubits,
                              self.noise_pattern.state_prepare_error_probability)
-        return np.array(indexes)
+        return qubits
 
     def allocate_qframes(self, frame_size: int, frame_count: int, *args) -> np.ndarray:
         """ Allocates qframes on backend. """
 
         return self.allocate_qubits(frame_size * frame_count).reshape(frame_count, frame_size)
 
-    def deallocate_qubits(self, qubits: Sequence[str]) -> bool:
+    def deallocate_qubits(self, qubits: Sequence[int]) -> bool:
         """ Deallocates qframes from backend. """
 
-        indexes = [VirtQubit.qubit_id_resolver(i) for i in qubits]
-        self.reset_qubits(qubits)
+        indexes = VirtQubit.resolve_indexes(qubits)
+        if set(indexes).__len__() != indexes.__len__():
+            return False
+
         for index in indexes:
-            self._qubit_memory_allocation[index] = 0
+            if not self._qubit_allocator.is_allocated(index):
+                return False
+
+        self.reset_qubits(qubits)
+        self._qubit_allocator.deallocate(indexes)
         return True
 
-    def extend_circuit(self, qubit: str, size: int) -> np.ndarray:
+    def extend_circuit(self, qubit: int, size: int) -> np.ndarray:
         """
         Extend qframe from back.
         Just returns with more allocation.
@@ -321,7 +393,7 @@ class StimBackend(Backend):
         _ = qubit
         return self.allocate_qubits(size)
 
-    def apply_transformation(self, gate_id: int, gate_arguments: Tuple, qubits: Sequence[str], *args):
+    def apply_transformation(self, gate_id: int, gate_arguments: Tuple, qubits: Sequence[int], *args):
         """
         Apply transformation on qubits.
 
@@ -340,37 +412,14 @@ class StimBackend(Backend):
         if gate_id not in supported_operations.keys():
             raise AttributeError("Gate {} is not supported on STIM.".format(gate_id))
 
-        indexes = [VirtQubit.qubit_id_resolver(i) for i in qubits]
-        if gate_id == gates.IDGate.gate_id:
-            pass
-        elif gate_id == gates.PauliX.gate_id:
-            self.tableau_simulator.x(*indexes)
-        elif gate_id == gates.PauliY.gate_id:
-            self.tableau_simulator.y(*indexes)
-        elif gate_id == gates.PauliZ.gate_id:
-            self.tableau_simulator.z(*indexes)
-        elif gate_id == gates.HGate.gate_id:
-            self.tableau_simulator.h(*indexes)
-        elif gate_id == gates.SGate.gate_id:
-            self.tableau_simulator.s(*indexes)
-        elif gate_id == gates.SWAPGate.gate_id:
-            self.tableau_simulator.swap(*indexes)
-        elif gate_id == gates.ISWAPGate.gate_id:
-            self.tableau_simulator.iswap(*indexes)
-        elif gate_id == gates.CXGate.gate_id:
-            self.tableau_simulator.cnot(*indexes)
-        elif gate_id == gates.CYGate.gate_id:
-            self.tableau_simulator.cy(*indexes)
-        elif gate_id == gates.CZGate.gate_id:
-            self.tableau_simulator.cz(*indexes)
-        else:
-            raise AttributeError("Gate {} is not supported on STIM.".format(gate_id))
+        if gate_id != gates.IDGate.gate_id:
+            self.__do(stim_instructions[gate_id], VirtQubit.resolve_indexes(qubits))
 
         if apply_noise:
             self.scramble_qubits(self.noise_pattern.gate_error_channel, qubits,
                                  self.noise_pattern.gate_error_probability)
 
-    def measure_qubits(self, qubits: Sequence[str], *args) -> List[int]:
+    def measure_qubits(self, qubits: Sequence[int], *args) -> List[int]:
         """
         Measures qubits.
 
@@ -378,7 +427,7 @@ class StimBackend(Backend):
         """
 
         non_destructive = args[0] if args.__len__() > 0 else False
-        indexes = [VirtQubit.qubit_id_resolver(i) for i in qubits]
+        indexes = VirtQubit.resolve_indexes(qubits)
 
         if not non_destructive:
             self.scramble_qubits(
@@ -386,22 +435,121 @@ class StimBackend(Backend):
                 self.noise_pattern.measure_error_probability
             )
 
+        if self._recorded_circuit is not None:
+            self._recorded_circuit.append(circuit_line("M", indexes))
+
+        self.flush_circuit()
         to_return = [int(i) for i in self.tableau_simulator.measure_many(*indexes)]
         if not non_destructive:
             self.scramble_qubits(self.noise_pattern.scramble_channel, qubits, 0.75)
 
-        state = self.tableau_simulator.current_inverse_tableau()
-        del self.tableau_simulator
+        # Measurements are done in place, simulator is rebuilt only to drop its measurement record.
+        self._measurement_count += indexes.__len__()
+        if self._measurement_count >= measurement_record_limit:
+            self.__drop_measurement_record()
+        return to_return
+
+    def __drop_measurement_record(self):
+        """ Moves state to a new simulator without measurement record. """
 
+        self.flush_circuit()
+        state = self.tableau_simulator.current_inverse_tableau()
         self.tableau_simulator = TableauSimulator()
         self.tableau_simulator.set_inverse_tableau(state)
-        return to_return
+        self._measurement_count = 0
+
+    def state_vector(self, qubits: Sequence[int]) -> np.ndarray:
+        """
+        State vector of qubits that are not entangled with other qubits.
+
+        Args:
+            qubits: List[Qubit ID].
+
+        Returns:
+            State vector, first qubit is the most significant.
+
+        Raises:
+            ValueError: If qubits are entangled with other qubits.
 
-    def reset_qubits(self, qubits: Sequence[str], *args):
+        Notes:
+            Stabilizers of state are reduced to the ones that only act on qubits.
+            Only stabilizers that are connected to qubits by their supports are eliminated.
+        """
+
+        self.flush_circuit()
+        indexes = VirtQubit.resolve_indexes(qubits)
+        if self.tableau_simulator.num_qubits <= max(indexes):
+            self.tableau_simulator.set_num_qubits(max(indexes) + 1)
+
+        # Stabilizer generators of state are the z outputs of inverse of inverse tableau.
+        tableau = self.tableau_simulator.current_inverse_tableau().inverse()
+        _, _, z2x, z2z, _, z_signs = tableau.to_numpy(bit_packed=True)
+        size = tableau.__len__()
+
+        def column_bits(columns: np.ndarray) -> np.ndarray:
+            shifts = (columns % 8).astype(np.uint8)
+            return ((z2x[:, columns // 8] >> shifts) & 1) | ((z2z[:, columns // 8] >> shifts) & 1)
+
+        def row_bits(rows: np.ndarray, packed: np.ndarray) -> np.ndarray:
+            return np.unpackbits(packed[rows], axis=1, count=size, bitorder="little").astype(bool)
+
+        # Collect generators that are connected to qubits.
+        columns = np.asarray(indexes)
+        rows = np.zeros(size, dtype=bool)
+        new_columns = columns
+        while new_columns.__len__() > 0:
+            new_rows = column_bits(new_columns).any(axis=1) & ~rows
+            rows |= new_rows
+            support = (row_bits(np.flatnonzero(new_rows), z2x) | row_bits(np.flatnonzero(new_rows), z2z)).any(axis=0)
+            new_columns = np.setdiff1d(np.flatnonzero(support), columns)
+            columns = np.union1d(columns, new_columns)
+
+        # Qubits are placed at the end, so eliminating other columns leaves stabilizers of qubits.
+        others = np.setdiff1d(columns, indexes)
+        columns = np.concatenate([others, indexes])
+        rows = np.flatnonzero(rows)
+        xs = row_bits(rows, z2x)[:, columns]
+        zs = row_bits(rows, z2z)[:, columns]
+        stabilizers = [
+            PauliString.from_numpy(xs=xs[i], zs=zs[i], sign=-1 if (z_signs[row // 8] >> (row % 8)) & 1 else 1)
+            for i, row in enumerate(rows)
+        ]
+
+        remaining = list(range(stabilizers.__len__()))
+        for column in range(others.__len__()):
+            for bits in (xs, zs):
+                pivot = None
+                for i in remaining:
+                    if bits[i, column]:
+                        pivot = i
+                        break
+
+                if pivot is None:
+                    continue
+
+                remaining.remove(pivot)
+                for i in remaining:
+                    if bits[i, column]:
+                        stabilizers[i] *= stabilizers[pivot]
+                        xs[i] ^= xs[pivot]
+                        zs[i] ^= zs[pivot]
+
+        start = others.__len__()
+        stabilizers = [
+            PauliString.from_numpy(xs=xs[i, start:], zs=zs[i, start:], sign=stabilizers[i].sign)
+            for i in remaining
+        ]
+
+        try:
+            state = Tableau.from_stabilizers(stabilizers, allow_redundant=True).to_state_vector(endian="big")
+        except ValueError:
+            raise ValueError("Qubits are entangled with other qubits, state vector cannot be seperated.")
+        return state
+
+    def reset_qubits(self, qubits: Sequence[int], *args):
         """ Reset Qubits. """
 
-        indexes = [VirtQubit.qubit_id_resolver(i) for i in qubits]
-        self.tableau_simulator.reset(*indexes)
+        self.__do("R", VirtQubit.resolve_indexes(qubits))
 
     def generate_ghz_pair(self, size: int, count: int, *args):
         """ Generates ghz pairs. """
@@ -414,9 +562,10 @@ class StimBackend(Backend):
                 self.apply_transformation(gates.CXGate.gate_id, (), (qubits[i], qubits[i + 1]))
         return qubits_frame
 
-    def scramble_qubits(self, channel: str, qubits: Sequence[str], percent: float):
+    def scramble_qubits(self, channel: str, qubits: Sequence[int], percent: float):
         """
         Scramble qubits by given channel and percent.
+        Noise of all qubits is applied with one native stim operation.
 
         Args:
             channel: Channel of error FLAG.
@@ -424,17 +573,20 @@ class StimBackend(Backend):
             percent: Percent tuple of scramble that constructs channel object.
         """
 
-        channel = get_channel_gate(channel)(percent)
+        instruction = get_native_channel(channel, min(percent, 1.0))
+        if percent <= 0 or qubits.__len__() == 0:
+            return
+
+        indexes = VirtQubit.resolve_indexes(qubits)
+        if channel == noise.reset_channel:
+            chosen = np.asarray(indexes)[np.random.uniform(size=indexes.__len__()) <= percent]
+            if chosen.__len__() > 0:
+                self.__do("R", chosen.tolist())
 
-        for qubit in qubits:
-            for gate in channel.get_gates():
-                if gate == "R":
-                    index = VirtQubit.qubit_id_resolver(qubit)
-                    self.tableau_simulator.reset(index)
-                else:
-                    self.apply_transformation(gate.gate_id, (), (qubit,), True)
+        elif instruction is not None:
+            self.__do(instruction[0], indexes, instruction[1])
 
-    def process_channel_error(self, qubits: Sequence[str], percent: float, *args):
+    def process_channel_error(self, qubits: Sequence[int], percent: float, *args):
         """
         Process channel errors.
 
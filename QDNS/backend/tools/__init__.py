@@ -1 +1 @@
-__all__ = ["backend", "config", "noise", "virt_qubit"]
+__all__ = ["allocator", "backend", "config", "groups", "noise", "state_vector", "virt_qubit"]
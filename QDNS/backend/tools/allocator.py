@@ -0,0 +1,158 @@
+# Copyright (c) 2021, COMU Team, Osman Ceylan and etc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 3. Neither the name of the COMU Team organization nor the
+#    names of its contributors may be used to endorse or promote products
+#    derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDER ''AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from typing import List, Iterable
+
+
+class QubitAllocator(object):
+    def __init__(self, initial_capacity: int, max_capacity: int):
+        """
+        Qubit slot allocator.
+
+        Freed slots are kept in a free list and reused first, others are taken
+        from never used slots after a hint pointer. Capacity doubles when it is full.
+
+        Args:
+            initial_capacity: Slot count at start.
+            max_capacity: Capacity cannot grow over this.
+
+        Raises:
+            ValueError: If capacities are not valid.
+        """
+
+        if initial_capacity < 1:
+            raise ValueError("Initial capacity of qubit allocator cannot be lower than 1.")
+
+        if initial_capacity > max_capacity:
+            raise ValueError("Initial capacity of qubit allocator cannot be higher than {}.".format(max_capacity))
+
+        self._initial_capacity = initial_capacity
+        self._max_capacity = max_capacity
+        self._capacity = initial_capacity
+        self._allocated = bytearray(initial_capacity)
+        self._free_list: List[int] = list()
+        self._next_index = 0
+        self._allocated_count = 0
+
+    def allocate(self, count: int) -> List[int]:
+        """
+        Allocates slots.
+
+        Args:
+            count: Slot count.
+
+        Returns:
+            Slot indexes.
+
+        Raises:
+            OverflowError: If capacity cannot grow for count slots.
+        """
+
+        if count > self._max_capacity - self._allocated_count:
+            raise OverflowError("There is no space to allocate more qubits.")
+
+        # Reuse freed slots first.
+        reused = min(count, self._free_list.__len__())
+        if reused > 0:
+            indexes = self._free_list[-reused:]
+            del self._free_list[-reused:]
+        else:
+            indexes = list()
+
+        # Take the rest as a range after hint.
+        remaining = count - reused
+        if remaining > 0:
+            end = self._next_index + remaining
+            if end > self._capacity:
+                self.__grow(end)
+            indexes.extend(range(self._next_index, end))
+            self._next_index = end
+
+        for index in indexes:
+            self._allocated[index] = 1
+        self._allocated_count += count
+        return indexes
+
+    def deallocate(self, indexes: Iterable[int]):
+        """
+        Frees slots.
+
+        Args:
+            indexes: Slot indexes.
+
+        Raises:
+            ValueError: If a slot is not allocated.
+        """
+
+        for index in indexes:
+            if index >= self._capacity or not self._allocated[index]:
+                raise ValueError("Qubit slot {} is not allocated.".format(index))
+
+            self._allocated[index] = 0
+            self._free_list.append(index)
+            self._allocated_count -= 1
+
+    def is_allocated(self, index: int) -> bool:
+        return index < self._capacity and self._allocated[index] == 1
+
+    def reset(self):
+        """ Frees all slots and returns to initial capacity. """
+
+        self._capacity = self._initial_capacity
+        self._allocated = bytearray(self._initial_capacity)
+        self._free_list.clear()
+        self._next_index = 0
+        self._allocated_count = 0
+
+    def __grow(self, needed: int):
+        """ Doubles capacity until needed slots fit. """
+
+        new_capacity = self._capacity
+        while new_capacity < needed:
+            new_capacity *= 2
+        new_capacity = min(new_capacity, self._max_capacity)
+
+        self._allocated.extend(bytes(new_capacity - self._capacity))
+        self._capacity = new_capacity
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def max_capacity(self) -> int:
+        return self._max_capacity
+
+    @property
+    def allocated_count(self) -> int:
+        return self._allocated_count
+
+    @property
+    def free_count(self) -> int:
+        return self._max_capacity - self._allocated_count
+
+    def __len__(self) -> int:
+        return self._allocated_count
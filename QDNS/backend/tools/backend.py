@@ -57,6 +57,11 @@ class Backend(object):
 
         pass
 
+    def reset_backend(self):
+        """ Frees all qubits and resets their states. Backend keeps running for next simulation. """
+
+        pass
+
     def figure_allocation(self, frame_size: int, frame_count: int, dimension: int):
         """
         Figures allocation places.
@@ -69,7 +74,7 @@ class Backend(object):
 
         pass
 
-    def figure_deallocation(self, qubits: Sequence[str]):
+    def figure_deallocation(self, qubits: Sequence[int]):
         """
         Figures the deallocation.
 
@@ -92,7 +97,7 @@ class Backend(object):
 
         pass
 
-    def allocate_qframes(self, frame_size: int, frame_count: int, *args) -> List[List[str]]:
+    def allocate_qframes(self, frame_size: int, frame_count: int, *args) -> List[List[int]]:
         """
         Allocates a qframe.
 
@@ -107,7 +112,7 @@ class Backend(object):
 
         pass
 
-    def deallocate_qubits(self, qubits: Sequence[str]):
+    def deallocate_qubits(self, qubits: Sequence[int]):
         """
         Deallocates qubits.
 
@@ -117,7 +122,7 @@ class Backend(object):
 
         pass
 
-    def apply_transformation(self, gate_id: int, gate_arguments, qubits: Sequence[str], *args):
+    def apply_transformation(self, gate_id: int, gate_arguments, qubits: Sequence[int], *args):
         """
         Applies transformation on qubits.
 
@@ -129,7 +134,7 @@ class Backend(object):
 
         pass
 
-    def measure_qubits(self, qubits: Sequence[str], *args):
+    def measure_qubits(self, qubits: Sequence[int], *args):
         """
         Measures qubits.
 
@@ -143,7 +148,7 @@ class Backend(object):
 
         pass
 
-    def reset_qubits(self, qubits: Sequence[str]):
+    def reset_qubits(self, qubits: Sequence[int]):
         """
         Reset Qubits.
 
@@ -167,7 +172,7 @@ class Backend(object):
 
         pass
 
-    def process_channel_error(self, qubits: Sequence[str], percent: float):
+    def process_channel_error(self, qubits: Sequence[int], percent: float):
         """
         Process channel error.
 
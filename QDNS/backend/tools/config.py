@@ -30,12 +30,18 @@ CIRQ_BACKEND = "CIRQ backend"
 QISKIT_BACKEND = "QISKIT backend"
 SDQS_BACKEND = "SDQS backend"
 STIM_BACKEND = "STIM backend"
+DENSITY_MATRIX_BACKEND = "DENSITY MATRIX backend"
+MPS_BACKEND = "MPS backend"
+HYBRID_BACKEND = "HYBRID backend"
 
 supported_backends = (
     CIRQ_BACKEND,
     QISKIT_BACKEND,
     STIM_BACKEND,
-    SDQS_BACKEND
+    SDQS_BACKEND,
+    DENSITY_MATRIX_BACKEND,
+    MPS_BACKEND,
+    HYBRID_BACKEND
 )
 
 avaible_backends = list()
@@ -61,13 +67,12 @@ except ImportError:
     stim = None
 else:
     avaible_backends.append(STIM_BACKEND)
+    avaible_backends.append(HYBRID_BACKEND)
 
-try:
-    from QDNS.backend.sdqs_backend import SdqsBackend
-except ImportError:
-    pass
-else:
-    avaible_backends.append(SDQS_BACKEND)
+# Sdqs, density matrix and mps backends only depend on numpy.
+avaible_backends.append(SDQS_BACKEND)
+avaible_backends.append(DENSITY_MATRIX_BACKEND)
+avaible_backends.append(MPS_BACKEND)
 
 
 class BackendConfiguration(object):
@@ -83,7 +88,10 @@ class BackendConfiguration(object):
         >>> BackendConfiguration(CIRQ_BACKEND, 4, {2: {1: 128, 2: 64, 3: 32}, 3: {1: 64, 2: 16}})
         >>> BackendConfiguration(QISKIT_BACKEND, 4, {2: {1: 128, 2: 64, 3: 32}})
         >>> BackendConfiguration(SDQS_BACKEND, 4, {2: {1: 128, 2: 64, 3: 32}})
+        >>> BackendConfiguration(DENSITY_MATRIX_BACKEND, 1, {2: {1: 128, 2: 64, 3: 32}})
+        >>> BackendConfiguration(MPS_BACKEND, 1, {2: {1: 1024, 2: 512}})
         >>> BackendConfiguration(STIM_BACKEND, 1, {2: 50000})
+        >>> BackendConfiguration(HYBRID_BACKEND, 1, {2: 50000})
         """
 
         self._backend = backend
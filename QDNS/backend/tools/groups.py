@@ -0,0 +1,153 @@
+# Copyright (c) 2021, COMU Team, Osman Ceylan and etc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 3. Neither the name of the COMU Team organization nor the
+#    names of its contributors may be used to endorse or promote products
+#    derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDER ''AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+from typing import Dict, Set, Sequence, FrozenSet
+
+
+class EntanglementGroups(object):
+    def __init__(self):
+        """
+        Keeps groups of qubits that may be entangled with each other.
+        Qubits start in their own groups, multi qubit gates merge groups and measurements split qubits out.
+        """
+
+        self._qubit_to_group: Dict[int, int] = dict()
+        self._groups: Dict[int, Set[int]] = dict()
+        self._next_group = 0
+        self._largest_group = 0
+
+    def add_qubits(self, qubits: Sequence[int]):
+        """
+        Adds qubits in their own groups.
+
+        Args:
+            qubits: List[Qubit ID].
+        """
+
+        for qubit in qubits:
+            self._qubit_to_group[qubit] = self._next_group
+            self._groups[self._next_group] = {qubit}
+            self._next_group += 1
+
+        if qubits.__len__() > 0 and self._largest_group < 1:
+            self._largest_group = 1
+
+    def remove_qubits(self, qubits: Sequence[int]):
+        """
+        Removes qubits from their groups.
+
+        Args:
+            qubits: List[Qubit ID].
+        """
+
+        for qubit in qubits:
+            try:
+                group = self._qubit_to_group.pop(qubit)
+            except KeyError:
+                continue
+
+            self._groups[group].discard(qubit)
+            if self._groups[group].__len__() <= 0:
+                del self._groups[group]
+
+    def merge_groups(self, qubits: Sequence[int]) -> int:
+        """
+        Merges groups of qubits, smaller groups are moved into the largest one.
+
+        Args:
+            qubits: List[Qubit ID].
+
+        Returns:
+            Merged group.
+
+        Raises:
+            KeyError: If a qubit is not in groups.
+        """
+
+        groups = {self._qubit_to_group[qubit] for qubit in qubits}
+        target = max(groups, key=lambda group: self._groups[group].__len__())
+
+        for group in groups:
+            if group == target:
+                continue
+
+            for qubit in self._groups[group]:
+                self._qubit_to_group[qubit] = target
+            self._groups[target].update(self._groups.pop(group))
+
+        if self._groups[target].__len__() > self._largest_group:
+            self._largest_group = self._groups[target].__len__()
+        return target
+
+    def split_qubits(self, qubits: Sequence[int]):
+        """
+        Moves qubits to their own groups, like after a measurement.
+
+        Args:
+            qubits: List[Qubit ID].
+        """
+
+        qubits = [qubit for qubit in qubits if qubit in self._qubit_to_group]
+        self.remove_qubits(qubits)
+        self.add_qubits(qubits)
+
+    def group_of(self, qubit: int) -> FrozenSet[int]:
+        """
+        Group of qubit.
+
+        Args:
+            qubit: Qubit ID.
+
+        Returns:
+            Qubits in same group.
+        """
+
+        return frozenset(self._groups[self._qubit_to_group[qubit]])
+
+    def clear(self):
+        """ Removes all groups. """
+
+        self._qubit_to_group.clear()
+        self._groups.clear()
+        self._largest_group = 0
+
+    @property
+    def group_count(self) -> int:
+        return self._groups.__len__()
+
+    @property
+    def qubit_count(self) -> int:
+        return self._qubit_to_group.__len__()
+
+    @property
+    def largest_group(self) -> int:
+        """ Size of largest group since last clear. """
+
+        return self._largest_group
+
+    def __str__(self) -> str:
+        text = str()
+        text += "Groups: {}, Qubits: {}, Largest: {}".format(self.group_count, self.qubit_count, self._largest_group)
+        return text
@@ -0,0 +1,95 @@
+# Copyright (c) 2021, COMU Team, Osman Ceylan and etc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 3. Neither the name of the COMU Team organization nor the
+#    names of its contributors may be used to endorse or promote products
+#    derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDER ''AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from typing import Sequence, List
+
+import numpy as np
+
+
+def marginal_probabilities(state: np.ndarray, qubits: Sequence[int], dimension: int = 2, little_endian: bool = False) -> np.ndarray:
+    """
+    Marginal outcome probabilities of qubits in a state vector.
+
+    Args:
+        state: State vector.
+        qubits: Qubit indexes in state.
+        dimension: Qudit dimension.
+        little_endian: Qubit 0 is the least significant digit of state index, like qiskit.
+
+    Returns:
+        Probabilities in shape of (dimension,) * qubit count, axes are in order of given qubits.
+    """
+
+    probabilities = np.abs(np.asarray(state, dtype=complex).reshape(-1)) ** 2
+    qubit_count = int(np.round(np.log(probabilities.size) / np.log(dimension)))
+    tensor = probabilities.reshape((dimension,) * qubit_count)
+
+    axes = [qubit_count - 1 - int(qubit) if little_endian else int(qubit) for qubit in qubits]
+    marginal = tensor.sum(axis=tuple([i for i in range(qubit_count) if i not in axes]))
+
+    # Remaining axes are sorted, put them in order of given qubits.
+    sorted_axes = sorted(axes)
+    marginal = np.transpose(marginal, [sorted_axes.index(axis) for axis in axes])
+    return marginal / marginal.sum()
+
+
+def sample_qubits(state: np.ndarray, qubits: Sequence[int], dimension: int = 2, little_endian: bool = False) -> List[int]:
+    """
+    Samples a measurement outcome of qubits from marginal probabilities, state is not changed.
+
+    Args:
+        state: State vector.
+        qubits: Qubit indexes in state.
+        dimension: Qudit dimension.
+        little_endian: Qubit 0 is the least significant digit of state index, like qiskit.
+
+    Returns:
+        Outcome of each qubit in order of given qubits.
+    """
+
+    marginal = marginal_probabilities(state, qubits, dimension, little_endian)
+    outcome = np.random.choice(marginal.size, p=marginal.reshape(-1))
+    return [int(i) for i in np.unravel_index(outcome, marginal.shape)]
+
+
+def apply_operator(tensor: np.ndarray, operator: np.ndarray, axes: Sequence[int], dimension: int = 2) -> np.ndarray:
+    """
+    Applies an operator to axes of a state tensor.
+
+    Args:
+        tensor: State tensor in shape of (dimension,) * qubit count.
+        operator: Operator matrix in shape of (dimension ** axis count, dimension ** axis count).
+        axes: Axes of tensor that operator is applied to, first axis is the most significant digit of operator.
+        dimension: Qudit dimension.
+
+    Returns:
+        New state tensor.
+    """
+
+    count = axes.__len__()
+    operator = np.asarray(operator).reshape((dimension,) * (2 * count))
+    tensor = np.tensordot(operator, tensor, axes=(list(range(count, 2 * count)), list(axes)))
+    return np.moveaxis(tensor, list(range(count)), list(axes))
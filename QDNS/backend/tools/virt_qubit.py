@@ -23,20 +23,28 @@
 # ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+
+# Bit length of qubit handles that backends can use, upper bits are reserved for kernel shards.
+handle_length = 56
+
+# Shard index is kept in upper bits of qubit handle, zero is left for handles that are not sharded.
+max_shard_count = (1 << (63 - handle_length)) - 1
+
 
 class VirtQudit(object):
     """
     Virtual qudit template.
+    Qubit IDs are integer handles that pack fields of template into a 64 bit word.
     CIRQ
     #
-    #  [PID]    [CH_IND]      [INDEX]
-    #    |      00   00000      00
-    #    |      /     |         |
-    #    P     DIM   CHUNK      |
-    #    0     00    00000      00
+    #  [PID]   [DIM]   [CHUNK]   [INDEX]
+    #    8       8       24        16     bits
     #
     # Template supports pointing:
-    #   Max 9 Process, 9 dimension, 99999 circuit, 99 qubit in a circuit.
+    #   Max 255 Process, 255 dimension, 2^^24 circuit, 2^^16 qubit in a circuit.
     #
     """
 
@@ -44,14 +52,11 @@ class VirtQudit(object):
     Virtual qudit template.
     QISKIT
     #
-    #  [PID]    [CH_IND]      [INDEX]
-    #    |       00000          00
-    #    |         |             |
-    #    P       CHUNK           |
-    #    0       00000          00
+    #  [PID]   [CHUNK]   [INDEX]
+    #    8       24        16     bits
     #
     # Template supports pointing:
-    #   Max 9 Process, 99999 circuit, 99 qubit in a circuit.
+    #   Max 255 Process, 2^^24 circuit, 2^^16 qubit in a circuit.
     #
     """
 
@@ -59,29 +64,87 @@ class VirtQudit(object):
     Virtual qudit template.
     STIM
     #       [QUBIT]
-    #          |
-    #          |
-    #        000000
+    #         56      bits
     #
     # Template supports pointing:
-    #   Max 1 Process, 1 dimension, 999999 qubit.
+    #   Max 1 Process, 1 dimension, 2^^56 qubit.
     #
     """
 
-    @staticmethod
-    def qubit_id_resolver(qubit_id: str):
+    # (Field name, bit length) pairs from most significant field to least significant one.
+    fields: Tuple[Tuple[str, int], ...] = ()
+
+    # Field name -> (shift, mask), filled for each template.
+    _layout: Dict[str, Tuple[int, int]] = dict()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        if sum(length for _, length in cls.fields) > handle_length:
+            raise OverflowError("Qubit template {} is longer than {} bits.".format(cls.__name__, handle_length))
+
+        cls._layout = dict()
+        shift = 0
+        for name, length in reversed(cls.fields):
+            cls._layout[name] = (shift, (1 << length) - 1)
+            shift += length
+
+    @classmethod
+    def qubit_id_resolver(cls, qubit_id: int) -> Tuple[int, ...]:
+        """
+        Resolves fields of qubit handle.
+
+        Args:
+            qubit_id: Qubit ID.
+
+        Returns:
+            Values of fields in template order.
+        """
+
+        qubit_id = int(qubit_id)
+        return tuple((qubit_id >> cls._layout[name][0]) & cls._layout[name][1] for name, _ in cls.fields)
+
+    @classmethod
+    def resolve_qubits(cls, qubits: Sequence[int], name: str) -> np.ndarray:
         """
-        Qubit ID resolve from string.
-        Must override.
+        Resolves a field of qubit handles at once.
+
+        Args:
+            qubits: List[Qubit ID].
+            name: Field name.
+
+        Returns:
+            Values of field.
         """
 
-        pass
+        shift, mask = cls._layout[name]
+        return (np.asarray(qubits, dtype=np.int64) >> shift) & mask
 
-    @staticmethod
-    def generate_pointer(*args) -> str:
+    @classmethod
+    def generate_pointer(cls, *values) -> int:
         """
         Qubit ID Generator.
-        Must override.
+
+        Args:
+            values: Values of fields in template order.
+
+        Returns:
+            Qubit ID.
+
+        Raises:
+            OverflowError: If a value does not fit its field.
         """
 
-        pass
+        qubit_id = 0
+        for (name, _), value in zip(cls.fields, values):
+            shift, mask = cls._layout[name]
+            if value < 0 or value > mask:
+                raise OverflowError("Value {} does not fit {} field of qubit template.".format(value, name))
+            qubit_id |= int(value) << shift
+        return qubit_id
+
+    @classmethod
+    def field_limit(cls, name: str) -> int:
+        """ Count of values that field can point. """
+
+        return cls._layout[name][1] + 1
@@ -1 +1 @@
-__all__ = ["api", "library", "tools"]
+__all__ = ["api", "futures", "library", "tools"]
@@ -24,7 +24,6 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import time
 from datetime import datetime
 from queue import Empty
 from typing import Union
@@ -32,6 +31,7 @@ from typing import Union
 from QDNS.commands import tools
 from QDNS.device.application import Application
 from QDNS.interactions import request, signal
+from QDNS.tools import simulation_clock
 
 
 def calculate_time_delta(datetime_old, datetime_new=None):
@@ -58,9 +58,9 @@ def get_date():
 
 
 def get_time():
-    """ Returns the time. """
+    """ Returns the time. Virtual time if simulation runs on virtual clock. """
 
-    return time.time()
+    return simulation_clock.get_time()
 
 
 def application_wait_next_package(application: Application, timeout=None):
@@ -80,7 +80,7 @@ def application_wait_next_package(application: Application, timeout=None):
         timeout = tools.package_expire_time
 
     try:
-        package = application.income_package_queue.get(timeout=timeout)
+        package = simulation_clock.queue_get(application.income_package_queue, timeout=timeout)
     except Empty:
         return None
     else:
@@ -103,7 +103,7 @@ def application_wait_next_qubit(application: Application, timeout=None):
         timeout = tools.qubit_expire_time
 
     try:
-        qubit = application.income_qubit_queue.get(timeout=timeout)
+        qubit = simulation_clock.queue_get(application.income_qubit_queue, timeout=timeout)
     except Empty:
         return None
     else:
@@ -126,7 +126,7 @@ def application_wait_next_Trespond(application: Application, timeout=None):
         timeout = tools.respond_expire_time
 
     try:
-        respond_ = application.threaded_respond_queue.get(timeout=timeout)
+        respond_ = simulation_clock.queue_get(application.threaded_respond_queue, timeout=timeout)
     except Empty:
         return None
     else:
@@ -149,7 +149,7 @@ def application_wait_next_Mrespond(application: Application, timeout=None):
         timeout = tools.respond_expire_time
 
     try:
-        respond_ = application.respond_queue.get(timeout=timeout)
+        respond_ = simulation_clock.queue_get(application.respond_queue, timeout=timeout)
     except Empty:
         return None
     else:
@@ -956,6 +956,27 @@ def reset_qubits(application: Application, qubits):
     return the_request
 
 
+def density_matrix(application: Application, qubits):
+    """
+    Makes density matrix request to simulation.
+
+    Args:
+        application: Application.
+        qubits: Qubits of density matrix.
+
+    Return:
+        Request.
+    """
+
+    the_request = request.DensityMatrixRequest(application.label, application.host_uuid, qubits)
+    the_request.process(application.sim_request_queue)
+
+    if the_request.want_respond:
+        application.active_requests.append(the_request)
+
+    return the_request
+
+
 def apply_transformation(application: Application, gate_id, gate_args, qubits, *args):
     """
     Makes apply transformation request to simulation.
@@ -0,0 +1,168 @@
+# Copyright (c) 2021, COMU Team, Osman Ceylan and etc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 3. Neither the name of the COMU Team organization nor the
+#    names of its contributors may be used to endorse or promote products
+#    derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDER ''AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from queue import Empty
+from typing import Callable, Optional, List, Any
+
+from QDNS.commands import tools
+from QDNS.interactions import request
+from QDNS.tools import simulation_clock
+
+
+class RespondFuture(object):
+    def __init__(self, application, request_: request.REQUEST, on_result: Optional[Callable] = None):
+        """
+        Future of a kernel request. Completed when respond of request arrives.
+
+        Args:
+            application: Asker application.
+            request_: Sent request.
+            on_result: Called with (exit_code, data) once, return value is the result.
+
+        Notes:
+            Futures are completed in application thread while any future waits.
+            Responds of other requests are kept in application old responses.
+        """
+
+        self._application = application
+        self._request = request_
+        self._on_result = on_result
+        self._done = False
+        self._result = None
+
+        application.pending_futures[request_.generic_id] = self
+
+    def set_respond(self, respond_):
+        """ Completes future with respond. """
+
+        if self._done:
+            return
+
+        self._done = True
+        self._application.pending_futures.pop(self.request_id, None)
+
+        if self._on_result is None:
+            self._result = (respond_.exit_code, respond_.data)
+        else:
+            self._result = self._on_result(respond_.exit_code, respond_.data)
+
+    def done(self) -> bool:
+        """ Returns true if respond is arrived. """
+
+        if not self._done:
+            self.__check_old_responses()
+        return self._done
+
+    def result(self, timeout=None) -> Any:
+        """
+        Waits respond of request.
+
+        Args:
+            timeout: Expire time.
+
+        Returns:
+            Result or None if respond is not arrived in time.
+        """
+
+        if timeout is None:
+            timeout = tools.respond_expire_time
+
+        if self.done():
+            return self._result
+
+        deadline = simulation_clock.get_time() + timeout
+        while not self._done:
+            remaning_time = deadline - simulation_clock.get_time()
+            if remaning_time <= 0:
+                return None
+            pump_application_responds(self._application, remaning_time)
+        return self._result
+
+    def __check_old_responses(self):
+        """ Respond may be buffered by a blocking wait. """
+
+        for respond_ in self._application.old_responses:
+            if respond_.generic_id == self.request_id:
+                self._application.old_responses.remove(respond_)
+                self.set_respond(respond_)
+                return
+
+    @property
+    def request(self) -> request.REQUEST:
+        return self._request
+
+    @property
+    def request_id(self) -> int:
+        return self._request.generic_id
+
+
+def pump_application_responds(application, timeout: float) -> bool:
+    """
+    Takes one respond from application respond queue and completes its future.
+    Unmatched responds are kept in old responses.
+
+    Args:
+        application: Application.
+        timeout: Expire time.
+
+    Returns:
+        True if a respond is taken.
+    """
+
+    try:
+        respond_ = simulation_clock.queue_get(application.respond_queue, timeout=timeout)
+    except Empty:
+        return False
+
+    try:
+        future = application.pending_futures[respond_.generic_id]
+    except KeyError:
+        application.old_responses.append(respond_)
+    else:
+        future.set_respond(respond_)
+    return True
+
+
+def gather(*futures: RespondFuture, timeout=None) -> List[Any]:
+    """
+    Waits all futures.
+
+    Args:
+        futures: Futures.
+        timeout: Expire time for all futures.
+
+    Returns:
+        List of results in given order, None for expired ones.
+    """
+
+    if timeout is None:
+        timeout = tools.respond_expire_time
+
+    deadline = simulation_clock.get_time() + timeout
+    results = list()
+    for future in futures:
+        results.append(future.result(timeout=max(deadline - simulation_clock.get_time(), 0.0)))
+    return results
@@ -24,14 +24,14 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import time
 from copy import copy
 
 from QDNS.commands import api
+from QDNS.commands import futures
 from QDNS.commands import tools as command_tools
 from QDNS.device.application import Application
 from QDNS.rtg_apps.qkd import SENDER_SIDE, RECIEVER_SIDE
-from QDNS.tools import communication
+from QDNS.tools import communication, simulation_clock
 
 
 def application_wait_next_package(
@@ -250,7 +250,7 @@ def application_wait_next_qubits(application: Application, count, source=None, t
 
     # Wait loop.
     while 1:
-        start_time = time.time()
+        start_time = simulation_clock.get_time()
         qubit = api.application_wait_next_qubit(application, timeout=timeout)
         if qubit is None:
             return found_qubits, found_count
@@ -276,7 +276,7 @@ def application_wait_next_qubits(application: Application, count, source=None, t
             else:
                 application.old_qubits.append(qubit)
 
-        timeout -= (time.time() - start_time)
+        timeout -= (simulation_clock.get_time() - start_time)
         if timeout <= 0.1:
             return found_qubits, found_count
 
@@ -947,6 +947,30 @@ def application_reset_qubits(application: Application, qubits):
     api.reset_qubits(application, qubits)
 
 
+def application_density_matrix(application: Application, qubits):
+    """
+    Gets density matrix of given qubits. Only density matrix backend responds with a matrix.
+
+    Args:
+        application: Application.
+        qubits: Qubits of density matrix.
+
+    Return:
+         Density matrix or None.
+    """
+
+    the_request = api.density_matrix(application, qubits)
+    respond_ = application_wait_next_Mrespond(application, request_id=the_request.generic_id)
+
+    if respond_ is None:
+        return None
+
+    if respond_[0] < 0:
+        return None
+
+    return respond_[1][0]
+
+
 def application_apply_serial_transformations(application: Application, list_of_gates, *args):
     """
     Makes apply serial transformation request to simulation.
@@ -982,6 +1006,140 @@ def application_apply_transformation(application: Application, qubits, gate_id,
     api.apply_transformation(application, gate_id, gate_args, qubits)
 
 
+def application_allocate_qubit_async(application: Application, *args) -> futures.RespondFuture:
+    """
+    Makes allocate qubit request to simulation without waiting.
+
+    Args:
+        application: Application.
+        *args: Backend specific arguments.
+
+    Return:
+         Future of qubit or None.
+    """
+
+    def on_result(exit_code, data):
+        if exit_code < 0:
+            return None
+        application.allocated_qubits.append(data[0])
+        return data[0]
+
+    return futures.RespondFuture(application, api.allocate_qubit(application, *args), on_result)
+
+
+def application_allocate_qubits_async(application: Application, count, *args) -> futures.RespondFuture:
+    """
+    Makes allocate qubits request to simulation without waiting.
+
+    Args:
+        application: Application.
+        count: Count of qubit.
+        *args: Backend specific arguments.
+
+    Return:
+         Future of qubits or None.
+    """
+
+    def on_result(exit_code, data):
+        if exit_code < 0:
+            return None
+        application.allocated_qubits.extend(data[0])
+        return data[0]
+
+    return futures.RespondFuture(application, api.allocate_qubits(application, count, *args), on_result)
+
+
+def application_measure_qubits_async(application: Application, qubits, *args) -> futures.RespondFuture:
+    """
+    Measures given qubits without waiting.
+
+    Args:
+        application: Application.
+        qubits: Qubits to measure.
+        args: Backend specific arguments.
+
+    Return:
+         Future of results or None.
+    """
+
+    def on_result(exit_code, data):
+        if exit_code < 0:
+            return None
+        return data[0]
+
+    return futures.RespondFuture(application, api.measure_qubits(application, qubits, *args), on_result)
+
+
+def application_generate_entangle_pairs_async(application: Application, count) -> futures.RespondFuture:
+    """
+    Generates entangle pairs without waiting.
+
+    Args:
+        application: Application.
+        count: Count of pairs.
+
+    Returns:
+        Future of List[Pair] or None.
+    """
+
+    def on_result(exit_code, data):
+        if exit_code < 0:
+            return None
+        for frame in data[0]:
+            application.allocated_qubits.extend(frame)
+        return data[0]
+
+    return futures.RespondFuture(application, api.generate_entangle_pairs(application, count), on_result)
+
+
+def application_generate_ghz_pair_async(application: Application, size: int, count: int) -> futures.RespondFuture:
+    """
+    Generates ghz pairs without waiting.
+
+    Args:
+        application: Application.
+        size: Qubit count in ghz state.
+        count: Count of pairs.
+
+    Returns:
+        Future of List[Pair] or None.
+
+    Raises:
+        ValueError: If size is lower than 2.
+    """
+
+    if size <= 1:
+        raise ValueError("GHZ generation size should be more than 1.")
+
+    def on_result(exit_code, data):
+        if exit_code < 0:
+            return None
+        for frame in data[0]:
+            application.allocated_qubits.extend(frame)
+        return data[0]
+
+    return futures.RespondFuture(application, api.generate_ghz_pair(application, size, count), on_result)
+
+
+def application_gather(application: Application, *futures_, timeout=None):
+    """
+    Waits all given futures of application.
+
+    Args:
+        application: Application.
+        futures_: Futures.
+        timeout: Expire time for all futures.
+
+    Returns:
+        List of results in given order, None for expired ones.
+    """
+
+    for future in futures_:
+        if future.request.spesific_asker != application.label:
+            raise ValueError("Future of request {} does not belong to application {}.".format(future.request_id, application.label))
+    return futures.gather(*futures_, timeout=timeout)
+
+
 def application_send_classic_data(application: Application, reciever, data, broadcast=False, routing=True):
     """
     Send classical data to target node.
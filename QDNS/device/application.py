@@ -24,7 +24,6 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import time
 from multiprocessing import Queue as MQueue
 from queue import Queue as TQueue
 from queue import SimpleQueue as TSimpleQueue
@@ -36,7 +35,7 @@ from QDNS.device.tools import application_tools
 from QDNS.device.tools.blocklist import BlockList
 from QDNS.device.tools.listener import Listener
 from QDNS.interactions import signal
-from QDNS.tools import layer, queue_manager, gates
+from QDNS.tools import layer, queue_manager, gates, simulation_clock
 from QDNS.tools.state_handler import StateHandler
 
 
@@ -97,6 +96,7 @@ class Application(layer.Layer):
         self._old_qubits = list()
         self._old_responses = list()
         self._allocated_qubits = list()
+        self._pending_futures = dict()
 
         self.set_respond_queue(MQueue())
         self.logger.debug("Application is created.")
@@ -145,14 +145,14 @@ class Application(layer.Layer):
             return
 
         # Sleep the delay.
-        time.sleep(self.application_settings.delayed_start_time)
+        simulation_clock.sleep(self.application_settings.delayed_start_time)
 
         # Start application.
         self.logger.info("Application is starting...")
-        start_time = time.time()
+        start_time = simulation_clock.get_time()
         self.change_state(application_tools.APPLICATION_IS_RUNNING)
         self._function(self, *self.arguments)
-        end_time = time.time() - start_time
+        end_time = simulation_clock.get_time() - start_time
         end_time = np.around(end_time, 4)
 
         # End application.
@@ -294,6 +294,10 @@ class Application(layer.Layer):
     def old_responses(self):
         return self._old_responses
 
+    @property
+    def pending_futures(self):
+        return self._pending_futures
+
     @property
     def allocated_qubits(self):
         return self._allocated_qubits
@@ -326,7 +330,7 @@ class Application(layer.Layer):
 
     @staticmethod
     def sleep(seconds: float):
-        return time.sleep(seconds)
+        return simulation_clock.sleep(seconds)
 
     @staticmethod
     def calculate_time_delta(datetime_old, datetime_new=None):
@@ -1346,6 +1350,88 @@ class Application(layer.Layer):
 
         return QDNS.library.application_measure_qubits(self, qubits, *args)
 
+    def allocate_qubit_async(self, *args):
+        """
+        Makes allocate qubit request to simulation without waiting.
+
+        Args:
+            *args: Backend specific arguments.
+
+        Return:
+             Future of qubit.
+        """
+
+        return QDNS.library.application_allocate_qubit_async(self, *args)
+
+    def allocate_qubits_async(self, count, *args):
+        """
+        Makes allocate qubits request to simulation without waiting.
+
+        Args:
+            count: Count of qubit.
+            *args: Backend specific arguments.
+
+        Return:
+             Future of qubits.
+        """
+
+        return QDNS.library.application_allocate_qubits_async(self, count, *args)
+
+    def measure_qubits_async(self, qubits, *args):
+        """
+        Measures given qubits without waiting.
+
+        Args:
+            qubits: List of qubits to measure.
+            args: Backend specific arguments.
+
+        Return:
+             Future of results.
+        """
+
+        return QDNS.library.application_measure_qubits_async(self, qubits, *args)
+
+    def generate_entangle_pairs_async(self, count):
+        """
+        Generates entangle pairs without waiting.
+
+        Args:
+            count: Count of pairs.
+
+        Returns:
+            Future of List[Pair].
+        """
+
+        return QDNS.library.application_generate_entangle_pairs_async(self, count)
+
+    def generate_ghz_pair_async(self, size: int, count: int):
+        """
+        Generates ghz pairs without waiting.
+
+        Args:
+            size: Qubit count in ghz state.
+            count: Count of pairs.
+
+        Returns:
+            Future of List[Pair].
+        """
+
+        return QDNS.library.application_generate_ghz_pair_async(self, size, count)
+
+    def gather(self, *futures, timeout=None):
+        """
+        Waits all given futures.
+
+        Args:
+            futures: Futures of this application.
+            timeout: Expire time for all futures.
+
+        Returns:
+            List of results in given order, None for expired ones.
+        """
+
+        return QDNS.library.application_gather(self, *futures, timeout=timeout)
+
     def reset_qubits(self, qubits):
         """
         Measures given qubits.
@@ -1360,6 +1446,19 @@ class Application(layer.Layer):
         # Kernel does not respond this request.
         return QDNS.library.application_reset_qubits(self, qubits)
 
+    def density_matrix(self, qubits):
+        """
+        Gets density matrix of given qubits. Only density matrix backend can give it.
+
+        Args:
+            qubits: Qubits of density matrix.
+
+        Return:
+             Density matrix or None.
+        """
+
+        return QDNS.library.application_density_matrix(self, qubits)
+
     def apply_serial_transformations(self, list_of_gates, *args):
         """
         Makes apply serial transformation request to simulation.
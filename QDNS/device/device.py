@@ -24,11 +24,9 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import threading
-import time
 import uuid
 from queue import Queue as TQueue
-from typing import Optional
+from typing import Optional, Dict
 
 import numpy as np
 
@@ -37,9 +35,8 @@ from QDNS.device.tools import device_tools
 from QDNS.device.tools import socket_tools
 from QDNS.device.tools.application_manager import ApplicationManager
 from QDNS.interactions import request, respond, signal
-from QDNS.tools import layer, queue_manager
+from QDNS.tools import layer, queue_manager, simulation_clock
 from QDNS.tools.state_handler import StateHandler
-from QDNS.tools.various_tools import TerminatableThread
 
 
 class Device(layer.Layer):
@@ -83,9 +80,6 @@ class Device(layer.Layer):
             layer_settings=device_settings
         )
 
-        # Initialize end check thread.
-        self._end_check_thread = None
-
         # Add application manager module.
         self.add_module(ApplicationManager(self, app_manager_settings))
 
@@ -128,9 +122,6 @@ class Device(layer.Layer):
         self.set_threaded_queues(TQueue(), None)
         self.set_state_report_queue(miner_request)
 
-        # Initiazlize end checker thread.
-        self._end_check_thread = TerminatableThread(self.check_finalize, daemon=True)
-
         # Prepair the other modules and layers.
         self._network_socket.prepair_layer(sim_request)
         self.appman.prepair_module()
@@ -147,10 +138,14 @@ class Device(layer.Layer):
         if not self.is_device_active():
             self.logger.warning("Device is not active. This device will not simulate.")
             self.change_state(device_tools.DEVICE_IS_FINISHED)
+            self.__end_dumpings()
             return
 
+        # Device is a clock participant until its applications take over.
+        simulation_clock.enter_participant()
+
         # Sleep start after delay.
-        time.sleep(self.start_after_delay)
+        simulation_clock.sleep(self.start_after_delay)
 
         # Start device.
         self.change_state(device_tools.DEVICE_IS_RUNNING)
@@ -158,12 +153,13 @@ class Device(layer.Layer):
         # Start sub-layers.
         self._network_socket.start_socket()
         self.appman.start_applications()
+        simulation_clock.leave_participant()
 
-        # Start end checker thread.
-        self._end_check_thread.start()
+        # Check once, device may have nothing to run.
+        self.check_finalize()
 
         # Handle interactions in loop.
-        start_time = time.time()
+        start_time = simulation_clock.get_time()
         while 1:
             if self.state_handler.is_breakable():
                 break
@@ -178,22 +174,17 @@ class Device(layer.Layer):
             else:
                 raise ValueError("Unrecognized action for device {}. What \"{}\"?".format(self.label, action))
 
-        # Try terminate end checker.
-        try:
-            self._end_check_thread.terminate()
-        except (KeyError, AttributeError):
-            pass
-
         # Handle idle after simulation.
         if self.idle_after_device_ends:
             self.change_state(device_tools.DEVICE_MAY_END)
 
-            end_time = time.time() - start_time
+            end_time = simulation_clock.get_time() - start_time
             end_time = np.around(end_time, 4)
             self.logger.warning("Device simulation is idled after {} seconds.".format(end_time))
 
             self.user_dump_queue.put([self.label, "DeviceLogs", self.logger.logs])
             self.__end_applications_simulation(user_applications=True)
+            self.__end_dumpings()
 
             while 1:
                 if self.state_handler.is_stopped():
@@ -212,9 +203,34 @@ class Device(layer.Layer):
         self.__end_applications_simulation(all_enabled=True)
         self.__end_socket_simulation()
 
-        end_time = time.time() - start_time
+        end_time = simulation_clock.get_time() - start_time
         end_time = np.around(end_time, 4)
         self.logger.warning("Device simulation is ended in {} seconds.".format(end_time))
+        if not self.idle_after_device_ends:
+            self.__end_dumpings()
+
+    def __end_dumpings(self):
+        """ Dumps queue statistics if queues are instrumented and marks the last dumping of device. """
+
+        if queue_manager.is_queue_instrumentation_enabled():
+            self.user_dump_queue.put([self.label, queue_manager.QUEUE_STATISTICS, self.queue_statistics()])
+        self.user_dump_queue.put([self.label, device_tools.DEVICE_DUMPS_DONE])
+
+    def queue_statistics(self) -> Dict[str, Dict]:
+        """
+        Statistics of instrumented queues of device, its socket and applications.
+
+        Returns:
+            {layer label: {queue label: queue summary}}
+        """
+
+        to_return = {
+            self.label: self.queue_manager.queue_statistics(),
+            self.ntwk_socket.layer_name: self.ntwk_socket.queue_manager.queue_statistics()
+        }
+        for application in self.appman.all_application_list:
+            to_return[application.label] = application.queue_manager.queue_statistics()
+        return to_return
 
     def __handle_request(self, request_: request.REQUEST):
         """ Handles incoming request. """
@@ -242,6 +258,12 @@ class Device(layer.Layer):
             self.appman.update_application_state(
                 self.appman.get_application_from(signal_.source_emiter), signal_.new_state
             )
+            self.check_finalize()
+
+        # Application thread is ended.
+        elif isinstance(signal_, signal.ThreadEndedSignal):
+            self.appman.application_thread_ended(signal_.source_emiter)
+            self.check_finalize()
 
         # End device.
         elif isinstance(signal_, signal.EndDeviceSignal):
@@ -255,18 +277,17 @@ class Device(layer.Layer):
             raise ValueError("Unrecognized signal for device {}. What signal \"{}\"?".format(self.label, signal_))
 
     def check_finalize(self):
-        """ Checks if device can endable in another thread. """
+        """
+        Checks if device can endable.
+        Called on application state changes, so no need to poll.
+        """
 
-        time.sleep(1)
-        while 1:
-            excepted_states = (device_tools.DEVICE_IS_RUNNING,)
-            if self.state in excepted_states and self.appman.is_device_endable():
-                if self.idle_after_device_ends:
-                    self.__end_device(device_tools.DEVICE_MAY_END)
-                else:
-                    self.__end_device(device_tools.DEVICE_IS_FINISHED)
-                return
-            time.sleep(0.25)
+        excepted_states = (device_tools.DEVICE_IS_RUNNING,)
+        if self.state in excepted_states and self.appman.is_device_endable():
+            if self.idle_after_device_ends:
+                self.__end_device(device_tools.DEVICE_MAY_END)
+            else:
+                self.__end_device(device_tools.DEVICE_IS_FINISHED)
 
     def __end_device(self, new_state):
         """ Changing and endable state end device simulation. """
@@ -294,7 +315,7 @@ class Device(layer.Layer):
         """ Requests socket to terminate. """
 
         self.ntwk_socket.threaded_request_queue.put(signal.DeviceEndSocketSignal())
-        time.sleep(1.0)
+        self.ntwk_socket.wait_socket_end(timeout=1.0)
         self.ntwk_socket.terminate_socket()
 
     def create_new_application(
@@ -423,10 +444,6 @@ class Device(layer.Layer):
     def localhost(self):
         return self.appman.localhost_queue
 
-    @property
-    def end_check_thread(self) -> threading.Thread:
-        return self._end_check_thread
-
 
 class Observer(Device):
     def __init__(self, label: str):
@@ -24,7 +24,7 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import time
+import threading
 from copy import deepcopy
 from datetime import timedelta
 from queue import Queue as TQueue, Empty
@@ -41,7 +41,7 @@ from QDNS.device.tools.port import Port
 from QDNS.device.tools.port_manager import PortManager, PortManagerSetting
 from QDNS.interactions import request, signal, respond
 from QDNS.rtg_apps.routing import RoutingLayer
-from QDNS.tools import layer, queue_manager, communication
+from QDNS.tools import layer, queue_manager, communication, simulation_clock
 from QDNS.tools.state_handler import StateHandler
 from QDNS.tools.various_tools import TerminatableThread
 
@@ -77,6 +77,7 @@ class NetworkSocket(layer.Layer):
         self.__request_thread = None
         self.__receive_classic_thread = None
         self.__receive_quantum_thread = None
+        self.__socket_ended = threading.Event()
 
         self._host_device = host_device
 
@@ -113,6 +114,7 @@ class NetworkSocket(layer.Layer):
         self.queue_manager.update_queue(queue_manager.SIM_REQUEST_QUEUE, sim_request_queue)
         self.queue_manager.update_queue(queue_manager.OBSERVER_QUEUE, TQueue())
         self.port_manager.set_sim_request_queue(sim_request_queue)
+        self.__socket_ended = threading.Event()
 
         # Set inside queues.
         self.__receive_classic_thread = TerminatableThread(self.run, args=(CLASSIC_CONTROL_JOB,), daemon=True)
@@ -216,29 +218,29 @@ class NetworkSocket(layer.Layer):
                 for port in self.port_manager.active_connected_classic_ports:
                     port_states[port] = False
 
-                start_time = time.time()
+                start_time = simulation_clock.get_time()
                 while 1:
                     try:
-                        port, ping_package = self.ping_handle_queue.get(timeout=1.75)
+                        port, ping_package = simulation_clock.queue_get(self.ping_handle_queue, timeout=1.75)
                     except Empty:
                         break
                     else:
                         port = self.port_manager.get_port(port, classic=True, quantum=True)
                         port.set_target_device_id(ping_package.device_id)
-                        port.set_latency(time.time() - ping_package.ping_time)
+                        port.set_latency(simulation_clock.get_time() - ping_package.ping_time)
                         port_states[port] = True
 
                 for port in port_states:
                     if not port_states[port]:
                         self.logger.warning("Connection beetwen {} and {} is probably removed.".format(self.host_label, port.target_device_id.label))
                         self.port_manager.unconnect_port(port, soft=True)
-                process_time = time.time() - start_time
+                process_time = simulation_clock.get_time() - start_time
 
                 if self.auto_ping:
                     if process_time < ping_time:
-                        time.sleep(ping_time - process_time)
+                        simulation_clock.sleep(ping_time - process_time)
                     else:
-                        time.sleep(0.01)
+                        simulation_clock.sleep(0.01)
 
                     if self.socket_settings.clear_route_cache:
                         signal_ = signal.FlushRouteData()
@@ -257,7 +259,7 @@ class NetworkSocket(layer.Layer):
                         respond.RefreshConnectionsRespond(
                             request_.generic_id, 0, port_dict, process_time
                         ).process(self.host_device.appman.get_application_from(request_.spesific_asker, _raise=True).threaded_respond_queue)
-                    time.sleep(0.1)
+                    simulation_clock.sleep(0.1)
 
                 first_time = False
         else:
@@ -503,7 +505,7 @@ class NetworkSocket(layer.Layer):
         if isinstance(package, communication.PingRequestPackage):
             if not port.is_unconnected():
                 port.set_target_device_id(package.device_id)
-                port.set_latency(time.time() - package.ping_time)
+                port.set_latency(simulation_clock.get_time() - package.ping_time)
 
             if not self.host_device.otg_device:
                 self.port_manager.send_classic_information(port, communication.PingRespondPackage(self.host_device_id), check_active=False)
@@ -634,7 +636,7 @@ class NetworkSocket(layer.Layer):
         if isinstance(qupack, communication.PingRequestPackage):
             if not port.is_unconnected():
                 port.set_target_device_id(qupack.device_id)
-                port.set_latency(time.time() - qupack.ping_time)
+                port.set_latency(simulation_clock.get_time() - qupack.ping_time)
 
             if not self.host_device.otg_device:
                 self.port_manager.send_quantum_information(port, communication.PingRespondPackage(self.host_device_id), check_active=False)
@@ -927,8 +929,22 @@ class NetworkSocket(layer.Layer):
         self.host_device.user_dump_queue.put([self.host_label, "SocketLogs", self.logger.logs])
         self.change_state(socket_tools.SOCKET_IS_OVER)
         self.threaded_request_queue.put(signal.DeviceEndSocketSignal(socket_tools.SOCKET_IS_OVER))
+        self.__socket_ended.set()
         self.logger.warning("Socket of device {} is ended.".format(self.host_label))
 
+    def wait_socket_end(self, timeout=None) -> bool:
+        """
+        Waits until socket simulation is ended.
+
+        Args:
+            timeout: Maximum wait time in seconds.
+
+        Returns:
+            True if socket is ended before timeout.
+        """
+
+        return self.__socket_ended.wait(timeout=timeout)
+
     def terminate_socket(self):
         """ Terminates socket simulation. """
 
@@ -26,7 +26,7 @@
 
 import threading
 from queue import Queue as TQueue
-from typing import Optional, List, Dict, Union
+from typing import Optional, List, Dict, Union, Set
 
 from QDNS.device.application import Application
 from QDNS.device.tools import application_tools
@@ -34,6 +34,7 @@ from QDNS.device.tools import device_tools
 from QDNS.interactions import signal
 from QDNS.rtg_apps.qkd import QKDLayer
 from QDNS.rtg_apps.routing import RoutingLayer
+from QDNS.tools import simulation_clock
 from QDNS.tools.layer import ID_DEVICE
 from QDNS.tools.module import Module
 from QDNS.tools.various_tools import TerminatableThread
@@ -64,12 +65,14 @@ class ApplicationManager(Module):
 
         # Create nessesary lists.
         self._all_application_list: List[Application] = list()
+        self._application_labels: Dict[str, Application] = dict()
         self._enabled_application_list: List[Application] = list()
         self._static_application_list: List[Application] = list()
         self._default_apps: Dict[str, Application] = dict()
         self._user_apps: List[Application] = list()
         self._application_states: Dict[Application, str] = dict()
         self._application_thread_dict: Dict[Application, TerminatableThread] = dict()
+        self._ended_applications: Set[Application] = set()
 
         # Prepare localhost at prepair_module time.
         self._localhost_queue = None
@@ -85,10 +88,33 @@ class ApplicationManager(Module):
 
         if from_list is None:
             from_list = self.enabled_application_list
+        self._ended_applications.clear()
         for application in from_list:
-            self._application_thread_dict[application] = TerminatableThread(application.run, daemon=True)
+            self._application_thread_dict[application] = TerminatableThread(
+                self.__run_application, daemon=True, args=(application,)
+            )
         self.logger.debug("Module prepaired with {} threads.".format(from_list.__len__()))
 
+    def __run_application(self, application: Application):
+        """ Runs the application and signals host device when its thread ends. """
+
+        participant = self.__is_clock_participant(application)
+        if participant:
+            simulation_clock.enter_participant()
+
+        try:
+            application.run()
+        finally:
+            if participant:
+                simulation_clock.leave_participant()
+            signal.ThreadEndedSignal(application).emit(self.host_device.threaded_request_queue)
+
+    @staticmethod
+    def __is_clock_participant(application: Application) -> bool:
+        """ User applications hold virtual time while they run, static ones only serve others. """
+
+        return not application.is_static() and not application.is_disabled()
+
     def create_new_application(
             self, function, *args, label: Optional[str] = None,
             static=None, enabled=None, end_device_if_terminated=None,
@@ -160,7 +186,7 @@ class ApplicationManager(Module):
         if for_return.is_enabled():
             self._enabled_application_list.append(for_return)
         self._user_apps.append(for_return)
-        self._all_application_list.append(for_return)
+        self.__register_application(for_return)
         self._application_states[for_return] = application_tools.APPLICATION_NOT_STARTED
 
         self.logger.info("Application {} is added to device".format(for_return.label))
@@ -181,16 +207,10 @@ class ApplicationManager(Module):
         """
 
         if isinstance(item, Application):
-            for application in self._all_application_list:
-                if application == item:
-                    return True
-            return False
+            return item in self._application_states
 
         elif isinstance(item, str):
-            for application in self._all_application_list:
-                if application.label == item:
-                    return True
-            return False
+            return item in self._application_labels
 
         elif isinstance(item, int):
             for i, app in self._all_application_list:
@@ -229,9 +249,7 @@ class ApplicationManager(Module):
             return None
 
         elif isinstance(item, str):
-            for application in self._all_application_list:
-                if application.label == item:
-                    return application
+            return self._application_labels[item]
 
         elif isinstance(item, Application):
             return item
@@ -241,6 +259,12 @@ class ApplicationManager(Module):
                 raise ValueError("Application {} is not found in this device {}.".format(item, self._host_device.label))
             return None
 
+    def __register_application(self, application: Application):
+        """ Adds application to all application list and label index. """
+
+        self._all_application_list.append(application)
+        self._application_labels[application.label] = application
+
     def start_applications(self, application: Optional[Application] = None, from_list=None):
         """
         Starts applications.
@@ -249,15 +273,21 @@ class ApplicationManager(Module):
 
         if application is not None:
             try:
-                self._application_thread_dict[application].start()
+                thread = self._application_thread_dict[application]
             except KeyError:
                 raise KeyError("Application {} is not prepared for simulation.".format(application.label))
+
+            if self.__is_clock_participant(application):
+                simulation_clock.add_participants(1)
+            thread.start()
             return
 
         if from_list is None:
             from_list = self.enabled_application_list
 
         for application in from_list:
+            if self.__is_clock_participant(application):
+                simulation_clock.add_participants(1)
             self._application_thread_dict[application].start()
 
     def update_application_state(self, application: Application, new_state):
@@ -284,14 +314,16 @@ class ApplicationManager(Module):
         """
 
         for app in self.application_states:
-            thread = self._application_thread_dict[app]
-            if not thread.is_alive() and self._application_states[app] == application_tools.APPLICATION_IS_RUNNING:
+            if self.is_application_alive(app):
+                continue
+
+            if self._application_states[app] == application_tools.APPLICATION_IS_RUNNING:
                 self._application_states[app] = application_tools.APPLICATION_IS_TERMINATED
                 self.logger.warning("Application {} is probably terminated.".format(app.label))
                 if app.end_device_if_terminated:
                     signal.EndDeviceSignal(app.label).emit(self.host_device.threaded_request_queue)
 
-            if not thread.is_alive() and self._application_states[app] == application_tools.APPLICATION_IS_PAUSED:
+            if self._application_states[app] == application_tools.APPLICATION_IS_PAUSED:
                 self._application_states[app] = application_tools.APPLICATION_IS_TERMINATED
                 self.logger.warning("Application {} is probably terminated.".format(app.label))
                 signal.EndDeviceSignal(app.label).emit(self.host_device.threaded_request_queue)
@@ -304,10 +336,39 @@ class ApplicationManager(Module):
 
         self.update_application_matched_states()
         for application in self.application_thread_dict:
-            if self.application_thread_dict[application].is_alive() and not application.is_static():
+            if self.is_application_alive(application) and not application.is_static():
                 return False
         return True
 
+    def application_thread_ended(self, application: Application):
+        """
+        Marks thread of application as ended.
+
+        Args:
+            application: Application object.
+        """
+
+        self._ended_applications.add(application)
+
+    def is_application_alive(self, application: Application) -> bool:
+        """
+        Checks if thread of application is still running.
+
+        Args:
+            application: Application object.
+
+        Returns:
+            True if application thread is not ended yet.
+        """
+
+        if application in self._ended_applications:
+            return False
+
+        try:
+            return self._application_thread_dict[application].is_alive()
+        except KeyError:
+            return False
+
     def append_application(self, application: Application, _raise=False) -> bool:
         """
         Appends new application to this device.
@@ -332,7 +393,7 @@ class ApplicationManager(Module):
                 return False
 
         application.change_host_device(self._host_device)
-        self._all_application_list.append(application)
+        self.__register_application(application)
 
         if application.is_static():
             self._static_application_list.append(application)
@@ -355,7 +416,7 @@ class ApplicationManager(Module):
 
         routing = RoutingLayer(self.host_device)
 
-        self.all_application_list.append(routing)
+        self.__register_application(routing)
 
         if routing.is_enabled():
             self.enabled_application_list.append(routing)
@@ -376,7 +437,7 @@ class ApplicationManager(Module):
             return False
 
         qkd = QKDLayer(self.host_device)
-        self.all_application_list.append(qkd)
+        self.__register_application(qkd)
 
         if qkd.is_enabled():
             self.enabled_application_list.append(qkd)
@@ -39,6 +39,9 @@ DEVICE_IS_TERMINATED = "\"device is terminated\""
 DEVICE_IS_PAUSED = "\"device is paused\""
 DEVICE_MAY_END = "\"device may end\""
 
+# Last dumping of a device, nothing is dumped after it.
+DEVICE_DUMPS_DONE = "DumpsDone"
+
 device_states = (
     DEVICE_NOT_STARTED,
     DEVICE_IS_RUNNING,
@@ -24,12 +24,17 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import itertools
+import time
 from datetime import datetime
-from typing import Any, Tuple
+from typing import Any, Tuple, Optional
 
 import numpy as np
 
-from QDNS.tools import layer
+from QDNS.tools import layer, queue_manager
+
+# Generic ids are unique in a process, many requests can be in flight at once.
+_generic_id_counter = itertools.count(np.random.randint(0, 100000))
 
 
 class REQUEST(object):
@@ -68,9 +73,10 @@ class REQUEST(object):
         self._spesific_target = spesific_target
         self._want_respond = want_respond
         self._creation_date = datetime.now()
+        self._enqueue_time = time.time() if queue_manager.is_queue_instrumentation_enabled() else None
 
         if want_respond:
-            self._generic_id = np.random.randint(0, 100000)
+            self._generic_id = next(_generic_id_counter)
 
     def data_(self, index: int) -> Any:
         """
@@ -94,6 +100,8 @@ class REQUEST(object):
     def process(self, queue) -> None:
         """ Process the request. """
 
+        if queue_manager.is_queue_instrumentation_enabled():
+            self._enqueue_time = time.time()
         queue.put(self)
 
     @property
@@ -124,6 +132,10 @@ class REQUEST(object):
     def creation_date(self):
         return self._creation_date
 
+    @property
+    def enqueue_time(self) -> Optional[float]:
+        return self._enqueue_time
+
     @property
     def details(self) -> str:
         text: str = ""
@@ -693,6 +705,26 @@ class ResetQubitsRequest(REQUEST):
         self.qubits = self.data[2]
 
 
+class DensityMatrixRequest(REQUEST):
+    def __init__(self, asker_app, asker_uuid, qubits):
+        """
+        An application request for density matrix of qubits.
+
+        Args:
+             asker_app: Asker app label.
+             asker_uuid: Asker device UUID.
+             qubits: Qubits of density matrix.
+        """
+
+        super(DensityMatrixRequest, self).__init__(
+            layer.ID_APPLICATION, layer.ID_SIMULATION,
+            asker_uuid, qubits, spesific_asker=asker_app, want_respond=True
+        )
+
+        self.asker_uuid = self.data[0]
+        self.qubits = self.data[1]
+
+
 class ApplyTransformationRequest(REQUEST):
     def __init__(self, asker_app, asker_uuid, gate_id, gate_args, qubits, *args):
         """
@@ -24,10 +24,11 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import time
 from datetime import datetime
-from typing import Any, Tuple
+from typing import Any, Tuple, Optional
 
-from QDNS.tools import layer
+from QDNS.tools import layer, queue_manager
 
 
 class RESPOND(object):
@@ -73,6 +74,7 @@ class RESPOND(object):
         self._spesific_target = spesific_target
         self._spesific_target_integration = spesific_target_integration
         self._creation_date = datetime.now()
+        self._enqueue_time = time.time() if queue_manager.is_queue_instrumentation_enabled() else None
 
     def data_(self, index: int) -> Any:
         """
@@ -100,6 +102,8 @@ class RESPOND(object):
         :return: None
         """
 
+        if queue_manager.is_queue_instrumentation_enabled():
+            self._enqueue_time = time.time()
         queue.put(self)
 
     @property
@@ -126,6 +130,10 @@ class RESPOND(object):
     def creation_date(self):
         return self._creation_date
 
+    @property
+    def enqueue_time(self) -> Optional[float]:
+        return self._enqueue_time
+
     @property
     def spesific_target_integration(self):
         return self._spesific_target_integration
@@ -706,6 +714,26 @@ class ResetQubitsRespond(RESPOND):
         )
 
 
+class DensityMatrixRespond(RESPOND):
+    def __init__(self, generic_id, exit_code, matrix, spesific_target=None):
+        """
+        Simulation respond to density matrix request.
+
+        Args:
+            generic_id: Request ID.
+            exit_code: Exit Code.
+            matrix: Density matrix.
+            spesific_target: Application label.
+        """
+
+        super().__init__(
+            generic_id, layer.ID_SIMULATION, layer.ID_APPLICATION,
+            exit_code, matrix, spesific_target=spesific_target
+        )
+
+        self.matrix = self.data[0]
+
+
 class ApplyTransformationRespond(RESPOND):
     def __init__(self, generic_id, exit_code, spesific_target=None):
         """
@@ -24,8 +24,11 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import time
 from datetime import datetime
-from typing import Tuple, Any
+from typing import Tuple, Any, Optional
+
+from QDNS.tools import queue_manager
 
 
 class SIGNAL(object):
@@ -37,6 +40,7 @@ class SIGNAL(object):
         STATE_REPORT = "A layer signals its state to up layer."
         END_LAYER_SIGNAL = "A layer signals to up layer for end itself."
         END_QKD_LAYER = "A layer signals to qkd layer to end itself."
+        THREAD_ENDED = "A layer signals to up layer that its thread is ended."
 
     class SocketToSim:
         CONNECTION_CHANGED = "Connection changed between socket layers.."
@@ -47,6 +51,9 @@ class SIGNAL(object):
     class SimToMiner:
         DISTRABUTE_ACTION = "Simulation layer commands miner to send an action to all devices."
 
+    class AnyToSim:
+        SCHEDULE_CLOCK_EVENT = "A layer schedules an event on simulation clock."
+
     @staticmethod
     def is_legit_signal(signal) -> bool:
         """
@@ -81,6 +88,7 @@ class SIGNAL(object):
         self._data = data
         self._source_emiter = source_emiter
         self._creation_date = datetime.now()
+        self._enqueue_time = time.time() if queue_manager.is_queue_instrumentation_enabled() else None
         self._emited = False
 
         if not self.is_legit_signal(self._header):
@@ -100,6 +108,8 @@ class SIGNAL(object):
         if self._emited:
             raise ValueError("Can not emit a signal second time. Singal info: {}\n".format(self))
         self._emited = True
+        if queue_manager.is_queue_instrumentation_enabled():
+            self._enqueue_time = time.time()
         target.put(self)
 
     def data_(self, index: int) -> Any:
@@ -138,6 +148,10 @@ class SIGNAL(object):
     def createion_date(self):
         return self._creation_date
 
+    @property
+    def enqueue_time(self) -> Optional[float]:
+        return self._enqueue_time
+
     @property
     def details(self) -> str:
         text: str = ""
@@ -160,7 +174,8 @@ class SIGNAL(object):
 known_signals = dict()
 known_signals["Common"] = (
     SIGNAL.Common.STATE_REPORT,
-    SIGNAL.Common.END_LAYER_SIGNAL
+    SIGNAL.Common.END_LAYER_SIGNAL,
+    SIGNAL.Common.THREAD_ENDED
 )
 known_signals["SocketToSim"] = (
     SIGNAL.SocketToSim.CONNECTION_CHANGED,
@@ -171,6 +186,9 @@ known_signals["SimToApp"] = (
 known_signals["SimToMiner"] = (
     SIGNAL.SimToMiner.DISTRABUTE_ACTION,
 )
+known_signals["AnyToSim"] = (
+    SIGNAL.AnyToSim.SCHEDULE_CLOCK_EVENT,
+)
 
 
 class StateReportSignal(SIGNAL):
@@ -218,6 +236,18 @@ class DeviceEndSocketSignal(SIGNAL):
         self.new_state = self._data[0]
 
 
+class ThreadEndedSignal(SIGNAL):
+    def __init__(self, source):
+        """
+        A thread of application / device signals to its host that it is ended.
+
+        Args:
+            source: Source layer object.
+        """
+
+        super(ThreadEndedSignal, self).__init__(SIGNAL.Common.THREAD_ENDED, source_emiter=source)
+
+
 class TerminateSocketSignal(SIGNAL):
     def __init__(self):
         """
@@ -291,3 +321,16 @@ class EndQKDLayer(SIGNAL):
         """
 
         super(EndQKDLayer, self).__init__(SIGNAL.Common.END_QKD_LAYER)
+
+
+class ScheduleClockEventSignal(SIGNAL):
+    def __init__(self, event_time: float):
+        """
+        Any layer signals kernel to schedule an event on virtual clock.
+
+        Args:
+            event_time: Virtual time of event.
+        """
+
+        super(ScheduleClockEventSignal, self).__init__(SIGNAL.AnyToSim.SCHEDULE_CLOCK_EVENT, event_time)
+        self.event_time = self._data[0]
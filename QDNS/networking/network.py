@@ -25,7 +25,7 @@
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import uuid
-from typing import List, Union
+from typing import List, Union, Dict
 
 import matplotlib.pyplot as plt
 import networkx
@@ -49,6 +49,7 @@ class Network(object):
         """
 
         self.device_list: List[Device] = list()
+        self._device_index: Dict[Union[str, uuid.UUID], Device] = dict()
         self.classic_channels: List[ClassicChannel] = list()
         self.quantum_channels: List[QuantumChannel] = list()
         self.classic_network = networkx.Graph()
@@ -57,6 +58,7 @@ class Network(object):
         for device in devices:
             if device not in self.device_list:
                 self.device_list.append(device)
+                self.__index_device(device)
                 self.classic_network.add_node(device.uuid)
                 self.quantum_network.add_node(device.uuid)
 
@@ -74,9 +76,26 @@ class Network(object):
         for device in devices:
             if device not in self.device_list:
                 self.device_list.append(device)
+                self.__index_device(device)
                 self.classic_network.add_node(device)
                 self.quantum_network.add_node(device)
 
+    def __index_device(self, device: Device):
+        """ Adds device to uuid / label index. First device keeps a shared label. """
+
+        self._device_index[device.uuid] = device
+        try:
+            _ = self._device_index[device.label]
+        except KeyError:
+            self._device_index[device.label] = device
+
+    def rebuild_device_index(self):
+        """ Rebuilds uuid / label index of devices. """
+
+        self._device_index.clear()
+        for device in self.device_list:
+            self.__index_device(device)
+
     def add_classic_channel(self, device_l: Device, device_r: Device):
         """
         Adds classic channel between devices.
@@ -180,10 +199,9 @@ class Network(object):
         else:
             to_delete = list()
             for node in route:
-                for device in self.device_list:
-                    if node == device.uuid and device.otg_device:
-                        to_delete.append(node)
-                        break
+                device = self.get_device(node, _raise=False)
+                if device is not None and device.otg_device:
+                    to_delete.append(node)
             for item in to_delete:
                 route.remove(item)
             return route
@@ -207,10 +225,9 @@ class Network(object):
         else:
             to_delete = list()
             for node in route:
-                for device in self.device_list:
-                    if node == device.uuid and device.otg_device:
-                        to_delete.append(node)
-                        break
+                device = self.get_device(node, _raise=False)
+                if device is not None and device.otg_device:
+                    to_delete.append(node)
             for item in to_delete:
                 route.remove(item)
             return route
@@ -236,19 +253,11 @@ class Network(object):
                 raise ValueError("Device is not found by key {}.".format(key))
             return None
 
-        elif isinstance(key, str):
-            for device in self.device_list:
-                if device.label == key or device.uuid == key:
-                    return device
-
-            if _raise:
-                raise ValueError("Device is not found by key {}.".format(key))
-            return None
-
-        elif isinstance(key, uuid.UUID):
-            for device in self.device_list:
-                if device.uuid == key:
-                    return device
+        elif isinstance(key, (str, uuid.UUID)):
+            try:
+                return self._device_index[key]
+            except KeyError:
+                pass
 
             if _raise:
                 raise ValueError("Device is not found by key {}.".format(key))
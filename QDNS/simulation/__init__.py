@@ -1,2 +1,2 @@
-__all__ = ["controller", "kernel", "miner", "tools"]
+__all__ = ["controller", "kernel", "miner", "results", "scheduler", "shard", "tools"]
 
@@ -98,6 +98,30 @@ class MinerController(Module):
         for miner in self._miner_list:
             miner.start()
 
+    def terminate_module(self):
+        """
+        Terminates processes of last simulation.
+        Simulation kernel should this method.
+        """
+
+        for miner in self._miner_list:
+            if miner.is_alive():
+                miner.terminate()
+
+        # Join started ones for not to leave zombie processes.
+        for miner in self._miner_list:
+            if miner.pid is not None:
+                miner.join()
+
+    def set_queues(self, kernel_request_queue, user_dump_queue):
+        """
+        Sets kernel queues for next processes.
+        Must call before prepair_module.
+        """
+
+        self._kernel_request_queue = kernel_request_queue
+        self._user_dump_queue = user_dump_queue
+
     def update_miner_matched_states(self):
         """ Updates process states by given reports. """
 
@@ -120,6 +144,10 @@ class MinerController(Module):
         for miner in self._miner_list:
             if self._miner_states[miner] == tools.MINER_IS_RUNNING:
                 return False
+
+            # Miner did not report yet.
+            if self._miner_states[miner] == tools.MINER_NOT_STARTED and miner.is_alive():
+                return False
         return True
 
     def get_miner(self, key: Union[int, str, Device], _raise=True) -> Union[Process, None]:
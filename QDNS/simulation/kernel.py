@@ -25,33 +25,45 @@
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import multiprocessing
-import threading
+import os
+import tempfile
 import time
-from typing import Optional
+from queue import Empty
+from typing import Optional, List, Dict, Callable, Set, Tuple
 
+import networkx
 import numpy as np
 
 from QDNS.backend.backend_wrapper import BackendWrapper
-from QDNS.backend.tools.config import BackendConfiguration
+from QDNS.backend.stim_backend import sample_circuit
+from QDNS.backend.tools.config import BackendConfiguration, STIM_BACKEND
 from QDNS.backend.tools.noise import default_noise_pattern
 from QDNS.interactions import request, signal, respond
 from QDNS.networking.network import Network
 from QDNS.rtg_apps.routing import RoutingLayer
 from QDNS.simulation import tools
 from QDNS.simulation.controller import MinerController
-from QDNS.tools import layer, queue_manager
+from QDNS.simulation.results import ResultStreamWriter, SimulationResults, ShotSamples, KERNEL_RECORD
+from QDNS.simulation.scheduler import KernelScheduler, request_qubits
+from QDNS.simulation.shard import KernelShard, ShardJoin, resolve_shard_qubit_id, resolve_shard_indexes
+from QDNS.tools import layer, queue_manager, simulation_clock
 from QDNS.tools.state_handler import StateHandler
 
 
 class Kernel(layer.Layer):
-    def __init__(self, process_controller_settings=tools.default_controller_settings):
+    def __init__(self, process_controller_settings=tools.default_controller_settings, kernel_settings=None):
         """
         Simulation kernel.
 
         Args:
             process_controller_settings: Process controller setting.
+            kernel_settings: Kernel settings, default is tools.default_kernel_settings.
         """
 
+        if kernel_settings is None:
+            kernel_settings = tools.default_kernel_settings
+        self._kernel_settings: tools.KernelSettings = kernel_settings
+
         # Set a state handler to kernel layer.
         state_handler = StateHandler(
             layer.ID_SIMULATION[0], False, *tools.simulation_states,
@@ -77,23 +89,226 @@ class Kernel(layer.Layer):
         self.add_module(MinerController(self.request_queue, self.user_dump_queue, process_controller_settings))
         self.add_module(BackendWrapper())
 
+        # Request type to handler tables.
+        self._request_handlers: Dict[type, Callable] = {
+            request.FindClassicRouteRequest: self.__find_classic_route,
+            request.FindQuantumRouteRequest: self.__find_quantum_route,
+            request.ChangeChannelLenght: self.__change_channel_length,
+        }
+        self._backend_handlers: Dict[type, Callable] = {
+            request.AllocateQubitRequest: self.__allocate_qubit,
+            request.AllocateQubitsRequest: self.__allocate_qubits,
+            request.AllocateQFrameRequest: self.__allocate_qframe,
+            request.AllocateQFramesRequest: self.__allocate_qframes,
+            request.DeallocateQubitRequest: self.__deallocate_qubit,
+            request.MeasureQubitsRequest: self.__measure_qubits,
+            request.ResetQubitsRequest: self.__reset_qubits,
+            request.DensityMatrixRequest: self.__density_matrix,
+            request.ApplyTransformationRequest: self.__apply_transformation,
+            request.GenerateEPRRequest: self.__generate_epr,
+            request.GenerateGHZRequest: self.__generate_ghz,
+            request.ApplyChannelError: self.__apply_channel_error,
+            request.ApplySerialTransformationsRequest: self.__apply_serial_transformations,
+        }
+        self._batch_handlers: Dict[type, Callable] = {
+            request.AllocateQubitRequest: self.__allocate_qubit_batch,
+            request.AllocateQubitsRequest: self.__allocate_qubits_batch,
+            request.MeasureQubitsRequest: self.__measure_qubits_batch,
+        }
+
+        # Failed responds of backend requests, sent when a request cannot be served.
+        self._failure_responds: Dict[type, Callable] = {
+            request.AllocateQubitRequest: lambda generic_id: respond.AllocateQubitRespond(generic_id, -1, None),
+            request.AllocateQubitsRequest: lambda generic_id: respond.AllocateQubitsRespond(generic_id, -1, None),
+            request.AllocateQFrameRequest: lambda generic_id: respond.AllocateQFrameRespond(generic_id, -1, None),
+            request.AllocateQFramesRequest: lambda generic_id: respond.AllocateQFramesRespond(generic_id, -1, None),
+            request.DeallocateQubitRequest: lambda generic_id: respond.DeallocateQubitRespond(generic_id, -1),
+            request.MeasureQubitsRequest: lambda generic_id: respond.MeasureQubitsRespond(generic_id, -1, None),
+            request.ResetQubitsRequest: lambda generic_id: respond.ResetQubitsRespond(generic_id, -1),
+            request.DensityMatrixRequest: lambda generic_id: respond.DensityMatrixRespond(generic_id, -1, None),
+            request.ApplyTransformationRequest: lambda generic_id: respond.ApplyTransformationRespond(generic_id, -1),
+            request.GenerateEPRRequest: lambda generic_id: respond.GenerateEPRRespond(generic_id, -1, None),
+            request.GenerateGHZRequest: lambda generic_id: respond.GenerateGHZRespond(generic_id, -1, None),
+            request.ApplyChannelError: lambda generic_id: respond.ApplyChannelErrorRespond(generic_id, -1),
+            request.ApplySerialTransformationsRequest: lambda generic_id: respond.ApplySerialTransformationsRespond(generic_id, -1),
+        }
+
+        # Scheduler of pending actions, None when actions are handled in arrival order.
+        self._scheduler: Optional[KernelScheduler] = None
+
+        # Kernel shards, None when kernel serves backend itself.
+        self._shards: Optional[List[KernelShard]] = None
+        self._device_shards: Dict = dict()
+
+        # Backend session, backend is kept alive between simulations while active.
+        self._session_active = False
+
+        # Measurements (device label, application label, qubit count) and circuit of recorded simulation.
+        self._recorded_measurements: Optional[List[Tuple[str, str, int]]] = None
+        self._recorded_circuit = None
+
         self._running_network: Optional[Network] = None
-        self.__end_check_thread = None
+        self._respond_queues: Dict = dict()
+        self._clock: Optional[simulation_clock.SimulationClock] = None
+
+    def start_session(self, backend_conf: BackendConfiguration, noise_pattern=default_noise_pattern):
+        """
+        Starts backend once for multiple simulations.
+        Following simulate calls only reset the backend instead of starting it.
+
+        Args:
+            backend_conf: Backend Configuration.
+            noise_pattern: Noise pattern for backend.
+
+        Raises:
+            ValueError: If a session is already started.
+        """
+
+        if self._session_active:
+            raise ValueError("Kernel session is already started.")
+
+        self.__start_backend(backend_conf, noise_pattern)
+        self._session_active = True
+        self.logger.info("Kernel session is started.")
+
+    def end_session(self):
+        """ Terminates backend of session. """
+
+        if not self._session_active:
+            return
+
+        self._session_active = False
+        self.__terminate_backend()
+        self.logger.info("Kernel session is ended.")
+
+    def is_session_active(self) -> bool:
+        """ Returns true if backend is kept alive between simulations. """
+
+        return self._session_active
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.end_session()
+
+    def sample_shots(
+            self, network: Network, shots: int,
+            backend_conf: Optional[BackendConfiguration] = None,
+            noise_pattern=None,
+            time_mode=simulation_clock.REAL_TIME_MODE,
+            seed: Optional[int] = None
+    ) -> Tuple[SimulationResults, ShotSamples]:
+        """
+        Simulates network once while recording backend operations as a stim circuit,
+        then samples measurements of recorded circuit for many shots at once.
+
+        Args:
+            network: Network to simulate.
+            shots: Shot count.
+            backend_conf: Stim backend configuration. May be None in a session.
+            noise_pattern: Noise pattern for backend, default is default_noise_pattern or session noise pattern.
+            time_mode: Real time or virtual (discrete-event) time.
+            seed: Sampler seed, random if None.
+
+        Returns:
+            Results of recorded simulation and sampled measurements of shots.
+
+        Raises:
+            ValueError: If backend is not stim, kernel is sharded or shot count is not positive.
+
+        Notes:
+            Shots repeat the recorded run with its classical decisions; only quantum randomness and noise
+            are sampled again. Protocols that choose gates by measurement results are not sampled correctly.
+        """
+
+        if shots < 1:
+            raise ValueError("Shot count must be positive but {}.".format(shots))
+
+        if self.kernel_settings.shard_count > 1:
+            raise ValueError("Shots can not be sampled on kernel shards.")
+
+        if self._session_active:
+            backend = self.__session_backend_wrapper().configuration.backend
+        elif backend_conf is not None:
+            backend = backend_conf.backend
+        else:
+            backend = None
+        if backend is not None and backend != STIM_BACKEND:
+            raise ValueError("Shots can only be sampled on stim backend but {}.".format(backend))
+
+        self._recorded_measurements = list()
+        try:
+            results = self.simulate(network, backend_conf, noise_pattern, time_mode)
+            circuit = self._recorded_circuit
+            measurements = self._recorded_measurements
+        finally:
+            self._recorded_measurements = None
+            self._recorded_circuit = None
+
+        start_time = time.time()
+        samples = sample_circuit(circuit, shots, seed)
+        self.logger.warning("Sampled {} shots of {} measurements in {} seconds.".format(
+            shots, circuit.num_measurements, np.around(time.time() - start_time, 4))
+        )
+        return results, ShotSamples(samples, measurements)
 
     def simulate(
             self, network: Network,
-            backend_conf: BackendConfiguration,
-            noise_pattern=default_noise_pattern,
-    ) -> tools.SimulationResults:
+            backend_conf: Optional[BackendConfiguration] = None,
+            noise_pattern=None,
+            time_mode=simulation_clock.REAL_TIME_MODE
+    ) -> SimulationResults:
         """
         Simulation is starting here.
 
         Args:
             network: Network to simulate.
-            backend_conf: Backend Configuration.
-            noise_pattern: Noise pattern for backend.
+            backend_conf: Backend Configuration. May be None in a session.
+            noise_pattern: Noise pattern for backend, default is default_noise_pattern or session noise pattern.
+            time_mode: Real time or virtual (discrete-event) time.
+
+        Raises:
+            ValueError: If backend configuration is missing or differs from the session.
+
+        Notes:
+            In virtual time mode; sleeps, expire times and ping waits are scheduled
+            on a virtual clock. Clock jumps to the next event when kernel is idle and every
+            user application waits on clock or a queue. Messages in flight between device layers
+            are not tracked, so virtual time results are not guaranteed to be reproducible.
+
+            In a session (see start_session), backend of session is reset and reused.
         """
 
+        if time_mode not in simulation_clock.time_modes:
+            raise ValueError("Unknown time mode {}.".format(time_mode))
+
+        if self._session_active:
+            if backend_conf is not None and backend_conf is not self.__session_backend_wrapper().configuration:
+                raise ValueError("Kernel session is started with another backend configuration.")
+            if noise_pattern is not None and noise_pattern is not self.__session_backend_wrapper().noise_pattern:
+                raise ValueError("Kernel session is started with another noise pattern.")
+            backend_conf = self.__session_backend_wrapper().configuration
+
+        elif backend_conf is None:
+            raise ValueError("Backend configuration is needed out of a kernel session.")
+
+        if noise_pattern is None:
+            noise_pattern = default_noise_pattern
+
+        # Previous processes may still write to old queues, renew them.
+        if self.state != tools.SIMULATION_NOT_STARTED:
+            self.__renew_queues()
+
+        if self.kernel_settings.fair_scheduling:
+            self._scheduler = KernelScheduler(self._backend_handlers, self.kernel_settings.priority_weights)
+        else:
+            self._scheduler = None
+
+        # Processes inherit instrumentation flag, set it before they are forked.
+        queue_manager.enable_queue_instrumentation(self.kernel_settings.queue_instrumentation)
+        self.queue_manager.clear_queue_statistics()
+
         self.logger.info(
             "Reserved process counts(devices, backend): {},{}"
             .format(
@@ -101,8 +316,13 @@ class Kernel(layer.Layer):
                 backend_conf.process_count)
         )
 
-        # Start Backend.
-        self.backend_wrapper.start_module(backend_conf, noise_pattern)
+        # Start Backend or reset session backend.
+        if self._session_active:
+            self.__reset_backend()
+        else:
+            self.__start_backend(backend_conf, noise_pattern)
+        if self._recorded_measurements is not None:
+            self.backend_wrapper.start_recording()
         self.miner_controller.prepair_module()
 
         # Dump devices to processes.
@@ -110,15 +330,48 @@ class Kernel(layer.Layer):
         for dev in network.get_active_devices():
             self.miner_controller.add_device_to_next(dev)
 
-        # Set running network.
+        # Set running network and index its devices and applications.
         self._running_network = network
+        self._running_network.rebuild_device_index()
+        self.__build_respond_queue_table()
+
+        # Group devices into shards.
+        self._device_shards.clear()
+        if self._shards is not None:
+            self.__group_device_shards(network)
+
+        # Set clock before processes are forked.
+        if time_mode == simulation_clock.VIRTUAL_TIME_MODE:
+            self._clock = simulation_clock.SimulationClock(self.request_queue)
+
+            # Active devices are participants until they start their applications.
+            self._clock.add_participants(network.get_active_devices().__len__())
+        else:
+            self._clock = None
+        simulation_clock.set_simulation_clock(self._clock)
 
         # Start processes.
         self.miner_controller.start_module()
 
-        # Start end check thread.
-        self.__end_check_thread = threading.Thread(target=self.__end_checker, daemon=True)
-        self.__end_check_thread.start()
+        # Stream dumpings to result file while simulation runs, after processes are forked.
+        result_file = self.kernel_settings.result_file
+        remove_result_file = result_file is None
+        if remove_result_file:
+            file_descriptor, result_file = tempfile.mkstemp(prefix="qdns_", suffix=".results")
+            os.close(file_descriptor)
+        # Devices mark their last dumpings, so do miners with devices if queues are instrumented.
+        dumper_count = network.get_active_devices().__len__()
+        if self.kernel_settings.queue_instrumentation:
+            for miner in self.miner_controller.miner_list:
+                if miner.device_count > 0:
+                    dumper_count += 1
+
+        result_writer = ResultStreamWriter(
+            self.user_dump_queue, result_file,
+            lambda key: self._running_network.get_device(key, _raise=False) is not None,
+            dumper_count, tools.end_watchdog_time
+        )
+        result_writer.start()
 
         # Start simulation.
         start_time = time.time()
@@ -129,45 +382,90 @@ class Kernel(layer.Layer):
             if self.state_handler.is_breakable():
                 break
 
-            action = self.request_queue.get()
-            if isinstance(action, signal.SIGNAL):
-                self.__handle_signal(action)
-
-            elif isinstance(action, request.REQUEST):
-                self.__handle_request(action)
-
-            else:
-                raise ValueError("Unrecognized action for kernel. What \"{}\"?".format(action))
-
-        # Generate simulation result.
-        dump_list = dict()
-        dump_list["SimulationLogs"] = self.logger.logs
-        dump_list["BackendLogs"] = self.backend_wrapper.get_logs()
-
-        times = list()
-        while not self.user_dump_queue.empty():
-            item = self.user_dump_queue.get()
-            if self._running_network.get_device(item[0], _raise=False) is not None:
-                dev = item[0]
-                app = item[1]
-                message = [item[i] for i in range(2, item.__len__())]
-
-                if app == "EndTime":
-                    times.append(message[0])
+            # Scheduler keeps kernel busy while it has pending actions.
+            if self._scheduler is None or self._scheduler.is_empty():
+                if self._clock is None:
+                    try:
+                        action = self.request_queue.get(timeout=tools.end_watchdog_time)
+                    except Empty:
+                        # Miners report their ends, this only catches crashed ones.
+                        self.__check_simulation_end()
+                        continue
                 else:
                     try:
-                        _ = dump_list[dev]
-                    except KeyError:
-                        dump_list[dev] = dict()
+                        action = self.request_queue.get(timeout=self._clock.quiescence_time)
+                    except Empty:
+                        # Time moves only when every participant waits, so computing users keep their time.
+                        if self.__shards_idle() and self._clock.is_quiescent():
+                            if not self._clock.advance():
+                                self.__check_simulation_end()
+                        else:
+                            self.__check_simulation_end()
+                        continue
+
+                if self._scheduler is not None:
+                    self._scheduler.push(action)
+
+            # Take pending actions into scheduler and handle them by priority and device.
+            if self._scheduler is not None:
+                for _ in range(self.kernel_settings.max_drain_count):
+                    try:
+                        self._scheduler.push(self.request_queue.get_nowait())
+                    except Empty:
+                        break
 
+                if self.kernel_settings.drain_requests:
+                    self.__handle_actions(self._scheduler.pop_many(self.kernel_settings.max_drain_count))
+                else:
+                    self.__handle_action(self._scheduler.pop())
+                continue
+
+            # Take all pending actions in one wakeup.
+            if self.kernel_settings.drain_requests:
+                actions = [action]
+                while actions.__len__() < self.kernel_settings.max_drain_count:
                     try:
-                        _ = dump_list[dev][app]
-                    except KeyError:
-                        dump_list[dev][app] = list()
+                        actions.append(self.request_queue.get_nowait())
+                    except Empty:
+                        break
+                self.__handle_actions(actions)
+                continue
 
-                    dump_list[dev][app].append(message)
+            self.__handle_action(action)
 
-        self.backend_wrapper.terminate_backend()
+        # Generate simulation result.
+        result_writer.stop()
+        if result_writer.error is not None:
+            self.logger.error("Some results could not be written: {}".format(result_writer.error))
+
+        if self._scheduler is not None:
+            for class_, delays in self._scheduler.statistics().items():
+                self.logger.info("{} actions are handled with queueing delays: {}".format(class_, delays))
+            result_writer.write(KERNEL_RECORD, "SchedulerStatistics", self._scheduler.statistics())
+        result_writer.write(KERNEL_RECORD, "SimulationLogs", self.logger.logs)
+        if self.kernel_settings.queue_instrumentation:
+            queue_statistics = result_writer.queue_statistics
+            queue_statistics[self.layer_name] = {self.layer_name: self.queue_manager.queue_statistics()}
+            result_writer.write(KERNEL_RECORD, queue_manager.QUEUE_STATISTICS, queue_statistics)
+        if self._recorded_measurements is not None:
+            self._recorded_circuit = self.backend_wrapper.stop_recording()
+        if self._shards is None:
+            result_writer.write(KERNEL_RECORD, "BackendLogs", self.backend_wrapper.get_logs())
+        else:
+            for shard in self._shards:
+                shard.stop_shard(keep_backend=True)
+                if shard.error is not None:
+                    self.logger.error("Shard {} is failed with: {}".format(shard.shard_index, shard.error))
+            result_writer.write(KERNEL_RECORD, "BackendLogs", "".join([shard.backend_wrapper.get_logs() for shard in self._shards]))
+        result_writer.close()
+        times = result_writer.end_times
+
+        # Processes are not needed anymore, backend is kept in a session.
+        self.miner_controller.terminate_module()
+        if not self._session_active:
+            self.__terminate_backend()
+        simulation_clock.set_simulation_clock(None)
+        queue_manager.enable_queue_instrumentation(False)
 
         # Find out max time consumed application.
         try:
@@ -178,17 +476,66 @@ class Kernel(layer.Layer):
             max_time = "Unknown"
 
         self.logger.warning("Simulation is ended in {} seconds. Real raw time: {}".format(np.around(time.time() - start_time, 4), max_time))
-        return tools.SimulationResults(dump_list)
+        return SimulationResults(result_file, result_writer.index, remove_file=remove_result_file)
+
+    def __start_backend(self, backend_conf: BackendConfiguration, noise_pattern):
+        """ Starts backend or shards. """
+
+        if self.kernel_settings.shard_count > 1:
+            self._shards = [KernelShard(i, self.__shard_job_failed) for i in range(self.kernel_settings.shard_count)]
+            for shard in self._shards:
+                shard.start_shard(backend_conf, noise_pattern, self.kernel_settings.entanglement_groups)
+        else:
+            self._shards = None
+            self.backend_wrapper.start_module(backend_conf, noise_pattern, self.kernel_settings.entanglement_groups)
+
+    def __reset_backend(self):
+        """ Resets backend or shards of session. """
+
+        if self._shards is None:
+            self.backend_wrapper.reset_backend()
+        else:
+            for shard in self._shards:
+                shard.restart_shard()
+
+    def __terminate_backend(self):
+        """ Terminates backend or stopped shards. """
+
+        if self._shards is None:
+            self.backend_wrapper.terminate_backend()
+        else:
+            for shard in self._shards:
+                shard.backend_wrapper.terminate_backend()
+
+    def __session_backend_wrapper(self) -> BackendWrapper:
+        """ Returns a backend wrapper of session to read its configuration. """
+
+        if self._shards is None:
+            return self.backend_wrapper
+        return self._shards[0].backend_wrapper
+
+    def __renew_queues(self):
+        """ Renews kernel queues and logs for a new simulation. """
+
+        self.set_queues(multiprocessing.Queue(), None)
+        self.queue_manager.update_queue(queue_manager.USER_DUMP_QUEUE, multiprocessing.Queue())
+        self.miner_controller.set_queues(self.request_queue, self.user_dump_queue)
+        self.logger.clear_logs()
 
     def __handle_signal(self, signal_: signal.SIGNAL):
         """ Handles signals. """
 
         if isinstance(signal_, signal.StateReportSignal):
             self.miner_controller.update_miner_state(self.miner_controller.get_miner(signal_.source_emiter), signal_.new_state)
+            self.__check_simulation_end()
 
         elif isinstance(signal_, signal.EndSimulationSignal):
             self.__end_simulation()
 
+        elif isinstance(signal_, signal.ScheduleClockEventSignal):
+            if self._clock is not None:
+                self._clock.push_event(signal_.event_time)
+
         elif isinstance(signal_, signal.ConnectionChangedSignal):
             if signal_.data_(3) == "DROP":
                 changed = False
@@ -215,237 +562,637 @@ class Kernel(layer.Layer):
         else:
             raise ValueError("Unrecognized singal for kernel. What \"{}\"?".format(signal_))
 
+    def __handle_action(self, action):
+        """ Handles a signal or request. """
+
+        if isinstance(action, signal.SIGNAL):
+            self.__handle_signal(action)
+
+        elif isinstance(action, request.REQUEST):
+            self.__handle_request(action)
+
+        else:
+            raise ValueError("Unrecognized action for kernel. What \"{}\"?".format(action))
+
+    def __handle_actions(self, actions: List):
+        """
+        Handles drained actions in order.
+        Runs of same typed compatible requests are handled with one backend call.
+
+        Args:
+            actions: Actions in arrival order.
+        """
+
+        i = 0
+        while i < actions.__len__():
+            if self.state_handler.is_breakable():
+                return
+
+            action = actions[i]
+            if isinstance(action, signal.SIGNAL):
+                self.__handle_signal(action)
+                i += 1
+                continue
+
+            if not isinstance(action, request.REQUEST):
+                raise ValueError("Unrecognized action for kernel. What \"{}\"?".format(action))
+
+            try:
+                batch_handler = self._batch_handlers[type(action)]
+            except KeyError:
+                self.__handle_request(action)
+                i += 1
+                continue
+
+            group_shards = None
+            if self._shards is not None:
+                group_shards = self.__shards_of(action)
+                if group_shards.__len__() > 1:
+                    self.__handle_request(action)
+                    i += 1
+                    continue
+
+            group = [action]
+            used_qubits = set(getattr(action, "qubits", ()))
+            j = i + 1
+            while j < actions.__len__():
+                next_action = actions[j]
+                if type(next_action) is not type(action) or next_action.args != action.args:
+                    break
+
+                # Batch must stay in one shard.
+                if group_shards is not None and self.__shards_of(next_action) != group_shards:
+                    break
+
+                # Same qubit must not be touched twice in one backend call.
+                next_qubits = getattr(next_action, "qubits", ())
+                if not used_qubits.isdisjoint(next_qubits):
+                    break
+                used_qubits.update(next_qubits)
+
+                group.append(next_action)
+                j += 1
+
+            if group.__len__() > 1:
+                self.__dispatch_backend(batch_handler, group)
+            else:
+                self.__handle_request(action)
+            i = j
+
     def __handle_request(self, request_: request.REQUEST):
         """ Handles request. """
 
         if request_.target_id != layer.ID_SIMULATION:
             raise AttributeError("Exepted kernel request but got {}.".format(request_.target_id))
 
-        # Find classic route request.
-        if isinstance(request_, request.FindClassicRouteRequest):
-            start_uuid = self._running_network.get_device(request_.start_uuid, _raise=True).uuid
-            end_uuid = self._running_network.get_device(request_.end_uuid, _raise=True).uuid
+        try:
+            handler = self._request_handlers[type(request_)]
+        except KeyError:
+            pass
+        else:
+            handler(request_)
+            return
 
-            route = self._running_network.get_classic_channel_route(start_uuid, end_uuid)
+        try:
+            handler = self._backend_handlers[type(request_)]
+        except KeyError:
+            raise ValueError("Unrecognized request for kernel. What \"{}\"?".format(request_))
+        self.__dispatch_backend(handler, request_)
 
-            if request_.want_respond:
-                if route is None:
-                    exit_code = -1
-                else:
-                    exit_code = 0
+    def __dispatch_backend(self, handler: Callable, request_):
+        """
+        Runs backend handler on kernel or sends it to owner shard.
 
-                respond.FindClassicRouteRespond(request_.generic_id, exit_code, route).process(
-                    self._running_network.get_device(request_.asker_uuid, _raise=True).appman.get_application_from(
-                        request_.spesific_asker, _raise=True
-                    ).respond_queue
-                )
+        Args:
+            handler: Backend handler.
+            request_: Request or batch of requests.
+        """
 
-        # Find quantum route request.
-        elif isinstance(request_, request.FindQuantumRouteRequest):
-            start_uuid = self._running_network.get_device(request_.start_uuid, _raise=True).uuid
-            end_uuid = self._running_network.get_device(request_.end_uuid, _raise=True).uuid
+        if self._shards is None:
+            handler(request_, self.backend_wrapper)
+            return
 
-            route = self._running_network.get_quantum_channel_route(start_uuid, end_uuid)
+        try:
+            if isinstance(request_, list):
+                shard_indexes = self.__shards_of(request_[0])
+            else:
+                shard_indexes = self.__shards_of(request_)
+        except ValueError as e:
+            for failed_request in request_ if isinstance(request_, list) else [request_]:
+                self.__fail_request(failed_request, str(e))
+            return
+
+        if shard_indexes.__len__() == 1:
+            self._shards[next(iter(shard_indexes))].submit(handler, request_)
+        else:
+            self.__split_to_shards(request_)
 
-            if request_.want_respond:
-                if route is None:
-                    exit_code = -1
-                else:
-                    exit_code = 0
+    def __group_device_shards(self, network: Network):
+        """
+        Puts each connected part of quantum network into one shard.
 
-                respond.FindQuantumRouteRespond(request_.generic_id, exit_code, route).process(
-                    self._running_network.get_device(request_.asker_uuid, _raise=True).appman.get_application_from(
-                        request_.spesific_asker, _raise=True
-                    ).respond_queue
-                )
+        Args:
+            network: Network that is going to be simulated.
 
-        # Allocate qubit request.
-        elif isinstance(request_, request.AllocateQubitRequest):
-            qubit = self.backend_wrapper.allocate_qubits(1, *request_.args)[0]
-            exit_code = 0
-            respond.AllocateQubitRespond(request_.generic_id, exit_code, qubit).process(
-                self._running_network.get_device(request_.asker_uuid, _raise=True).appman.get_application_from(
-                    request_.spesific_asker, _raise=True
-                ).respond_queue
-            )
+        Notes:
+            Qubits only travel over quantum channels, so a quantum path never spans two shards.
+            Largest parts are placed first, each into the shard with fewest devices.
+        """
 
-        # Allocate qubits request.
-        elif isinstance(request_, request.AllocateQubitsRequest):
-            qubits = self.backend_wrapper.allocate_qubits(request_.count, *request_.args)
-            exit_code = 0
-            respond.AllocateQubitsRespond(request_.generic_id, exit_code, qubits).process(
-                self._running_network.get_device(request_.asker_uuid, _raise=True).appman.get_application_from(
-                    request_.spesific_asker, _raise=True
-                ).respond_queue
-            )
+        shard_loads = [0] * self._shards.__len__()
+        components = sorted(networkx.connected_components(network.quantum_network), key=len, reverse=True)
+        for component in components:
+            shard_index = shard_loads.index(min(shard_loads))
+            shard_loads[shard_index] += component.__len__()
+            for device_uuid in component:
+                dev = network.get_device(device_uuid)
+                self._device_shards[dev.uuid] = shard_index
+                self._device_shards[dev.label] = shard_index
 
-        # Allocate qframe request.
-        elif isinstance(request_, request.AllocateQFrameRequest):
-            qubits = self.backend_wrapper.allocate_qframes(request_.frame_size, 1, *request_.args)[0]
-            exit_code = 0
-            respond.AllocateQFrameRespond(request_.generic_id, exit_code, qubits).process(
-                self._running_network.get_device(request_.asker_uuid, _raise=True).appman.get_application_from(
-                    request_.spesific_asker, _raise=True
-                ).respond_queue
-            )
+        self.logger.info("Devices per shard: {}.".format(shard_loads))
 
-        # Allocate qframes request.
-        elif isinstance(request_, request.AllocateQFramesRequest):
-            qubits = self.backend_wrapper.allocate_qframes(request_.frame_size, request_.count, *request_.args)
-            exit_code = 0
-            respond.AllocateQFramesRespond(request_.generic_id, exit_code, qubits).process(
-                self._running_network.get_device(request_.asker_uuid, _raise=True).appman.get_application_from(
-                    request_.spesific_asker, _raise=True
-                ).respond_queue
-            )
+    def __shards_of(self, request_: request.REQUEST) -> Set[int]:
+        """
+        Finds shards of request.
+        Qubit requests belong to shards of its qubits, others to shard of asker device.
+        """
 
-        # Dellocate qubits request.
-        elif isinstance(request_, request.DeallocateQubitRequest):
-            result = self.backend_wrapper.deallocate_qubits(request_.qubits)
-            if request_.want_respond:
-                if result:
-                    exit_code = 0
-                else:
-                    exit_code = -1
+        qubits = request_qubits(request_)
+        if qubits.__len__() == 0:
+            try:
+                return {self._device_shards[request_.asker_uuid]}
+            except KeyError:
+                return {self._device_shards[self._running_network.get_device(request_.asker_uuid, _raise=True).uuid]}
+
+        return resolve_shard_indexes(qubits)
+
+    def __shards_idle(self) -> bool:
+        """ Returns true if no shard has pending job. """
+
+        if self._shards is None:
+            return True
+
+        for shard in self._shards:
+            if not shard.is_idle():
+                return False
+        return True
+
+    def __fail_request(self, request_: request.REQUEST, reason: str):
+        """
+        Responds a backend request with failed exit code.
 
-                respond.DeallocateQubitRespond(request_.generic_id, exit_code).process(
-                    self._running_network.get_device(request_.asker_uuid, _raise=True).appman.get_application_from(
-                        request_.spesific_asker, _raise=True
-                    ).respond_queue
+        Args:
+            request_: Request that cannot be served.
+            reason: Reason to log.
+        """
+
+        self.logger.warning("Request {} is failed: {}".format(type(request_).__name__, reason))
+
+        if not getattr(request_, "want_respond", True):
+            return
+
+        try:
+            failure_respond = self._failure_responds[type(request_)]
+        except KeyError:
+            return
+        failure_respond(request_.generic_id).process(self.__respond_queue_of(request_))
+
+    def __shard_job_failed(self, job: Callable, args: Tuple, error: Exception):
+        """ Called in shard worker when a job raises. Asker of job gets a failed respond. """
+
+        if job == self.__shard_part:
+            join, part_index = args[0], args[1]
+            join.part_failed(part_index, error)
+            return
+
+        request_ = args[0]
+        for failed_request in request_ if isinstance(request_, list) else [request_]:
+            self.__fail_request(failed_request, str(error))
+
+    @staticmethod
+    def __shard_part(join: ShardJoin, part_index: int, method_name: str, qubits, args, backend_wrapper: BackendWrapper):
+        """ Runs a part of splitted request in a shard. """
+
+        join.part_done(part_index, getattr(backend_wrapper, method_name)(qubits, *args))
+
+    def __split_to_shards(self, request_: request.REQUEST):
+        """
+        Splits a request that touches several shards.
+        Every shard runs its own part in order, last finished part responds.
+
+        Notes:
+            Shards have separate backends, so a gate or density matrix between their qubits cannot be
+            computed. Such requests are rejected before any part runs and asker gets a failed respond.
+        """
+
+        if isinstance(request_, request.ApplySerialTransformationsRequest):
+            parts: Dict[int, List] = dict()
+            for gate in request_.list_of_gates:
+                gate_shards = resolve_shard_indexes(gate[2])
+                if gate_shards.__len__() != 1:
+                    self.__fail_request(request_, "Gate {} touches qubits of shards {}. Cross shard gates are not supported.".format(
+                        gate[0], gate_shards)
+                    )
+                    return
+
+                shard_index = next(iter(gate_shards))
+                try:
+                    parts[shard_index].append(gate)
+                except KeyError:
+                    parts[shard_index] = [gate]
+
+            def finisher(_):
+                if request_.want_respond:
+                    respond.ApplySerialTransformationsRespond(request_.generic_id, 0, None).process(
+                        self.__respond_queue_of(request_)
+                    )
+
+            join = ShardJoin(parts.__len__(), finisher, lambda error: self.__fail_request(request_, str(error)))
+            for shard_index in parts:
+                self._shards[shard_index].submit(
+                    self.__shard_part, join, shard_index, "apply_serial_transformations", parts[shard_index], ()
+                )
+            return
+
+        # Place qubits to shards.
+        placement: Dict[int, List[int]] = dict()
+        for i, qubit in enumerate(request_.qubits):
+            shard_index = resolve_shard_qubit_id(qubit)[0]
+            try:
+                placement[shard_index].append(i)
+            except KeyError:
+                placement[shard_index] = [i]
+
+        if isinstance(request_, request.MeasureQubitsRequest):
+            method_name, args = "measure_qubits", request_.args
+
+            def finisher(part_results):
+                results = np.zeros(request_.qubits.__len__(), dtype=int)
+                for part_index in part_results:
+                    for j, result in enumerate(part_results[part_index]):
+                        results[placement[part_index][j]] = result
+                respond.MeasureQubitsRespond(request_.generic_id, 1, results).process(
+                    self.__respond_queue_of(request_)
                 )
 
-        # Measure qubits request.
-        elif isinstance(request_, request.MeasureQubitsRequest):
-            results = self.backend_wrapper.measure_qubits(request_.qubits, *request_.args)
+        elif isinstance(request_, request.DeallocateQubitRequest):
+            method_name, args = "deallocate_qubits", ()
 
-            # Else program terminates anyway.
-            exit_code = 1
+            def finisher(part_results):
+                if request_.want_respond:
+                    exit_code = 0 if all(part_results.values()) else -1
+                    respond.DeallocateQubitRespond(request_.generic_id, exit_code).process(
+                        self.__respond_queue_of(request_)
+                    )
+
+        elif isinstance(request_, request.ResetQubitsRequest):
+            method_name, args = "reset_qubits", ()
+
+            def finisher(_):
+                if request_.want_respond:
+                    respond.ResetQubitsRespond(request_.generic_id, 1, None).process(
+                        self.__respond_queue_of(request_)
+                    )
 
-            respond.MeasureQubitsRespond(request_.generic_id, exit_code, results).process(
-                self._running_network.get_device(request_.asker_uuid, _raise=True).appman.get_application_from(
-                    request_.spesific_asker, _raise=True
-                ).respond_queue
+        elif isinstance(request_, request.ApplyChannelError):
+            channel = self._running_network.get_channel(request_.channel_uuid, raise_=True)
+            method_name, args = "process_channel_error", (channel.percentage,)
+
+            def finisher(part_results):
+                if request_.want_respond:
+                    respond.ApplyChannelErrorRespond(request_.generic_id, 0, list(part_results.values())).process(
+                        self.__respond_queue_of(request_)
+                    )
+
+        else:
+            self.__fail_request(request_, "Request touches qubits of shards {}. Cross shard operation is not supported.".format(
+                set(placement.keys()))
             )
+            return
 
-        # Reset qubits request.
-        elif isinstance(request_, request.ResetQubitsRequest):
-            results = self.backend_wrapper.reset_qubits(request_.qubits)
-            exit_code = 1
+        join = ShardJoin(placement.__len__(), finisher, lambda error: self.__fail_request(request_, str(error)))
+        for shard_index in placement:
+            qubits = [request_.qubits[i] for i in placement[shard_index]]
+            self._shards[shard_index].submit(self.__shard_part, join, shard_index, method_name, qubits, args)
 
-            if request_.want_respond:
-                respond.ResetQubitsRespond(request_.generic_id, exit_code, results).process(
-                    self._running_network.get_device(request_.asker_uuid, _raise=True).appman.get_application_from(
-                        request_.spesific_asker, _raise=True
-                    ).respond_queue
-                )
+    def __build_respond_queue_table(self):
+        """ Maps (device uuid / label, application label) to respond queue of application. """
 
-        # Apply transformation request.
-        elif isinstance(request_, request.ApplyTransformationRequest):
-            results = self.backend_wrapper.apply_transformation(request_.gate_id, request_.gate_args, request_.qubits)
+        self._respond_queues.clear()
+        for device in self._running_network.get_all_devices():
+            for application in device.appman.all_application_list:
+                self._respond_queues[(device.uuid, application.label)] = application.respond_queue
 
-            # Else program terminates anyway.
-            exit_code = 1
+                # First device keeps a shared label like network does.
+                try:
+                    _ = self._respond_queues[(device.label, application.label)]
+                except KeyError:
+                    self._respond_queues[(device.label, application.label)] = application.respond_queue
 
-            if request_.want_respond:
-                respond.ApplyTransformationRespond(request_.generic_id, exit_code, results).process(
-                    self._running_network.get_device(request_.asker_uuid, _raise=True).appman.get_application_from(
-                        request_.spesific_asker, _raise=True
-                    ).respond_queue
-                )
+    def __respond_queue_of(self, request_: request.REQUEST):
+        """ Finds respond queue of asker application. """
+
+        key = (request_.asker_uuid, request_.spesific_asker)
+        try:
+            return self._respond_queues[key]
+        except KeyError:
+            pass
+
+        # Application is added after table is built.
+        respond_queue = self._running_network.get_device(request_.asker_uuid, _raise=True).appman.get_application_from(
+            request_.spesific_asker, _raise=True
+        ).respond_queue
+        self._respond_queues[key] = respond_queue
+        return respond_queue
+
+    def __find_classic_route(self, request_: request.FindClassicRouteRequest):
+        """ Find classic route request. """
 
-        # Generate epr request.
-        elif isinstance(request_, request.GenerateEPRRequest):
-            qubits = self.backend_wrapper.generate_ghz_pair(2, request_.count)
+        start_uuid = self._running_network.get_device(request_.start_uuid, _raise=True).uuid
+        end_uuid = self._running_network.get_device(request_.end_uuid, _raise=True).uuid
 
-            if qubits is None:
+        route = self._running_network.get_classic_channel_route(start_uuid, end_uuid)
+
+        if request_.want_respond:
+            if route is None:
                 exit_code = -1
             else:
                 exit_code = 0
 
-            if request_.want_respond:
-                respond.GenerateEPRRespond(request_.generic_id, exit_code, qubits).process(
-                    self._running_network.get_device(request_.asker_uuid, _raise=True).appman.get_application_from(
-                        request_.spesific_asker, _raise=True
-                    ).respond_queue
-                )
+            respond.FindClassicRouteRespond(request_.generic_id, exit_code, route).process(
+                self.__respond_queue_of(request_)
+            )
+
+    def __find_quantum_route(self, request_: request.FindQuantumRouteRequest):
+        """ Find quantum route request. """
+
+        start_uuid = self._running_network.get_device(request_.start_uuid, _raise=True).uuid
+        end_uuid = self._running_network.get_device(request_.end_uuid, _raise=True).uuid
 
-        # Generate ghz request.
-        elif isinstance(request_, request.GenerateGHZRequest):
-            qubits = self.backend_wrapper.generate_ghz_pair(request_.size, request_.count)
+        route = self._running_network.get_quantum_channel_route(start_uuid, end_uuid)
 
-            if qubits is None:
+        if request_.want_respond:
+            if route is None:
                 exit_code = -1
             else:
                 exit_code = 0
 
-            if request_.want_respond:
-                respond.GenerateGHZRespond(request_.generic_id, exit_code, qubits).process(
-                    self._running_network.get_device(request_.asker_uuid, _raise=True).appman.get_application_from(
-                        request_.spesific_asker, _raise=True
-                    ).respond_queue
-                )
+            respond.FindQuantumRouteRespond(request_.generic_id, exit_code, route).process(
+                self.__respond_queue_of(request_)
+            )
 
-        # Apply channel errors request.
-        elif isinstance(request_, request.ApplyChannelError):
-            channel = self._running_network.get_channel(request_.channel_uuid, raise_=True)
-            result = self.backend_wrapper.process_channel_error(request_.qubits, channel.percentage)
+    def __allocate_qubit(self, request_: request.AllocateQubitRequest, backend_wrapper: BackendWrapper):
+        """ Allocate qubit request. """
 
-            if request_.want_respond:
-                respond.ApplyChannelErrorRespond(request_.generic_id, 0, result).process(
-                    self._running_network.get_device(request_.asker_uuid, _raise=True).appman.get_application_from(
-                        request_.spesific_asker, _raise=True
-                    ).respond_queue
-                )
+        qubit = backend_wrapper.allocate_qubits(1, *request_.args)[0]
+        exit_code = 0
+        respond.AllocateQubitRespond(request_.generic_id, exit_code, qubit).process(
+            self.__respond_queue_of(request_)
+        )
 
-        # Apply serial transformation request.
-        elif isinstance(request_, request.ApplySerialTransformationsRequest):
-            results = self.backend_wrapper.apply_serial_transformations(request_.list_of_gates)
+    def __allocate_qubit_batch(self, requests: List[request.AllocateQubitRequest], backend_wrapper: BackendWrapper):
+        """ Allocate qubit requests in one backend call. """
 
-            # Else program terminates anyway.
-            exit_code = 0
+        qubits = backend_wrapper.allocate_qubits(requests.__len__(), *requests[0].args)
+        exit_code = 0
+        for i, request_ in enumerate(requests):
+            respond.AllocateQubitRespond(request_.generic_id, exit_code, qubits[i]).process(
+                self.__respond_queue_of(request_)
+            )
 
-            if request_.want_respond:
-                respond.ApplySerialTransformationsRespond(request_.generic_id, exit_code, results).process(
-                    self._running_network.get_device(request_.asker_uuid, _raise=True).appman.get_application_from(
-                        request_.spesific_asker, _raise=True
-                    ).respond_queue
-                )
+    def __allocate_qubits(self, request_: request.AllocateQubitsRequest, backend_wrapper: BackendWrapper):
+        """ Allocate qubits request. """
+
+        qubits = backend_wrapper.allocate_qubits(request_.count, *request_.args)
+        exit_code = 0
+        respond.AllocateQubitsRespond(request_.generic_id, exit_code, qubits).process(
+            self.__respond_queue_of(request_)
+        )
+
+    def __allocate_qubits_batch(self, requests: List[request.AllocateQubitsRequest], backend_wrapper: BackendWrapper):
+        """ Allocate qubits requests in one backend call. """
+
+        total_count = sum([request_.count for request_ in requests])
+        qubits = backend_wrapper.allocate_qubits(total_count, *requests[0].args)
+        exit_code = 0
 
-        # Change channel length request.
-        elif isinstance(request_, request.ChangeChannelLenght):
-            channel = self._running_network.get_channel(request_.target_channel, raise_=True)
-            channel.change_length(request_.new_length)
+        index = 0
+        for request_ in requests:
+            respond.AllocateQubitsRespond(request_.generic_id, exit_code, qubits[index:index + request_.count]).process(
+                self.__respond_queue_of(request_)
+            )
+            index += request_.count
+
+    def __allocate_qframe(self, request_: request.AllocateQFrameRequest, backend_wrapper: BackendWrapper):
+        """ Allocate qframe request. """
+
+        qubits = backend_wrapper.allocate_qframes(request_.frame_size, 1, *request_.args)[0]
+        exit_code = 0
+        respond.AllocateQFrameRespond(request_.generic_id, exit_code, qubits).process(
+            self.__respond_queue_of(request_)
+        )
+
+    def __allocate_qframes(self, request_: request.AllocateQFramesRequest, backend_wrapper: BackendWrapper):
+        """ Allocate qframes request. """
 
-            # Else program terminates anyway.
+        qubits = backend_wrapper.allocate_qframes(request_.frame_size, request_.count, *request_.args)
+        exit_code = 0
+        respond.AllocateQFramesRespond(request_.generic_id, exit_code, qubits).process(
+            self.__respond_queue_of(request_)
+        )
+
+    def __deallocate_qubit(self, request_: request.DeallocateQubitRequest, backend_wrapper: BackendWrapper):
+        """ Dellocate qubits request. """
+
+        result = backend_wrapper.deallocate_qubits(request_.qubits)
+        if request_.want_respond:
+            if result:
+                exit_code = 0
+            else:
+                exit_code = -1
+
+            respond.DeallocateQubitRespond(request_.generic_id, exit_code).process(
+                self.__respond_queue_of(request_)
+            )
+
+    def __measure_qubits(self, request_: request.MeasureQubitsRequest, backend_wrapper: BackendWrapper):
+        """ Measure qubits request. """
+
+        results = backend_wrapper.measure_qubits(request_.qubits, *request_.args)
+        self.__record_measurement(request_)
+
+        # Else program terminates anyway.
+        exit_code = 1
+
+        respond.MeasureQubitsRespond(request_.generic_id, exit_code, results).process(
+            self.__respond_queue_of(request_)
+        )
+
+    def __measure_qubits_batch(self, requests: List[request.MeasureQubitsRequest], backend_wrapper: BackendWrapper):
+        """ Measure qubits requests in one backend call. """
+
+        all_qubits = list()
+        for request_ in requests:
+            all_qubits.extend(request_.qubits)
+
+        results = backend_wrapper.measure_qubits(all_qubits, *requests[0].args)
+
+        # Else program terminates anyway.
+        exit_code = 1
+
+        index = 0
+        for request_ in requests:
+            self.__record_measurement(request_)
+            count = request_.qubits.__len__()
+            respond.MeasureQubitsRespond(request_.generic_id, exit_code, results[index:index + count]).process(
+                self.__respond_queue_of(request_)
+            )
+            index += count
+
+    def __record_measurement(self, request_: request.MeasureQubitsRequest):
+        """ Keeps asker of measurement while backend operations are recorded. """
+
+        if self._recorded_measurements is None:
+            return
+
+        device_label = self._running_network.get_device(request_.asker_uuid, _raise=True).label
+        self._recorded_measurements.append((device_label, request_.spesific_asker, request_.qubits.__len__()))
+
+    def __reset_qubits(self, request_: request.ResetQubitsRequest, backend_wrapper: BackendWrapper):
+        """ Reset qubits request. """
+
+        results = backend_wrapper.reset_qubits(request_.qubits)
+        exit_code = 1
+
+        if request_.want_respond:
+            respond.ResetQubitsRespond(request_.generic_id, exit_code, results).process(
+                self.__respond_queue_of(request_)
+            )
+
+    def __density_matrix(self, request_: request.DensityMatrixRequest, backend_wrapper: BackendWrapper):
+        """ Density matrix request. """
+
+        try:
+            matrix = backend_wrapper.density_matrix(request_.qubits)
+        except AttributeError as e:
+            self.logger.warning(str(e))
+            matrix = None
+            exit_code = -1
+        else:
+            exit_code = 1
+
+        respond.DensityMatrixRespond(request_.generic_id, exit_code, matrix).process(
+            self.__respond_queue_of(request_)
+        )
+
+    def __apply_transformation(self, request_: request.ApplyTransformationRequest, backend_wrapper: BackendWrapper):
+        """ Apply transformation request. """
+
+        results = backend_wrapper.apply_transformation(request_.gate_id, request_.gate_args, request_.qubits)
+
+        # Else program terminates anyway.
+        exit_code = 1
+
+        if request_.want_respond:
+            respond.ApplyTransformationRespond(request_.generic_id, exit_code, results).process(
+                self.__respond_queue_of(request_)
+            )
+
+    def __generate_epr(self, request_: request.GenerateEPRRequest, backend_wrapper: BackendWrapper):
+        """ Generate epr request. """
+
+        qubits = backend_wrapper.generate_ghz_pair(2, request_.count)
+
+        if qubits is None:
+            exit_code = -1
+        else:
             exit_code = 0
 
-            if request_.want_respond:
-                respond.ChangeChannelLenghtRespond(request_.generic_id, exit_code).process(
-                    self._running_network.get_device(request_.asker_uuid, _raise=True).appman.get_application_from(
-                        request_.spesific_asker, _raise=True
-                    )
-                )
+        if request_.want_respond:
+            respond.GenerateEPRRespond(request_.generic_id, exit_code, qubits).process(
+                self.__respond_queue_of(request_)
+            )
 
+    def __generate_ghz(self, request_: request.GenerateGHZRequest, backend_wrapper: BackendWrapper):
+        """ Generate ghz request. """
+
+        qubits = backend_wrapper.generate_ghz_pair(request_.size, request_.count)
+
+        if qubits is None:
+            exit_code = -1
         else:
-            raise ValueError("Unrecognized request for kernel. What \"{}\"?".format(request_))
+            exit_code = 0
 
-    def __end_checker(self):
-        """ End checker thread run. """
+        if request_.want_respond:
+            respond.GenerateGHZRespond(request_.generic_id, exit_code, qubits).process(
+                self.__respond_queue_of(request_)
+            )
 
-        time.sleep(1)
-        while 1:
-            expected_states = (tools.SIMULATION_IS_RUNNING, tools.SIMULATION_IS_PAUSED,)
-            if self.state in expected_states:
-                if self.miner_controller.is_simulation_endable():
-                    self.request_queue.put(signal.EndSimulationSignal())
-                    return
-            time.sleep(0.25)
+    def __apply_channel_error(self, request_: request.ApplyChannelError, backend_wrapper: BackendWrapper):
+        """ Apply channel errors request. """
+
+        channel = self._running_network.get_channel(request_.channel_uuid, raise_=True)
+        result = backend_wrapper.process_channel_error(request_.qubits, channel.percentage)
+
+        if request_.want_respond:
+            respond.ApplyChannelErrorRespond(request_.generic_id, 0, result).process(
+                self.__respond_queue_of(request_)
+            )
+
+    def __apply_serial_transformations(self, request_: request.ApplySerialTransformationsRequest, backend_wrapper: BackendWrapper):
+        """ Apply serial transformation request. """
+
+        results = backend_wrapper.apply_serial_transformations(request_.list_of_gates)
+
+        # Else program terminates anyway.
+        exit_code = 0
+
+        if request_.want_respond:
+            respond.ApplySerialTransformationsRespond(request_.generic_id, exit_code, results).process(
+                self.__respond_queue_of(request_)
+            )
+
+    def __change_channel_length(self, request_: request.ChangeChannelLenght):
+        """ Change channel length request. """
+
+        channel = self._running_network.get_channel(request_.target_channel, raise_=True)
+        channel.change_length(request_.new_length)
+
+        # Else program terminates anyway.
+        exit_code = 0
+
+        if request_.want_respond:
+            respond.ChangeChannelLenghtRespond(request_.generic_id, exit_code).process(
+                self.__respond_queue_of(request_)
+            )
+
+    def __check_simulation_end(self):
+        """ Ends simulation if all miners are done. Called on miner state changes. """
+
+        expected_states = (tools.SIMULATION_IS_RUNNING, tools.SIMULATION_IS_PAUSED,)
+        if self.state in expected_states:
+            if self.miner_controller.is_simulation_endable():
+                self.__end_simulation()
 
     def __end_simulation(self):
-        """ Ends simulation (rec). """
+        """
+        Ends simulation.
+        Kernel loop checks state before next action, no need to wake it up again.
+        """
 
         self.change_state(tools.SIMULATION_IS_FINISHED)
-        self.request_queue.put(signal.EndSimulationSignal())
+
+    @property
+    def kernel_settings(self) -> tools.KernelSettings:
+        return self._kernel_settings
+
+    @property
+    def shards(self) -> Optional[List[KernelShard]]:
+        return self._shards
+
+    @property
+    def clock(self) -> Optional[simulation_clock.SimulationClock]:
+        return self._clock
 
     @property
     def user_dump_queue(self):
@@ -25,10 +25,9 @@
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import multiprocessing
-import time
 import uuid
 from queue import Queue as TQueue
-from typing import List, Dict, Union
+from typing import List, Dict, Union, Set
 
 from QDNS.device.device import Device
 from QDNS.device.tools import device_tools
@@ -64,9 +63,6 @@ class Process(multiprocessing.Process, layer.Layer):
             self.name, state_handler=state_handler
         )
 
-        # Init end check thread.
-        self._end_check_thread = None
-
         # Add queues to manager.
         self.queue_manager.add_queue(queue_manager.SIM_REQUEST_QUEUE, sim_request_queue)
         self.queue_manager.add_queue(queue_manager.USER_DUMP_QUEUE, user_dump_queue)
@@ -77,6 +73,7 @@ class Process(multiprocessing.Process, layer.Layer):
         self._device_states: Dict[Device, str] = dict()
         self._device_thread_dict: [Device, TerminatableThread] = dict()
         self._thread_device_dict: [TerminatableThread, Device] = dict()
+        self._ended_devices: Set[Device] = set()
 
         # Set layer queues.
         self.set_queues(multiprocessing.Queue(), None)
@@ -87,12 +84,12 @@ class Process(multiprocessing.Process, layer.Layer):
         """ Prepair process layer. """
 
         self.set_threaded_queues(TQueue(), None)
-        self._end_check_thread = TerminatableThread(self.check_finalize, daemon=True)
+        self._ended_devices.clear()
 
         # Generate device threads and set state tracker.
         for device in self._devices:
             device.prepair_layer(self.sim_request_queue, self.threaded_request_queue, self.user_dump_queue)
-            tt = TerminatableThread(target_method=device.run, daemon=True)
+            tt = TerminatableThread(target_method=self.__run_device, daemon=True, args=(device,))
             self._device_thread_list.append(tt)
             self._device_states[device] = device_tools.DEVICE_NOT_STARTED
             self._device_thread_dict[device] = tt
@@ -118,7 +115,6 @@ class Process(multiprocessing.Process, layer.Layer):
 
         # Check for devices.
         if self.device_count <= 0:
-            time.sleep(0.5)
             self.logger.info("Process has no job to do. Ending process.")
             self.change_state(tools.MINER_IS_FINISHED)
             return
@@ -126,9 +122,6 @@ class Process(multiprocessing.Process, layer.Layer):
         # Start process.
         self.change_state(tools.MINER_IS_RUNNING)
 
-        # Start end check thread.
-        self._end_check_thread.start()
-
         # Start devices.
         for device_thread in self._device_thread_list:
             device_thread.start()
@@ -152,19 +145,38 @@ class Process(multiprocessing.Process, layer.Layer):
         # State report signal from device.
         if isinstance(signal_, signal.StateReportSignal):
             self.update_device_state(self.get_device_from(signal_.source_emiter), signal_.new_state)
+            self.check_finalize()
+
+        # Device thread is ended.
+        elif isinstance(signal_, signal.ThreadEndedSignal):
+            self._ended_devices.add(self.get_device_from(signal_.source_emiter))
+            self.check_finalize()
 
         else:
             raise ValueError("Unrecognized signal for {}. What signal \"{}\"?".format(self.name, signal_))
 
+    def __run_device(self, device: Device):
+        """ Runs the device and signals miner when its thread ends. """
+
+        try:
+            device.run()
+        finally:
+            signal.ThreadEndedSignal(device).emit(self.threaded_request_queue)
+
     def check_finalize(self):
-        """ Checks if process job is done in loop. """
+        """
+        Checks if process job is done.
+        Called on device state changes, so no need to poll.
+        """
 
-        time.sleep(1)
-        while 1:
-            excepted_states = (tools.MINER_IS_RUNNING,)
-            if self.state in excepted_states and self.is_miner_endable():
-                self.change_state(tools.MINER_MAY_END)
-            time.sleep(0.25)
+        excepted_states = (tools.MINER_IS_RUNNING,)
+        if self.state in excepted_states and self.is_miner_endable():
+            if queue_manager.is_queue_instrumentation_enabled():
+                self.user_dump_queue.put(
+                    [self.name, queue_manager.QUEUE_STATISTICS, {self.name: self.queue_manager.queue_statistics()}]
+                )
+                self.user_dump_queue.put([self.name, device_tools.DEVICE_DUMPS_DONE])
+            self.change_state(tools.MINER_MAY_END)
 
     def get_device_from(self, key: Union[int, str, uuid.UUID, Device], _raise=True) -> Union[Device, None]:
         """
@@ -228,7 +240,7 @@ class Process(multiprocessing.Process, layer.Layer):
 
         self.update_device_matched_states()
         for device in self._devices:
-            if self.device_to_thread_dict[device].is_alive():
+            if self.is_device_alive(device):
                 if self.device_states[device] != device_tools.DEVICE_MAY_END:
                     return False
         return True
@@ -237,15 +249,32 @@ class Process(multiprocessing.Process, layer.Layer):
         """ Update device states from reports. """
 
         for device in self._devices:
-            thread = self.device_to_thread_dict[device]
-            if not thread.is_alive() and self.device_states[device] == device_tools.DEVICE_IS_RUNNING:
+            if self.is_device_alive(device):
+                continue
+
+            if self.device_states[device] == device_tools.DEVICE_IS_RUNNING:
                 self.device_states[device] = device_tools.DEVICE_IS_TERMINATED
                 self.logger.warning("Device {} is probably termianted!".format(device.label))
 
-            if not thread.is_alive() and self.device_states[device] == device_tools.DEVICE_IS_PAUSED:
+            if self.device_states[device] == device_tools.DEVICE_IS_PAUSED:
                 self.device_states[device] = device_tools.DEVICE_IS_TERMINATED
                 self.logger.warning("Device {} is probably termianted!".format(device.label))
 
+    def is_device_alive(self, device: Device) -> bool:
+        """
+        Checks if thread of device is still running.
+
+        Args:
+            device: Device.
+
+        Returns:
+            True if device thread is not ended yet.
+        """
+
+        if device in self._ended_devices:
+            return False
+        return self.device_to_thread_dict[device].is_alive()
+
     @property
     def devices(self) -> List[Device]:
         return self._devices
@@ -258,10 +287,6 @@ class Process(multiprocessing.Process, layer.Layer):
     def user_dump_queue(self):
         return self.queue_manager.get_queue(queue_manager.USER_DUMP_QUEUE)
 
-    @property
-    def end_check_thread(self):
-        return self._end_check_thread
-
     @property
     def device_states(self) -> Dict[Device, str]:
         return self._device_states
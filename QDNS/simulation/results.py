@@ -0,0 +1,455 @@
+# Copyright (c) 2021, COMU Team, Osman Ceylan and etc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 3. Neither the name of the COMU Team organization nor the
+#    names of its contributors may be used to endorse or promote products
+#    derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDER ''AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import os
+import pickle
+import struct
+import threading
+import weakref
+from queue import Empty
+from typing import Dict, List, Any, Callable, Tuple
+
+import numpy as np
+
+from QDNS.device.tools.device_tools import DEVICE_DUMPS_DONE
+from QDNS.tools.queue_manager import QUEUE_STATISTICS
+
+# Record frame: key lenght, message lenght, pickled (device, key), pickled message.
+RECORD_HEADER = struct.Struct("<IQ")
+
+# Key of kernel level records.
+KERNEL_RECORD = None
+
+
+def write_record(file, device, key, message) -> int:
+    """
+    Writes a result record to the end of file.
+
+    Args:
+        file: Binary file opened for writing.
+        device: Device label or KERNEL_RECORD.
+        key: Record key, application label or logs name.
+        message: Any picklable data.
+
+    Returns:
+        Offset of message in file.
+    """
+
+    key_data = pickle.dumps((device, key))
+    message_data = pickle.dumps(message)
+    file.write(RECORD_HEADER.pack(key_data.__len__(), message_data.__len__()))
+    file.write(key_data)
+    offset = file.tell()
+    file.write(message_data)
+    return offset
+
+
+def read_message(file, offset: int) -> Any:
+    """ Reads the message at given offset. """
+
+    file.seek(offset)
+    return pickle.load(file)
+
+
+def scan_records(result_file: str) -> Dict[Any, Dict[str, List[int]]]:
+    """
+    Builds record index of a result file without loading messages.
+
+    Args:
+        result_file: Path of result file.
+
+    Returns:
+        {device: {key: [offsets]}}
+    """
+
+    index = dict()
+    with open(result_file, "rb") as file:
+        while 1:
+            header = file.read(RECORD_HEADER.size)
+            if header.__len__() < RECORD_HEADER.size:
+                break
+
+            key_lenght, message_lenght = RECORD_HEADER.unpack(header)
+            device, key = pickle.loads(file.read(key_lenght))
+            offset = file.tell()
+            file.seek(message_lenght, os.SEEK_CUR)
+
+            try:
+                _ = index[device]
+            except KeyError:
+                index[device] = dict()
+
+            try:
+                index[device][key].append(offset)
+            except KeyError:
+                index[device][key] = [offset]
+    return index
+
+
+class ResultStreamWriter(threading.Thread):
+    def __init__(
+            self, dump_queue, result_file: str, accept_device: Callable[[Any], bool],
+            dumper_count: int, late_dump_timeout: float
+    ):
+        """
+        Writes user dump queue to result file while simulation runs.
+
+        Args:
+            dump_queue: User dump queue.
+            result_file: Path of result file.
+            accept_device: Filter for device keys of dumpings.
+            dumper_count: Count of layers that mark their last dumping, writer waits them after stop.
+            late_dump_timeout: Maximum wait time for a late dumping after stop.
+        """
+
+        super(ResultStreamWriter, self).__init__(daemon=True)
+        self._dump_queue = dump_queue
+        self._result_file = result_file
+        self._accept_device = accept_device
+        self._dumper_count = dumper_count
+        self._done_dumper_count = 0
+        self._late_dump_timeout = late_dump_timeout
+        self._file = open(result_file, "wb")
+        self._index: Dict[Any, Dict[str, List[int]]] = dict()
+        self._end_times: List[float] = list()
+        self._queue_statistics: Dict[str, Dict] = dict()
+        self._error = None
+
+    def run(self) -> None:
+        """ Writes dumpings until stop and last dumpings of all devices. """
+
+        stopping = False
+        while 1:
+            if stopping and self._done_dumper_count >= self._dumper_count:
+                break
+
+            # Dumpings of a device may arrive after stop, but a crashed device never sends its last.
+            if stopping:
+                try:
+                    item = self._dump_queue.get(timeout=self._late_dump_timeout)
+                except Empty:
+                    break
+            else:
+                item = self._dump_queue.get()
+
+            if item is None:
+                stopping = True
+                continue
+
+            try:
+                self.__write_item(item)
+            except Exception as e:
+                self._error = e
+
+    def __write_item(self, item):
+        """ Writes one dump queue item. """
+
+        if item[1] == DEVICE_DUMPS_DONE:
+            self._done_dumper_count += 1
+            return
+
+        if item[1] == QUEUE_STATISTICS:
+            self._queue_statistics[item[0]] = item[2]
+            return
+
+        if not self._accept_device(item[0]):
+            return
+
+        message = [item[i] for i in range(2, item.__len__())]
+        if item[1] == "EndTime":
+            self._end_times.append(message[0])
+            return
+
+        self.write(item[0], item[1], message)
+
+    def write(self, device, key, message):
+        """
+        Writes a record and indexes it.
+
+        Args:
+            device: Device label or KERNEL_RECORD.
+            key: Record key.
+            message: Any picklable data.
+        """
+
+        offset = write_record(self._file, device, key, message)
+
+        try:
+            _ = self._index[device]
+        except KeyError:
+            self._index[device] = dict()
+
+        try:
+            self._index[device][key].append(offset)
+        except KeyError:
+            self._index[device][key] = [offset]
+
+    def stop(self):
+        """ Stops writer after dumpings before this call are written. """
+
+        self._dump_queue.put(None)
+        self.join()
+
+    def close(self):
+        """ Closes result file. """
+
+        self._file.close()
+
+    @property
+    def result_file(self) -> str:
+        return self._result_file
+
+    @property
+    def index(self) -> Dict[Any, Dict[str, List[int]]]:
+        return self._index
+
+    @property
+    def end_times(self) -> List[float]:
+        return self._end_times
+
+    @property
+    def queue_statistics(self) -> Dict[str, Dict]:
+        return self._queue_statistics
+
+    @property
+    def error(self):
+        return self._error
+
+
+def _remove_result_file(result_file: str):
+    """ Removes temporary result file. """
+
+    try:
+        os.remove(result_file)
+    except OSError:
+        pass
+
+
+class SimulationResults(object):
+    def __init__(self, result_file: str, index=None, remove_file: bool = False):
+        """
+        Simulation result.
+        Reads records from result file only when asked.
+
+        Args:
+            result_file: Path of result file.
+            index: Record index, scans the file if None.
+            remove_file: Removes result file when results object is released.
+        """
+
+        self._result_file = result_file
+        if index is None:
+            index = scan_records(result_file)
+        self._index: Dict[Any, Dict[str, List[int]]] = index
+
+        if remove_file:
+            weakref.finalize(self, _remove_result_file, result_file)
+
+    def __records(self, device, key) -> List[Any]:
+        """ Reads all records of device key. """
+
+        offsets = self._index[device][key]
+        with open(self._result_file, "rb") as file:
+            return [read_message(file, offset) for offset in offsets]
+
+    def __unpacked(self, device, key):
+        """ Unpacks single records like old in memory results. """
+
+        records = self.__records(device, key)
+        if records.__len__() <= 1:
+            if records[0].__len__() <= 1:
+                return records[0][0]
+            return records[0]
+        return records
+
+    def device_logs(self, device_label: str):
+        """
+        Logs of given device.
+        """
+
+        return self.__unpacked(device_label, "DeviceLogs")
+
+    def application_logs(self, device_label: str, application_label: str):
+        """
+        Logs of given application of given device.
+        """
+
+        return self.__unpacked(device_label, application_label + "Logs")
+
+    def user_dumpings(self, device_label: str, application_label: str):
+        """
+        User outputs of given application of given device.
+
+        Args:
+            device_label: Needs exact device name. Other unique keys of device do not work.
+            application_label: Application label.
+
+        Return:
+            Raw dumped data.
+        """
+
+        return self.__unpacked(device_label, application_label)
+
+    def simulation_logs(self):
+        """
+        Logs of simulation instance.
+        """
+
+        return self.__records(KERNEL_RECORD, "SimulationLogs")[0]
+
+    def backend_logs(self):
+        """
+        Logs of backend wrapper.
+        """
+
+        return self.__records(KERNEL_RECORD, "BackendLogs")[0]
+
+    def scheduler_statistics(self) -> Dict[str, Dict[str, float]]:
+        """
+        Queueing delays of kernel actions per priority class. Empty if fair scheduling is not enabled in kernel settings.
+
+        Returns:
+            {priority class: {"Count", "Mean", "P50", "P90", "P99", "Max"}}
+        """
+
+        try:
+            return self.__records(KERNEL_RECORD, "SchedulerStatistics")[0]
+        except KeyError:
+            return dict()
+
+    def queue_statistics(self) -> Dict[str, Dict]:
+        """
+        Queue statistics of simulation. Empty if queue instrumentation is not enabled in kernel settings.
+
+        Returns:
+            {device label / miner name / kernel layer name: {layer name: {queue label: queue summary}}}
+
+        Notes:
+            Queue summary has "Count", "DwellTime" and "Depth" series over time
+            and "ServiceTime" for each item type. See QDNS.tools.queue_manager.QueueStatistics.
+        """
+
+        try:
+            return self.__records(KERNEL_RECORD, QUEUE_STATISTICS)[0]
+        except KeyError:
+            return dict()
+
+    @property
+    def readings(self) -> Dict[str, Any]:
+        """ Loads all records in a dict. Prefer the lazy methods for large results. """
+
+        readings = dict()
+        for device in self._index:
+            for key in self._index[device]:
+                if device is KERNEL_RECORD:
+                    readings[key] = self.__records(device, key)[0]
+                    continue
+
+                try:
+                    _ = readings[device]
+                except KeyError:
+                    readings[device] = dict()
+                readings[device][key] = self.__records(device, key)
+        return readings
+
+    @property
+    def result_file(self) -> str:
+        return self._result_file
+
+    @property
+    def index(self) -> Dict[Any, Dict[str, List[int]]]:
+        return self._index
+
+
+class ShotSamples(object):
+    def __init__(self, samples: np.ndarray, measurements: List[Tuple[str, str, int]]):
+        """
+        Measurement results of shots that are sampled from a recorded simulation.
+
+        Args:
+            samples: Sampled measurement results in shape of (shots, measurement count).
+            measurements: (device label, application label, qubit count) of measurements in record order.
+
+        Raises:
+            ValueError: If measurements do not match sample columns.
+        """
+
+        self._samples = samples
+        self._measurements: Dict[Tuple[str, str], List[np.ndarray]] = dict()
+
+        column = 0
+        for device_label, application_label, count in measurements:
+            try:
+                _ = self._measurements[(device_label, application_label)]
+            except KeyError:
+                self._measurements[(device_label, application_label)] = list()
+            self._measurements[(device_label, application_label)].append(samples[:, column:column + count])
+            column += count
+
+        if column != samples.shape[1]:
+            raise ValueError("Expected {} measurement results but sampled {}.".format(column, samples.shape[1]))
+
+    def measurements(self, device_label: str, application_label: str) -> List[np.ndarray]:
+        """
+        Sampled results of each measurement of given application of given device.
+
+        Args:
+            device_label: Device label.
+            application_label: Application label.
+
+        Returns:
+            Results in shape of (shots, measured qubit count) for each measurement, in measurement order.
+        """
+
+        try:
+            return self._measurements[(device_label, application_label)]
+        except KeyError:
+            return list()
+
+    def all_measurements(self, device_label: str, application_label: str) -> np.ndarray:
+        """
+        Sampled results of all measurements of given application of given device side by side.
+
+        Args:
+            device_label: Device label.
+            application_label: Application label.
+
+        Returns:
+            Results in shape of (shots, total measured qubit count).
+        """
+
+        measurements = self.measurements(device_label, application_label)
+        if measurements.__len__() == 0:
+            return np.zeros((self.shots, 0), dtype=np.uint8)
+        return np.hstack(measurements)
+
+    @property
+    def shots(self) -> int:
+        return self._samples.shape[0]
+
+    @property
+    def samples(self) -> np.ndarray:
+        return self._samples
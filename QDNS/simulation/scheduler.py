@@ -0,0 +1,266 @@
+# Copyright (c) 2021, COMU Team, Osman Ceylan and etc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 3. Neither the name of the COMU Team organization nor the
+#    names of its contributors may be used to endorse or promote products
+#    derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDER ''AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import itertools
+import time
+from array import array
+from collections import deque
+from typing import Dict, Any, Optional, Iterable, Tuple, List
+
+from QDNS.interactions import request, signal
+from QDNS.tools.queue_manager import sample_summary
+
+# Priority classes of kernel actions.
+CONTROL_CLASS = "Control"
+ROUTING_CLASS = "Routing"
+QUANTUM_CLASS = "Quantum"
+
+# Classes in priority order.
+priority_classes = (
+    CONTROL_CLASS,
+    ROUTING_CLASS,
+    QUANTUM_CLASS
+)
+
+# Actions handled per class in one scheduling round.
+default_priority_weights = {
+    CONTROL_CLASS: 8,
+    ROUTING_CLASS: 4,
+    QUANTUM_CLASS: 1
+}
+
+routing_requests = (
+    request.FindClassicRouteRequest,
+    request.FindQuantumRouteRequest
+)
+
+
+def check_priority_weights(weights: Dict[str, int]):
+    """
+    Checks priority weights.
+
+    Raises:
+        ValueError: If a class is missing or its weight is lower than 1.
+    """
+
+    for class_ in priority_classes:
+        try:
+            weight = weights[class_]
+        except KeyError:
+            raise ValueError("Priority weight of class {} is missing.".format(class_))
+
+        if weight < 1:
+            raise ValueError("Priority weight of class {} cannot be lower than 1.".format(class_))
+
+
+def request_qubits(request_: request.REQUEST) -> Tuple:
+    """ Qubits that a request touches, empty if none. """
+
+    if isinstance(request_, request.ApplySerialTransformationsRequest):
+        return tuple(qubit for gate in request_.list_of_gates for qubit in gate[2])
+
+    qubits = getattr(request_, "qubits", None)
+    if qubits is None:
+        return ()
+    return tuple(qubits)
+
+
+class KernelScheduler(object):
+    def __init__(self, quantum_requests: Iterable[type], weights: Optional[Dict[str, int]] = None):
+        """
+        Orders pending kernel actions by priority class and device.
+
+        Classes share kernel by weighted round robin, devices share their class by round robin.
+        Actions of a device keep their order in a class and an action waits earlier actions
+        of any device that touch its qubits.
+
+        Args:
+            quantum_requests: Request types that are served by backend.
+            weights: Actions handled per class in one round. Default is default_priority_weights.
+
+        Raises:
+            ValueError: If weights are not valid.
+        """
+
+        if weights is None:
+            weights = default_priority_weights
+        check_priority_weights(weights)
+
+        self._weights = dict(weights)
+        self._quantum_requests = frozenset(quantum_requests)
+        self._credits: Dict[str, int] = dict(self._weights)
+        self._sequence = itertools.count()
+        self._pending_count = 0
+
+        # Per class; device key to its action deque and round robin ring of devices.
+        self._device_queues: Dict[str, Dict[Any, deque]] = {class_: dict() for class_ in priority_classes}
+        self._device_rings: Dict[str, deque] = {class_: deque() for class_ in priority_classes}
+
+        # Qubit to sequences of pending actions that touch it.
+        self._qubit_waits: Dict[Any, deque] = dict()
+
+        # Queueing delays of handled actions.
+        self._delays: Dict[str, array] = {class_: array("d") for class_ in priority_classes}
+
+    def priority_class_of(self, action) -> str:
+        """ Priority class of an action. """
+
+        if isinstance(action, signal.SIGNAL):
+            return CONTROL_CLASS
+
+        if isinstance(action, routing_requests):
+            return ROUTING_CLASS
+
+        if type(action) in self._quantum_requests:
+            return QUANTUM_CLASS
+
+        return CONTROL_CLASS
+
+    def push(self, action):
+        """ Adds an action to its class and device queue. """
+
+        class_ = self.priority_class_of(action)
+        sequence = next(self._sequence)
+
+        qubits = ()
+        if class_ == QUANTUM_CLASS:
+            qubits = frozenset(request_qubits(action))
+            for qubit in qubits:
+                try:
+                    self._qubit_waits[qubit].append(sequence)
+                except KeyError:
+                    self._qubit_waits[qubit] = deque((sequence,))
+
+        device_key = getattr(action, "asker_uuid", None)
+        try:
+            self._device_queues[class_][device_key].append((sequence, time.time(), qubits, action))
+        except KeyError:
+            self._device_queues[class_][device_key] = deque(((sequence, time.time(), qubits, action),))
+            self._device_rings[class_].append(device_key)
+        self._pending_count += 1
+
+    def pop(self):
+        """
+        Takes next action.
+
+        Returns:
+            Action or None if scheduler is empty.
+        """
+
+        if self._pending_count == 0:
+            return None
+
+        # Oldest pending action is always ready, so a refilled round always gives one.
+        while 1:
+            for class_ in priority_classes:
+                if self._credits[class_] <= 0:
+                    continue
+
+                action = self.__pop_class(class_)
+                if action is not None:
+                    self._credits[class_] -= 1
+                    return action
+
+            self._credits = dict(self._weights)
+
+    def pop_many(self, max_count: int) -> List[Any]:
+        """ Takes next actions in order, at most max count. """
+
+        actions = list()
+        while actions.__len__() < max_count:
+            action = self.pop()
+            if action is None:
+                break
+            actions.append(action)
+        return actions
+
+    def __pop_class(self, class_: str):
+        """ Takes next ready action of class from next device. """
+
+        ring = self._device_rings[class_]
+        device_queues = self._device_queues[class_]
+        for _ in range(ring.__len__()):
+            device_key = ring[0]
+            device_queue = device_queues[device_key]
+            sequence, push_time, qubits, action = device_queue[0]
+
+            if not self.__is_ready(sequence, qubits):
+                ring.rotate(-1)
+                continue
+
+            device_queue.popleft()
+            if device_queue.__len__() == 0:
+                ring.popleft()
+                device_queues.pop(device_key)
+            else:
+                ring.rotate(-1)
+
+            for qubit in qubits:
+                waits = self._qubit_waits[qubit]
+                waits.popleft()
+                if waits.__len__() == 0:
+                    self._qubit_waits.pop(qubit)
+
+            # Delay from process of action if it is stamped, else from scheduler push.
+            enqueue_time = getattr(action, "enqueue_time", None)
+            if enqueue_time is None:
+                enqueue_time = push_time
+            self._delays[class_].append(time.time() - enqueue_time)
+            self._pending_count -= 1
+            return action
+        return None
+
+    def __is_ready(self, sequence: int, qubits) -> bool:
+        """ Action is ready if no earlier pending action touches its qubits. """
+
+        for qubit in qubits:
+            if self._qubit_waits[qubit][0] != sequence:
+                return False
+        return True
+
+    def is_empty(self) -> bool:
+        return self._pending_count == 0
+
+    def statistics(self) -> Dict[str, Dict[str, float]]:
+        """
+        Queueing delays of handled actions per class.
+
+        Returns:
+            {class: {"Count", "Mean", "P50", "P90", "P99", "Max"}}
+        """
+
+        return {class_: sample_summary(self._delays[class_]) for class_ in priority_classes}
+
+    @property
+    def weights(self) -> Dict[str, int]:
+        return self._weights
+
+    @property
+    def pending_count(self) -> int:
+        return self._pending_count
+
+    def __len__(self) -> int:
+        return self._pending_count
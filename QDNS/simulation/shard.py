@@ -0,0 +1,298 @@
+# Copyright (c) 2021, COMU Team, Osman Ceylan and etc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 3. Neither the name of the COMU Team organization nor the
+#    names of its contributors may be used to endorse or promote products
+#    derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDER ''AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import threading
+from queue import Queue as TQueue
+from typing import List, Sequence, Tuple, Callable, Dict, Any, Set, Optional
+
+import numpy as np
+
+from QDNS.backend.backend_wrapper import BackendWrapper
+from QDNS.backend.tools.virt_qubit import handle_length
+from QDNS.tools.various_tools import TerminatableThread
+
+# Mask of backend qubit handle in sharded qubit ids.
+HANDLE_MASK = (1 << handle_length) - 1
+
+
+def shard_qubit_id(shard_index: int, qubit: int) -> int:
+    """ Packs shard index into upper bits of backend qubit handle. """
+
+    return ((shard_index + 1) << handle_length) | int(qubit)
+
+
+def resolve_shard_qubit_id(qubit: int) -> Tuple[int, int]:
+    """
+    Resolves sharded qubit id.
+
+    Returns:
+        (Shard index, backend qubit handle).
+
+    Raises:
+        ValueError: If qubit id is not sharded.
+    """
+
+    qubit = int(qubit)
+    if qubit >> handle_length == 0:
+        raise ValueError("Qubit {} is not a sharded qubit.".format(qubit))
+    return (qubit >> handle_length) - 1, qubit & HANDLE_MASK
+
+
+def resolve_shard_indexes(qubits: Sequence[int]) -> Set[int]:
+    """
+    Resolves shard indexes of qubits at once.
+
+    Raises:
+        ValueError: If a qubit id is not sharded.
+    """
+
+    shards = np.asarray(qubits, dtype=np.int64) >> handle_length
+    if (shards == 0).any():
+        raise ValueError("Qubits {} are not sharded qubits.".format(np.asarray(qubits)[shards == 0]))
+    return set((shards - 1).tolist())
+
+
+class ShardBackendWrapper(BackendWrapper):
+    """ Backend wrapper of a kernel shard. Prefixes qubit ids with shard index. """
+
+    def __init__(self, shard_index: int):
+        """
+        Shard backend wrapper.
+
+        Args:
+            shard_index: Index of owner shard.
+        """
+
+        super(ShardBackendWrapper, self).__init__()
+        self._shard_index = shard_index
+
+    def _to_shard(self, qubits: Sequence[int]) -> np.ndarray:
+        return np.asarray(qubits, dtype=np.int64) | ((self._shard_index + 1) << handle_length)
+
+    @staticmethod
+    def _to_backend(qubits: Sequence[int]) -> np.ndarray:
+        return np.asarray(qubits, dtype=np.int64) & HANDLE_MASK
+
+    def allocate_qubits(self, count: int, *args) -> np.ndarray:
+        return self._to_shard(super(ShardBackendWrapper, self).allocate_qubits(count, *args))
+
+    def allocate_qframes(self, frame_size: int, frame_count: int, *args) -> np.ndarray:
+        return self._to_shard(super(ShardBackendWrapper, self).allocate_qframes(frame_size, frame_count, *args))
+
+    def deallocate_qubits(self, qubits: Sequence[int]) -> bool:
+        return super(ShardBackendWrapper, self).deallocate_qubits(self._to_backend(qubits))
+
+    def apply_transformation(self, gate_id: int, gate_arguments: Tuple, qubits: Sequence[int], *args):
+        return super(ShardBackendWrapper, self).apply_transformation(gate_id, gate_arguments, self._to_backend(qubits), *args)
+
+    def measure_qubits(self, qubits: Sequence[int], *args) -> List[int]:
+        return super(ShardBackendWrapper, self).measure_qubits(self._to_backend(qubits), *args)
+
+    def reset_qubits(self, qubits: Sequence[int]):
+        return super(ShardBackendWrapper, self).reset_qubits(self._to_backend(qubits))
+
+    def generate_ghz_pair(self, size: int, count: int) -> np.ndarray:
+        pairs = super(ShardBackendWrapper, self).generate_ghz_pair(size, count)
+        if pairs is None:
+            return None
+        return self._to_shard(pairs)
+
+    def process_channel_error(self, qubits: Sequence[int], percent: float):
+        return super(ShardBackendWrapper, self).process_channel_error(self._to_backend(qubits), percent)
+
+    def density_matrix(self, qubits: Sequence[int]):
+        return super(ShardBackendWrapper, self).density_matrix(self._to_backend(qubits))
+
+    def apply_serial_transformations(self, list_of_gates: Sequence[List], *args):
+        backend_gates = [[gate[0], gate[1], self._to_backend(gate[2])] for gate in list_of_gates]
+        return super(ShardBackendWrapper, self).apply_serial_transformations(backend_gates, *args)
+
+    @property
+    def shard_index(self) -> int:
+        return self._shard_index
+
+
+class KernelShard(object):
+    def __init__(self, shard_index: int, failure_handler: Optional[Callable[[Callable, Tuple, Exception], None]] = None):
+        """
+        Kernel shard. Serves backend jobs of its own qubits in a worker thread.
+
+        Args:
+            shard_index: Index of shard.
+            failure_handler: Called as failure_handler(job, args, error) in worker when a job raises.
+
+        Notes:
+            Jobs of a shard run in arrival order, so operations on same qubit keep their order.
+        """
+
+        self._shard_index = shard_index
+        self._backend_wrapper = ShardBackendWrapper(shard_index)
+        self._job_queue = TQueue()
+        self._worker = None
+        self._failure_handler = failure_handler
+        self._error = None
+
+        # Submitted but not finished jobs. Counted on submit, so a job being dequeued is never missed.
+        self._pending_jobs = 0
+        self._pending_lock = threading.Lock()
+
+    def start_shard(self, configuration, noise_pattern, entanglement_groups: bool = False):
+        """ Starts backend and worker of shard. """
+
+        self._backend_wrapper.start_module(configuration, noise_pattern, entanglement_groups)
+        self._worker = TerminatableThread(self.run, daemon=True)
+        self._worker.start()
+
+    def submit(self, job: Callable, *args):
+        """
+        Submits a job to shard.
+
+        Args:
+            job: Callable, called as job(*args, backend_wrapper).
+            args: Job arguments.
+        """
+
+        with self._pending_lock:
+            self._pending_jobs += 1
+        self._job_queue.put((job, args))
+
+    def run(self):
+        """ Worker loop of shard. """
+
+        while 1:
+            job, args = self._job_queue.get()
+            if job is None:
+                break
+
+            try:
+                job(*args, self._backend_wrapper)
+            except Exception as e:
+                self._backend_wrapper.logger.error("Shard {} job failed: {}".format(self._shard_index, e))
+                if self._error is None:
+                    self._error = e
+
+                # Asker of job must not wait for a respond that never comes.
+                if self._failure_handler is not None:
+                    try:
+                        self._failure_handler(job, args, e)
+                    except Exception as handler_error:
+                        self._backend_wrapper.logger.error(
+                            "Shard {} failure handler failed: {}".format(self._shard_index, handler_error)
+                        )
+
+            with self._pending_lock:
+                self._pending_jobs -= 1
+
+    def stop_shard(self, keep_backend: bool = False):
+        """
+        Finishes pending jobs then terminates backend of shard.
+
+        Args:
+            keep_backend: Keeps backend alive for restart_shard.
+        """
+
+        if self._worker is not None:
+            self._job_queue.put((None, None))
+            self._worker.join()
+            self._worker = None
+
+        if not keep_backend:
+            self._backend_wrapper.terminate_backend()
+
+    def restart_shard(self):
+        """ Resets backend of shard and starts its worker if it is stopped. """
+
+        self._backend_wrapper.reset_backend()
+        self._error = None
+        if self._worker is None:
+            self._worker = TerminatableThread(self.run, daemon=True)
+            self._worker.start()
+
+    def is_idle(self) -> bool:
+        """ Returns true if shard has no pending job. """
+
+        with self._pending_lock:
+            return self._pending_jobs == 0
+
+    @property
+    def shard_index(self) -> int:
+        return self._shard_index
+
+    @property
+    def backend_wrapper(self) -> ShardBackendWrapper:
+        return self._backend_wrapper
+
+    @property
+    def error(self):
+        return self._error
+
+
+class ShardJoin(object):
+    def __init__(self, part_count: int, finisher: Callable[[Dict[int, Any]], None], failer: Callable[[Exception], None]):
+        """
+        Joins results of a request that is splitted among shards.
+
+        Args:
+            part_count: Count of parts.
+            finisher: Called with {part index: result} when all parts are done.
+            failer: Called with first error instead of finisher when a part is failed.
+        """
+
+        self._remaning = part_count
+        self._results: Dict[int, Any] = dict()
+        self._error: Optional[Exception] = None
+        self._lock = threading.Lock()
+        self._finisher = finisher
+        self._failer = failer
+
+    def part_done(self, part_index: int, result):
+        """ Marks a part as done, last part calls the finisher. """
+
+        with self._lock:
+            self._results[part_index] = result
+            self._remaning -= 1
+            done = self._remaning == 0
+
+        if done:
+            self.__finish()
+
+    def part_failed(self, part_index: int, error: Exception):
+        """ Marks a part as failed, last part calls the failer. """
+
+        with self._lock:
+            if self._error is None:
+                self._error = error
+            self._remaning -= 1
+            done = self._remaning == 0
+
+        if done:
+            self.__finish()
+
+    def __finish(self):
+        if self._error is None:
+            self._finisher(self._results)
+        else:
+            self._failer(self._error)
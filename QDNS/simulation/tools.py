@@ -24,10 +24,14 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from typing import Union
+from typing import Union, Optional, Dict
 
 from psutil import cpu_count
 
+from QDNS.backend.tools.virt_qubit import max_shard_count
+from QDNS.simulation.results import SimulationResults
+from QDNS.simulation.scheduler import check_priority_weights
+from QDNS.tools.any_settings import AnySettings
 from QDNS.tools.module import ModuleSettings
 
 core_count = cpu_count(logical=False)
@@ -51,6 +55,7 @@ simulation_states = (
 )
 
 kernel_layer_label = "Kernel"
+end_watchdog_time = 1.0
 
 # Process states.
 MINER_NOT_STARTED = "\"miner process not started\""
@@ -158,65 +163,122 @@ def change_deafault_miner_controller_settings(new_settings: MinerControllerSetti
     default_controller_settings = new_settings
 
 
-class SimulationResults(object):
-    def __init__(self, readings):
+class KernelSettings(AnySettings):
+    drain_requests_ = "drain requests"
+    max_drain_count_ = "max drain count"
+    shard_count_ = "shard count"
+    result_file_ = "result file"
+    queue_instrumentation_ = "queue instrumentation"
+    fair_scheduling_ = "fair scheduling"
+    priority_weights_ = "priority weights"
+    entanglement_groups_ = "entanglement groups"
+
+    def __init__(
+            self, drain_requests: bool = False, max_drain_count: int = 256,
+            shard_count: int = 1, result_file: Optional[str] = None,
+            queue_instrumentation: bool = False, fair_scheduling: bool = False,
+            priority_weights: Optional[Dict[str, int]] = None,
+            entanglement_groups: bool = False
+    ):
         """
-        Simulation result.
-        Kernel knows the format of reading.
+        Simulation kernel settings.
+
+        Args:
+            drain_requests: Kernel takes all pending requests in one wakeup and batches compatible backend calls.
+            max_drain_count: Maximum action count taken in one wakeup.
+            shard_count: Count of kernel shards. Each shard runs its own backend in a worker thread.
+                Devices connected by quantum channels share a shard, so a network with one connected
+                quantum part runs on a single shard.
+            result_file: Path of file that simulation results are streamed into.
+                Results go to a temporary file if None, which is removed with its results object.
+            queue_instrumentation: Records depth, dwell time and service time of layer queues.
+                Statistics are given by SimulationResults.queue_statistics.
+            fair_scheduling: Kernel handles pending actions by priority class (control, routing, quantum)
+                and shares each class among devices instead of arrival order.
+            priority_weights: Actions handled per priority class in one scheduling round.
+                Default is QDNS.simulation.scheduler.default_priority_weights.
+            entanglement_groups: Backend allocates qubits as single qubit states, multi qubit gates merge them.
+                Qiskit backend is not supported. Chunked backends need 1 qubit chunks in their frame
+                configuration. Stim backend keeps the whole tableau, so it is not affected.
         """
 
-        self.readings = readings
+        if max_drain_count < 1:
+            raise ValueError("Max drain count cannot be lower than 1.")
 
-    def device_logs(self, device_label: str):
-        """
-        Logs of given device.
-        """
+        if shard_count < 1:
+            raise ValueError("Shard count cannot be lower than 1.")
 
-        if self.readings[device_label]["DeviceLogs"].__len__() <= 1:
-            if self.readings[device_label]["DeviceLogs"][0].__len__() <= 1:
-                return self.readings[device_label]["DeviceLogs"][0][0]
-            return self.readings[device_label]["DeviceLogs"][0]
-        return self.readings[device_label]["DeviceLogs"]
+        if shard_count > max_shard_count:
+            raise ValueError("Shard count cannot be higher than {}.".format(max_shard_count))
 
-    def application_logs(self, device_label: str, application_label: str):
-        """
-        Logs of given application of given device.
-        """
+        if priority_weights is not None:
+            check_priority_weights(priority_weights)
 
-        if self.readings[device_label][application_label + "Logs"].__len__() <= 1:
-            if self.readings[device_label][application_label + "Logs"][0].__len__() <= 1:
-                return self.readings[device_label][application_label + "Logs"][0][0]
-            return self.readings[device_label][application_label + "Logs"][0]
-        return self.readings[device_label][application_label + "Logs"]
+        kwargs = {
+            self.drain_requests_: drain_requests,
+            self.max_drain_count_: max_drain_count,
+            self.shard_count_: shard_count,
+            self.result_file_: result_file,
+            self.queue_instrumentation_: queue_instrumentation,
+            self.fair_scheduling_: fair_scheduling,
+            self.priority_weights_: priority_weights,
+            self.entanglement_groups_: entanglement_groups
+        }
+        super(KernelSettings, self).__init__(**kwargs)
 
-    def user_dumpings(self, device_label: str, application_label: str):
-        """
-        User outputs of given application of given device.
+    @property
+    def drain_requests(self) -> bool:
+        return self.get_setting(self.drain_requests_)
 
-        Args:
-            device_label: Needs exact device name. Other unique keys of device do not work.
-            application_label: Application label.
+    @property
+    def max_drain_count(self) -> int:
+        return self.get_setting(self.max_drain_count_)
 
-        Return:
-            Raw dumped data.
-        """
+    @property
+    def shard_count(self) -> int:
+        return self.get_setting(self.shard_count_)
 
-        if self.readings[device_label][application_label].__len__() <= 1:
-            if self.readings[device_label][application_label][0].__len__() <= 1:
-                return self.readings[device_label][application_label][0][0]
-            return self.readings[device_label][application_label][0]
-        return self.readings[device_label][application_label]
+    @property
+    def result_file(self) -> Optional[str]:
+        return self.get_setting(self.result_file_)
 
-    def simulation_logs(self):
-        """
-        Logs of simulation instance.
-        """
+    @property
+    def queue_instrumentation(self) -> bool:
+        return self.get_setting(self.queue_instrumentation_)
 
-        return self.readings["SimulationLogs"]
+    @property
+    def fair_scheduling(self) -> bool:
+        return self.get_setting(self.fair_scheduling_)
 
-    def backend_logs(self):
-        """
-        Logs of backend wrapper.
-        """
+    @property
+    def priority_weights(self) -> Optional[Dict[str, int]]:
+        return self.get_setting(self.priority_weights_)
+
+    @property
+    def entanglement_groups(self) -> bool:
+        return self.get_setting(self.entanglement_groups_)
+
+    def __str__(self) -> str:
+        text = str()
+        text += "Drain requests: {}\n".format(self.drain_requests)
+        text += "Max drain count: {}\n".format(self.max_drain_count)
+        text += "Shard count: {}\n".format(self.shard_count)
+        text += "Result file: {}\n".format(self.result_file)
+        text += "Queue instrumentation: {}\n".format(self.queue_instrumentation)
+        text += "Fair scheduling: {}\n".format(self.fair_scheduling)
+        text += "Priority weights: {}\n".format(self.priority_weights)
+        text += "Entanglement groups: {}\n".format(self.entanglement_groups)
+        return text
+
+
+default_kernel_settings = KernelSettings()
+
+
+def change_default_kernel_settings(new_settings: KernelSettings):
+    """
+    Changes default simulation kernel settings.
+    Must call before simulation.
+    """
 
-        return self.readings["BackendLogs"]
\ No newline at end of file
+    global default_kernel_settings
+    default_kernel_settings = new_settings
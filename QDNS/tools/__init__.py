@@ -2,5 +2,5 @@ __all__ = [
     "any_settings", "communication",
     "gates", "instance_logger",
     "layer", "module", "queue_manager",
-    "state_handler", "various_tools"
+    "simulation_clock", "state_handler", "various_tools"
 ]
@@ -24,10 +24,11 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import time
 from datetime import datetime
 from typing import Any, Tuple
 
+from QDNS.tools import simulation_clock
+
 ACK_DATA = "This message represents as a ack data."
 
 classic_package_live_count = 20
@@ -243,7 +244,7 @@ class Qupack(object):
 class PingRequestPackage(object):
     def __init__(self, device_id):
         self._device_id = device_id
-        self._ping_time = time.time()
+        self._ping_time = simulation_clock.get_time()
 
     @property
     def device_id(self):
@@ -257,7 +258,7 @@ class PingRequestPackage(object):
 class PingRespondPackage(object):
     def __init__(self, device_id):
         self._device_id = device_id
-        self._ping_time = time.time()
+        self._ping_time = simulation_clock.get_time()
 
     @property
     def device_id(self):
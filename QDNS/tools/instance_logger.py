@@ -207,6 +207,11 @@ class SubLogger(object):
             self._logs += message
         self._logger.log(level, msg)
 
+    def clear_logs(self) -> None:
+        """ Clears collected logs. """
+
+        self._logs = str()
+
     @property
     def logs(self) -> str:
         return self._logs
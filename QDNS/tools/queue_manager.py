@@ -24,6 +24,12 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import time
+from array import array
+from typing import Dict, Any, Optional
+
+import numpy as np
+
 # General Layer Queues.
 LAYER_STATE_REPORT_QUEUE = "STATE REPORT QUEUE OF LAYER"
 LAYER_REQUEST_QUEUE = "REQUEST QUEUE OF LAYER"
@@ -55,6 +61,171 @@ INCOME_QUBIT_QUEUE = "QUBIT QUEUE OF APPLICATION"
 INCOME_PACKAGE_QUEUE = "PACKAGE QUEUE OF APPLICATION"
 
 
+# Queue instrumentation is off unless kernel enables it before processes are forked.
+_instrumentation_enabled = False
+
+# Dump key of queue statistics of a layer.
+QUEUE_STATISTICS = "QueueStatistics"
+
+# Depth series is halved when it grows over this count.
+max_depth_samples = 4096
+
+
+def enable_queue_instrumentation(enabled: bool):
+    """
+    Enables or disables instrumentation of queues that are taken from queue managers.
+    Must call before simulation processes are forked.
+
+    Args:
+        enabled: Instrumentation flag.
+    """
+
+    global _instrumentation_enabled
+    _instrumentation_enabled = enabled
+
+
+def is_queue_instrumentation_enabled() -> bool:
+    return _instrumentation_enabled
+
+
+def sample_summary(samples) -> Dict[str, float]:
+    """ Mean, median, p90, p99 and max of samples. """
+
+    if samples.__len__() == 0:
+        return {"Count": 0}
+
+    values = np.frombuffer(samples, dtype=np.float64)
+    p50, p90, p99 = np.percentile(values, (50, 90, 99))
+    return {
+        "Count": values.__len__(),
+        "Mean": float(values.mean()),
+        "P50": float(p50),
+        "P90": float(p90),
+        "P99": float(p99),
+        "Max": float(values.max())
+    }
+
+
+class QueueStatistics(object):
+    def __init__(self):
+        """
+        Statistics of one instrumented queue.
+
+        Dwell time is measured for items that are stamped with enqueue time (requests, responds and signals).
+        Service time of an item is the time until its consumer comes back to the queue,
+        items taken together without blocking share the time of their batch.
+        """
+
+        self._get_count = 0
+        self._dwell_times = array("d")
+        self._depth_samples = list()
+        self._depth_stride = 1
+        self._service_times: Dict[str, array] = dict()
+        self._pending_types = list()
+        self._pending_since = 0.0
+
+    def before_get(self, now: float, block: bool):
+        """ Closes service time of pending items when consumer blocks on queue again. """
+
+        if not block or self._pending_types.__len__() == 0:
+            return
+
+        service_time = (now - self._pending_since) / self._pending_types.__len__()
+        for type_name in self._pending_types:
+            try:
+                self._service_times[type_name].append(service_time)
+            except KeyError:
+                self._service_times[type_name] = array("d", (service_time,))
+        self._pending_types.clear()
+
+    def after_get(self, item: Any, now: float, depth: Optional[int]):
+        """ Records dwell time and depth of got item and opens its service time. """
+
+        self._get_count += 1
+
+        enqueue_time = getattr(item, "enqueue_time", None)
+        if enqueue_time is not None:
+            self._dwell_times.append(now - enqueue_time)
+
+        if depth is not None and self._get_count % self._depth_stride == 0:
+            self._depth_samples.append((now, depth))
+            if self._depth_samples.__len__() > max_depth_samples:
+                del self._depth_samples[::2]
+                self._depth_stride *= 2
+
+        if self._pending_types.__len__() == 0:
+            self._pending_since = now
+        self._pending_types.append(type(item).__name__)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summary of queue.
+
+        Returns:
+            {"Count": int, "DwellTime": percentiles, "Depth": [(time, depth)], "ServiceTime": {type name: percentiles}}
+        """
+
+        return {
+            "Count": self._get_count,
+            "DwellTime": sample_summary(self._dwell_times),
+            "Depth": list(self._depth_samples),
+            "ServiceTime": {key: sample_summary(self._service_times[key]) for key in self._service_times}
+        }
+
+    @property
+    def get_count(self) -> int:
+        return self._get_count
+
+
+class InstrumentedQueue(object):
+    def __init__(self, the_queue, statistics: QueueStatistics):
+        """
+        Queue view that records statistics of its consumer.
+        Methods other than get are passed to wrapped queue.
+
+        Args:
+            the_queue: Any queue.
+            statistics: Statistics of queue.
+        """
+
+        self._queue = the_queue
+        self._statistics = statistics
+
+    def get(self, block: bool = True, timeout: Optional[float] = None):
+        self._statistics.before_get(time.time(), block)
+        item = self._queue.get(block, timeout)
+
+        try:
+            depth = self._queue.qsize()
+        except (NotImplementedError, AttributeError):
+            depth = None
+
+        self._statistics.after_get(item, time.time(), depth)
+        return item
+
+    def get_nowait(self):
+        return self.get(False)
+
+    def reset_statistics(self):
+        """ Starts statistics from zero. """
+
+        self._statistics = QueueStatistics()
+
+    def __getattr__(self, name):
+        # Private names are not passed, view must not recurse before its wrapped queue is set.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._queue, name)
+
+    @property
+    def wrapped_queue(self):
+        return self._queue
+
+    @property
+    def statistics(self) -> QueueStatistics:
+        return self._statistics
+
+
 class QueueManager(object):
     def __init__(self, **kwargs):
         """
@@ -66,14 +237,23 @@ class QueueManager(object):
         for args in kwargs:
             self._queue_dict[args] = kwargs[args]
 
+        # Labels of queues wrapped by this manager.
+        self._instrumented_labels = set()
+
     def get_queue(self, label: str):
-        """ Gets the labeled queue. """
+        """ Gets the labeled queue. Queue is wrapped in an instrumented view if instrumentation is enabled. """
 
         try:
-            return self._queue_dict[label]
+            the_queue = self._queue_dict[label]
         except (KeyError, IndexError) as E:
             raise E("Queue manager cannot parse queue for {}.".format(label))
 
+        if _instrumentation_enabled and the_queue is not None and not isinstance(the_queue, InstrumentedQueue):
+            the_queue = InstrumentedQueue(the_queue, QueueStatistics())
+            self._queue_dict[label] = the_queue
+            self._instrumented_labels.add(label)
+        return the_queue
+
     def add_queue(self, label: str, new_queue):
         """ Adds new queue to manager. """
 
@@ -87,6 +267,7 @@ class QueueManager(object):
         if label not in self._queue_dict.keys():
             raise KeyError("{} labeled queue is not in manager.".format(label))
         self._queue_dict[label] = new_queue
+        self._instrumented_labels.discard(label)
 
     def remove_queue(self, label: str):
         """ Removes queue from manager. """
@@ -94,6 +275,7 @@ class QueueManager(object):
         if label not in self._queue_dict.keys():
             raise KeyError("{} labeled queue is not in manager.".format(label))
         self._queue_dict.pop(label)
+        self._instrumented_labels.discard(label)
 
     def is_have_this_queue(self, label: str) -> bool:
         if label not in self._queue_dict.keys():
@@ -104,6 +286,28 @@ class QueueManager(object):
         """ Clears all queues in manager. """
 
         self._queue_dict.clear()
+        self._instrumented_labels.clear()
+
+    def queue_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Statistics of instrumented queues of this manager that are used.
+
+        Returns:
+            {queue label: queue summary}
+        """
+
+        to_return = dict()
+        for label in self._instrumented_labels:
+            statistics = self._queue_dict[label].statistics
+            if statistics.get_count > 0:
+                to_return[label] = statistics.summary()
+        return to_return
+
+    def clear_queue_statistics(self):
+        """ Resets statistics of instrumented queues. """
+
+        for label in self._instrumented_labels:
+            self._queue_dict[label].reset_statistics()
 
     @property
     def queue_count(self) -> int:
@@ -0,0 +1,325 @@
+# Copyright (c) 2021, COMU Team, Osman Ceylan and etc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 3. Neither the name of the COMU Team organization nor the
+#    names of its contributors may be used to endorse or promote products
+#    derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDER ''AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import heapq
+import multiprocessing
+import threading
+import time
+from queue import Empty
+from typing import List, Optional
+
+from QDNS.interactions import signal
+
+# Time modes of simulation.
+REAL_TIME_MODE = "real time mode"
+VIRTUAL_TIME_MODE = "virtual time mode"
+
+time_modes = (
+    REAL_TIME_MODE,
+    VIRTUAL_TIME_MODE
+)
+
+# Kernel idle time before jumping to next event when all participants wait (real seconds).
+default_quiescence_time = 0.01
+
+# Poll interval of timed queue waits in virtual time (real seconds).
+default_poll_interval = 0.005
+
+
+class SimulationClock(object):
+    def __init__(self, event_queue, quiescence_time: float = None, poll_interval: float = None):
+        """
+        Discrete-event virtual clock of simulation.
+
+        Args:
+            event_queue: Kernel request queue, events are scheduled through it.
+            quiescence_time: Kernel idle time before virtual time jumps to next event.
+            poll_interval: Real time poll interval of timed queue waits.
+
+        Notes:
+            Clock must be created before miner processes are started.
+            Shared memory is inherited by forked processes.
+
+            Participants are devices until they start their applications and user applications.
+            Virtual time only moves when every participant waits on clock or a queue and kernel finds
+            nothing to do for quiescence time, it then jumps to the earliest scheduled event.
+            Idle gaps cost nothing and user code never loses virtual time while it computes.
+
+            Messages between layers are not tracked. A message that is still in flight after quiescence
+            time lets time jump before its receiver wakes up, so virtual time runs are not guaranteed to
+            be reproducible under heavy load.
+        """
+
+        if quiescence_time is None:
+            quiescence_time = default_quiescence_time
+        if poll_interval is None:
+            poll_interval = default_poll_interval
+
+        self._event_queue = event_queue
+        self._quiescence_time = quiescence_time
+        self._poll_interval = poll_interval
+
+        self._now = multiprocessing.RawValue("d", 0.0)
+        self._condition = multiprocessing.Condition()
+
+        # Participant threads and how many of them wait on clock or a queue.
+        self._participant_count = multiprocessing.Value("i", 0)
+        self._waiting_count = multiprocessing.Value("i", 0)
+        self._local = threading.local()
+
+        # Event heap only lives in kernel process.
+        self._event_heap: List[float] = list()
+
+    def time(self) -> float:
+        """ Returns the virtual time in seconds. """
+
+        return self._now.value
+
+    def schedule(self, event_time: float):
+        """
+        Schedules an event to kernel event heap.
+
+        Args:
+            event_time: Virtual time of event.
+        """
+
+        signal.ScheduleClockEventSignal(event_time).emit(self._event_queue)
+
+    def sleep(self, seconds: float):
+        """
+        Sleeps in virtual time.
+
+        Args:
+            seconds: Virtual seconds to sleep.
+        """
+
+        if seconds <= 0:
+            return
+
+        deadline = self.time() + seconds
+        self.schedule(deadline)
+        waiting = self.__set_waiting(True)
+        try:
+            with self._condition:
+                while self._now.value < deadline:
+                    self._condition.wait()
+        finally:
+            if waiting:
+                self.__set_waiting(False)
+
+    def queue_get(self, the_queue, timeout: Optional[float] = None):
+        """
+        Gets item from queue with virtual timeout.
+
+        Args:
+            the_queue: Any queue.
+            timeout: Virtual expire time.
+
+        Raises:
+            Empty: If timeout is expired.
+        """
+
+        if timeout is None:
+            waiting = self.__set_waiting(True)
+            try:
+                return the_queue.get()
+            finally:
+                if waiting:
+                    self.__set_waiting(False)
+
+        deadline = self.time() + timeout
+        self.schedule(deadline)
+        waiting = self.__set_waiting(True)
+        try:
+            while 1:
+                try:
+                    return the_queue.get(timeout=self._poll_interval)
+                except Empty:
+                    if self.time() >= deadline:
+                        raise Empty
+        finally:
+            if waiting:
+                self.__set_waiting(False)
+
+    def add_participants(self, count: int = 1):
+        """
+        Adds participants that must wait before virtual time moves.
+        Call before participant threads start, so time does not move before they run.
+
+        Args:
+            count: Count of participants.
+        """
+
+        with self._participant_count.get_lock():
+            self._participant_count.value += count
+
+    def enter_participant(self):
+        """ Marks calling thread as an added participant, its clock and queue waits are counted. """
+
+        self._local.participant = True
+
+    def leave_participant(self):
+        """ Removes participant of calling thread. """
+
+        if not getattr(self._local, "participant", False):
+            return
+
+        self._local.participant = False
+        with self._participant_count.get_lock():
+            self._participant_count.value -= 1
+
+    def __set_waiting(self, waiting: bool) -> bool:
+        """ Counts wait of calling thread if it is a participant. Returns true if it is counted. """
+
+        if not getattr(self._local, "participant", False):
+            return False
+
+        with self._waiting_count.get_lock():
+            self._waiting_count.value += 1 if waiting else -1
+        return True
+
+    def is_quiescent(self) -> bool:
+        """ Returns true if every participant waits on clock or a queue. """
+
+        return self._waiting_count.value >= self._participant_count.value
+
+    def push_event(self, event_time: float):
+        """
+        Pushes event to heap. Only kernel should call this method.
+
+        Args:
+            event_time: Virtual time of event.
+        """
+
+        heapq.heappush(self._event_heap, event_time)
+
+    def advance(self) -> bool:
+        """
+        Jumps to the earliest scheduled event and wakes up waiters.
+        Only kernel should call this method.
+
+        Returns:
+            False if there is no event to advance.
+        """
+
+        if self._event_heap.__len__() == 0:
+            return False
+
+        event_time = heapq.heappop(self._event_heap)
+        while self._event_heap.__len__() > 0 and self._event_heap[0] <= event_time:
+            heapq.heappop(self._event_heap)
+
+        with self._condition:
+            if event_time > self._now.value:
+                self._now.value = event_time
+            self._condition.notify_all()
+        return True
+
+    @property
+    def quiescence_time(self) -> float:
+        return self._quiescence_time
+
+    @property
+    def poll_interval(self) -> float:
+        return self._poll_interval
+
+    @property
+    def pending_event_count(self) -> int:
+        return self._event_heap.__len__()
+
+    @property
+    def participant_count(self) -> int:
+        return self._participant_count.value
+
+
+# Active clock of simulation. None means real time.
+simulation_clock: Optional[SimulationClock] = None
+
+
+def set_simulation_clock(new_clock: Optional[SimulationClock]):
+    """
+    Sets active simulation clock.
+    Kernel calls this before miners start, None returns to real time.
+    """
+
+    global simulation_clock
+    simulation_clock = new_clock
+
+
+def is_virtual_time() -> bool:
+    """ Returns true if simulation runs on virtual time. """
+
+    return simulation_clock is not None
+
+
+def get_time() -> float:
+    """ Returns virtual time if enabled else real time. """
+
+    if simulation_clock is None:
+        return time.time()
+    return simulation_clock.time()
+
+
+def sleep(seconds: float):
+    """ Sleeps on virtual time if enabled else real time. """
+
+    if simulation_clock is None:
+        return time.sleep(seconds)
+    return simulation_clock.sleep(seconds)
+
+
+def queue_get(the_queue, timeout: Optional[float] = None):
+    """
+    Gets item from queue with timeout of active clock.
+
+    Raises:
+        Empty: If timeout is expired.
+    """
+
+    if simulation_clock is None:
+        return the_queue.get(timeout=timeout)
+    return simulation_clock.queue_get(the_queue, timeout=timeout)
+
+
+def add_participants(count: int = 1):
+    """ Adds participants to virtual clock, does nothing in real time. """
+
+    if simulation_clock is not None:
+        simulation_clock.add_participants(count)
+
+
+def enter_participant():
+    """ Marks calling thread as an added participant of virtual clock, does nothing in real time. """
+
+    if simulation_clock is not None:
+        simulation_clock.enter_participant()
+
+
+def leave_participant():
+    """ Removes participant of calling thread from virtual clock, does nothing in real time. """
+
+    if simulation_clock is not None:
+        simulation_clock.leave_participant()
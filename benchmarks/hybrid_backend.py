@@ -0,0 +1,77 @@
+# Copyright (c) 2021, COMU Team, Osman Ceylan and etc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 3. Neither the name of the COMU Team organization nor the
+#    names of its contributors may be used to endorse or promote products
+#    derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDER ''AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+Hybrid backend against state vector backends on a mostly clifford workload.
+
+Usage:
+    python benchmarks/hybrid_backend.py [frame count] [frame size] [non clifford period]
+"""
+
+import sys
+import time
+
+from QDNS.backend.cirq_backend import CirqBackend
+from QDNS.backend.hybrid_backend import HybridBackend
+from QDNS.backend.sdqs_backend import SdqsBackend
+from QDNS.backend.tools.config import BackendConfiguration, CIRQ_BACKEND, SDQS_BACKEND, HYBRID_BACKEND, avaible_backends
+from QDNS.backend.tools.noise import NoisePattern
+from QDNS.tools import gates
+
+
+def rate(name: str, count: int, method):
+    start_time = time.perf_counter()
+    method()
+    elapsed = time.perf_counter() - start_time
+    print("{:<40} {:>12.0f} frame/s".format(name, count / elapsed))
+
+
+def mixed_cycles(backend, count: int, size: int, period: int):
+    """ Allocate a ghz frame, rotate every period-th frame with a T gate, measure and free it. """
+
+    for i in range(count):
+        qubits = backend.generate_ghz_pair(size, 1)[0]
+        if i % period == 0:
+            backend.apply_transformation(gates.TGate.gate_id, (), [qubits[0]])
+        backend.measure_qubits(qubits)
+        backend.deallocate_qubits(qubits)
+
+
+if __name__ == "__main__":
+    frame_count = int(sys.argv[1]) if sys.argv.__len__() > 1 else 500
+    frame_size = int(sys.argv[2]) if sys.argv.__len__() > 2 else 2
+    non_clifford_period = int(sys.argv[3]) if sys.argv.__len__() > 3 else 50
+    noise_pattern = NoisePattern(0.01, 0.01, 0.01)
+
+    backends = [(SDQS_BACKEND, SdqsBackend, {2: {frame_size: 4}})]
+    if HYBRID_BACKEND in avaible_backends:
+        backends.append((HYBRID_BACKEND, HybridBackend, {2: 4 * frame_size}))
+    if CIRQ_BACKEND in avaible_backends:
+        backends.append((CIRQ_BACKEND, CirqBackend, {2: {frame_size: 4}}))
+
+    for flag, backend_type, frame_config in backends:
+        backend = backend_type(BackendConfiguration(flag, 1, frame_config), noise_pattern)
+        rate("{} mixed cycles".format(flag), frame_count, lambda: mixed_cycles(backend, frame_count, frame_size, non_clifford_period))
+        backend.terminate_backend()
@@ -0,0 +1,83 @@
+# Copyright (c) 2021, COMU Team, Osman Ceylan and etc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 3. Neither the name of the COMU Team organization nor the
+#    names of its contributors may be used to endorse or promote products
+#    derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDER ''AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+Sdqs backend against cirq backend on small chunks.
+
+Usage:
+    python benchmarks/sdqs_backend.py [frame count] [frame size]
+"""
+
+import sys
+import time
+
+from QDNS.backend.cirq_backend import CirqBackend
+from QDNS.backend.sdqs_backend import SdqsBackend
+from QDNS.backend.tools.config import BackendConfiguration, CIRQ_BACKEND, SDQS_BACKEND, avaible_backends
+from QDNS.backend.tools.noise import NoisePattern
+from QDNS.tools import gates
+
+
+def rate(name: str, count: int, method):
+    start_time = time.perf_counter()
+    method()
+    elapsed = time.perf_counter() - start_time
+    print("{:<40} {:>12.0f} frame/s".format(name, count / elapsed))
+
+
+def ghz_cycles(backend, count: int, size: int):
+    """ Allocate a ghz frame, measure and free it, like an entangle pair request. """
+
+    for _ in range(count):
+        qubits = backend.generate_ghz_pair(size, 1)[0]
+        backend.measure_qubits(qubits)
+        backend.deallocate_qubits(qubits)
+
+
+def rotations(backend, count: int, size: int):
+    """ Rotate each qubit of a frame, sample it non-destructively then free it. """
+
+    for _ in range(count):
+        qubits = backend.allocate_qframes(size, 1)[0]
+        for qubit in qubits:
+            backend.apply_transformation(gates.RYGate.gate_id, (0.3,), [qubit])
+        backend.measure_qubits(qubits, True)
+        backend.deallocate_qubits(qubits)
+
+
+if __name__ == "__main__":
+    frame_count = int(sys.argv[1]) if sys.argv.__len__() > 1 else 500
+    frame_size = int(sys.argv[2]) if sys.argv.__len__() > 2 else 2
+    noise_pattern = NoisePattern(0.01, 0.01, 0.01)
+
+    backends = [(SDQS_BACKEND, SdqsBackend)]
+    if CIRQ_BACKEND in avaible_backends:
+        backends.append((CIRQ_BACKEND, CirqBackend))
+
+    for flag, backend_type in backends:
+        backend = backend_type(BackendConfiguration(flag, 1, {2: {frame_size: 4}}), noise_pattern)
+        rate("{} ghz cycles".format(flag), frame_count, lambda: ghz_cycles(backend, frame_count, frame_size))
+        rate("{} rotations".format(flag), frame_count, lambda: rotations(backend, frame_count, frame_size))
+        backend.terminate_backend()
@@ -0,0 +1,112 @@
+# Copyright (c) 2021, COMU Team, Osman Ceylan and etc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 3. Neither the name of the COMU Team organization nor the
+#    names of its contributors may be used to endorse or promote products
+#    derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDER ''AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Repeated simulations against shots sampled from one recorded simulation on stim backend.
+
+Usage:
+    python benchmarks/shot_sampling.py [run count] [shot count] [pair count]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import QDNS
+
+pair_count = int(sys.argv[3]) if sys.argv.__len__() > 3 else 64
+
+
+class Alice(QDNS.Node):
+    def __init__(self):
+        super().__init__("Alice")
+        self.create_new_application(self.app)
+
+    @staticmethod
+    def app(app):
+        pairs = app.send_entangle_pairs(pair_count, "Bob")
+        app.put_simulation_result(app.measure_qubits(pairs))
+
+
+class Bob(QDNS.Node):
+    def __init__(self):
+        super().__init__("Bob")
+        self.create_new_application(self.app)
+
+    @staticmethod
+    def app(app):
+        qubits = app.wait_next_qubits(pair_count)
+        app.put_simulation_result(app.measure_qubits(qubits[0]))
+
+
+def new_network() -> QDNS.Network:
+    alice, bob = Alice(), Bob()
+    network = QDNS.Network(alice, bob)
+    network.add_channels(alice, bob, length=1)
+    return network
+
+
+def repeated_runs(simulator: QDNS.Simulator, run_count: int) -> float:
+    """ Mismatch rate of Alice and Bob over separate simulations. """
+
+    mismatches = 0
+    for _ in range(run_count):
+        results = simulator.simulate(new_network())
+        alice = np.array(results.user_dumpings("Alice", QDNS.DEFAULT_APPLICATION_NAME))
+        bob = np.array(results.user_dumpings("Bob", QDNS.DEFAULT_APPLICATION_NAME))
+        mismatches += np.count_nonzero(alice != bob)
+    return mismatches / (run_count * pair_count)
+
+
+def sampled_shots(simulator: QDNS.Simulator, shot_count: int) -> float:
+    """ Mismatch rate of Alice and Bob over shots of one recorded simulation. """
+
+    _, shots = simulator.sample_shots(new_network(), shot_count)
+    alice = shots.all_measurements("Alice", QDNS.DEFAULT_APPLICATION_NAME)
+    bob = shots.all_measurements("Bob", QDNS.DEFAULT_APPLICATION_NAME)
+    return np.count_nonzero(alice != bob) / alice.size
+
+
+def measure(name: str, run_count: int, method):
+    start_time = time.perf_counter()
+    mismatch = method()
+    elapsed = time.perf_counter() - start_time
+    print("{:<24} {:>8} runs {:>10.3f} s {:>12.1f} run/s  mismatch {:.4f}".format(
+        name, run_count, elapsed, run_count / elapsed, mismatch)
+    )
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if sys.argv.__len__() > 1 else 10
+    shot_count = int(sys.argv[2]) if sys.argv.__len__() > 2 else 100000
+
+    backend_conf = QDNS.BackendConfiguration(QDNS.STIM_BACKEND, 1, {2: 4 * pair_count})
+    simulator = QDNS.Simulator(QDNS.MinerControllerSettings(1, False, True))
+    with simulator:
+        simulator.start_session(backend_conf, QDNS.NoisePattern(0, 0.01, 0))
+        measure("Repeated simulations", runs, lambda: repeated_runs(simulator, runs))
+        measure("Sampled shots", shot_count, lambda: sampled_shots(simulator, shot_count))
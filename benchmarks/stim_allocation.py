@@ -0,0 +1,81 @@
+# Copyright (c) 2021, COMU Team, Osman Ceylan and etc.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 3. Neither the name of the COMU Team organization nor the
+#    names of its contributors may be used to endorse or promote products
+#    derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDER ''AS IS'' AND ANY
+# EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Allocation rate of stim backend.
+
+Usage:
+    python benchmarks/stim_allocation.py [initial capacity] [qubit count]
+"""
+
+import sys
+import time
+
+from QDNS.backend.stim_backend import StimBackend
+from QDNS.backend.tools.config import BackendConfiguration, STIM_BACKEND
+from QDNS.backend.tools.noise import NoisePattern
+
+
+def new_backend(initial_capacity: int) -> StimBackend:
+    return StimBackend(BackendConfiguration(STIM_BACKEND, 1, {2: initial_capacity}), NoisePattern(0, 0, 0))
+
+
+def rate(name: str, count: int, method):
+    start_time = time.perf_counter()
+    method()
+    elapsed = time.perf_counter() - start_time
+    print("{:<40} {:>12.0f} qubit/s".format(name, count / elapsed))
+
+
+def single_allocations(backend: StimBackend, count: int):
+    """ One allocation per qubit, like one AllocateQubitRequest per qubit. """
+
+    for _ in range(count):
+        backend.allocate_qubits(1)
+
+
+def bulk_allocation(backend: StimBackend, count: int):
+    """ One allocation for all qubits. """
+
+    backend.allocate_qubits(count)
+
+
+def churn(backend: StimBackend, count: int):
+    """ Allocate and free pairs on a half full memory. """
+
+    _ = backend.allocate_qubits(count // 2)
+    for _ in range(count // 2):
+        backend.deallocate_qubits(backend.allocate_qubits(2))
+
+
+if __name__ == "__main__":
+    capacity = int(sys.argv[1]) if sys.argv.__len__() > 1 else 50000
+    qubit_count = int(sys.argv[2]) if sys.argv.__len__() > 2 else 40000
+
+    rate("Single allocations", qubit_count, lambda: single_allocations(new_backend(capacity), qubit_count))
+    rate("Bulk allocation", qubit_count, lambda: bulk_allocation(new_backend(capacity), qubit_count))
+    rate("Allocate and free pairs", qubit_count, lambda: churn(new_backend(capacity), qubit_count))
+    rate("Single allocations, growing capacity", qubit_count, lambda: single_allocations(new_backend(1), qubit_count))